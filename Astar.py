@@ -1,4 +1,17 @@
+from array import array
+from collections import OrderedDict
+from multiprocessing import shared_memory
 import heapq
+import mmap
+import multiprocessing
+import os
+import struct
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it only speeds up BitGrid.pack
+    np = None
 
 def a_star_search(grid, start, goal):
     """
@@ -64,40 +77,1580 @@ def a_star_search(grid, start, goal):
 
     return None  # No path found
 
-# Example Grid:
-# 0 = free, 1 = obstacle
-grid = [
-    [0, 0, 0, 0, 0],
-    [0, 1, 0, 1, 0],
-    [0, 1, 0, 1, 0],
-    [0, 1, 0, 0, 0],
-    [0, 0, 0, 1, 0]
-]
-
-start_node = (0, 0)
-goal_node = (4, 4)
-
-path = a_star_search(grid, start_node, goal_node)
-
-if path:
-    print("Shortest path found:", path)
-else:
-    print("No path found.")
-
-# Visualizing the grid with the path
-if path:
-    path_set = set(path)
-    for r in range(len(grid)):
-        row_str = ""
-        for c in range(len(grid[0])):
-            if (r, c) == start_node:
-                row_str += "S "
-            elif (r, c) == goal_node:
-                row_str += "G "
-            elif (r, c) in path_set:
-                row_str += "* "
-            elif grid[r][c] == 1:
-                row_str += "# "
+
+class GridEngine:
+    """
+    A reusable, preprocessed form of a 0/1 grid for answering many A* queries on one map.
+
+    The grid is copied once into a flat bytearray with a one-cell obstacle border, so
+    every cell is a single int index and the four moves are fixed index offsets with no
+    bounds checks. The g-score and parent arrays are allocated once and invalidated
+    between queries by bumping a generation counter instead of being cleared, which
+    makes it several times cheaper than a_star_search when one map gets many queries.
+
+    Args:
+        grid (list of lists): A 2D grid where 0 represents a free cell and 1 represents an obstacle.
+    """
+
+    def __init__(self, grid):
+        rows = len(grid)
+        cols = len(grid[0])
+        width = cols + 2
+
+        # 1 = free, 0 = obstacle, with a border of obstacles around the real grid
+        free = bytearray(width * (rows + 2))
+        for r, grid_row in enumerate(grid):
+            base = (r + 1) * width + 1
+            free[base:base + cols] = bytes(1 if cell == 0 else 0 for cell in grid_row)
+        self._attach(free, rows, cols)
+
+    @classmethod
+    def from_occupancy(cls, free, rows, cols):
+        """
+        Wraps an existing occupancy buffer without copying it.
+
+        Args:
+            free (bytearray or memoryview): (rows + 2) * (cols + 2) bytes in row-major order,
+                                           1 for a free cell and 0 for an obstacle, with
+                                           the outer ring of cells set to 0.
+            rows (int): The number of rows of the real grid.
+            cols (int): The number of columns of the real grid.
+
+        Returns:
+            GridEngine: An engine reading (and, through set_cell, writing) that buffer.
+        """
+        if len(free) != (rows + 2) * (cols + 2):
+            raise ValueError(f"occupancy buffer has {len(free)} bytes, expected {(rows + 2) * (cols + 2)}")
+        engine = cls.__new__(cls)
+        engine._attach(free, rows, cols)
+        return engine
+
+    def _attach(self, free, rows, cols):
+        """Sets up the engine around a padded occupancy buffer."""
+        self.rows = rows
+        self.cols = cols
+        # Padded width/height: one extra cell on every side
+        self.width = cols + 2
+        self.size = self.width * (rows + 2)
+        self.free = free
+        # Bumped by every set_cell, so caches built from this grid can tell they are stale
+        self.version = 0
+
+        # g-scores are stored as generation * size + g, so a value below the current
+        # generation's base belongs to an earlier query and counts as "not visited".
+        # Both arrays are allocated by the first query, so planners that only need the
+        # occupancy (IncrementalPlanner, HierarchicalPlanner) do not pay for them.
+        self.scores = None
+        self.came_from = None
+        # Closed marks of iter_anytime: closed[i] == closed_stamp if i was expanded by the
+        # current search; every search takes a new stamp. Allocated by the first call.
+        self.closed = None
+        self.closed_stamp = 0
+        self.generation = 0
+        # Nodes expanded and open-set entries pushed by the most recent query, for benchmarking
+        self.expanded = 0
+        self.pushed = 0
+        # Jump Point Search tables, built on the first solve_jps call
+        self.jump_right = self.jump_left = self.segment = None
+
+    def index(self, node):
+        """Converts a (row, col) cell to its flat index, raising ValueError if it is off the grid."""
+        row, col = node
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise ValueError(f"cell {node} is outside the {self.rows}x{self.cols} grid")
+        return (row + 1) * self.width + col + 1
+
+    def cell(self, index):
+        """Converts a flat index back to its (row, col) cell."""
+        row, col = divmod(index, self.width)
+        return (row - 1, col - 1)
+
+    def is_free(self, node):
+        """Returns True if the (row, col) cell is inside the grid and not an obstacle."""
+        row, col = node
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.free[(row + 1) * self.width + col + 1] == 1
+
+    def set_cell(self, node, value):
+        """
+        Changes one cell of the grid.
+
+        Args:
+            node (tuple): The (row, col) cell to change.
+            value (int): 0 to make the cell free, 1 to make it an obstacle.
+
+        Returns:
+            bool: True if the cell actually changed.
+        """
+        index = self.index(node)
+        free = 1 if value == 0 else 0
+        if self.free[index] == free:
+            return False
+        self.free[index] = free
+        self.version += 1
+        # The JPS tables depend on the whole neighborhood; rebuild them on the next JPS query
+        self.jump_right = self.jump_left = self.segment = None
+        return True
+
+    def _next_generation(self):
+        """Starts a new query and returns its score base, invalidating every earlier g-score."""
+        if self.scores is None:
+            self.scores = array("q", [-1]) * self.size
+            self.came_from = array("q", [0]) * self.size
+        self.generation += 1
+        if (self.generation + 1) * self.size >= 1 << 62:
+            # Scores would overflow: clear them once and start counting again
+            self.scores = array("q", [-1]) * self.size
+            self.generation = 1
+        return self.generation * self.size
+
+    def _path(self, start_index, goal_index):
+        """Follows the parent array back from goal_index and returns the (row, col) path."""
+        came_from = self.came_from
+        path = []
+        current = goal_index
+        while current != start_index:
+            path.append(self.cell(current))
+            current = came_from[current]
+        path.append(self.cell(start_index))
+        return path[::-1]
+
+    def solve(self, start, goal):
+        """
+        Finds the shortest path from start to goal, with the same result as a_star_search.
+
+        Ties in the open set are broken exactly as a_star_search breaks them (by f, then g,
+        then row and column), so both return the same path, not just one of equal length.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+            goal (tuple): The coordinates of the goal cell (row, col).
+
+        Returns:
+            list or None: A list of coordinates representing the shortest path from start to goal,
+                         or None if no path is found.
+        """
+        start_index = self.index(start)
+        goal_index = self.index(goal)
+        base = self._next_generation()
+
+        free = self.free
+        scores = self.scores
+        came_from = self.came_from
+        width = self.width
+        size = self.size
+        size_squared = size * size
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        goal_row, goal_col = divmod(goal_index, width)
+        start_row, start_col = divmod(start_index, width)
+
+        # Each heap entry is one int ordered like the (f, g, node) tuple of a_star_search:
+        # key = (f * size + g) * size + index. Flat indices grow with (row, col), so the
+        # tie-breaking order is preserved.
+        scores[start_index] = base
+        open_set = [(abs(start_row - goal_row) + abs(start_col - goal_col)) * size_squared + start_index]
+
+        # Each move changes the Manhattan distance by exactly one, so a neighbor's f is
+        # either the current f (moving towards the goal) or the current f + 2.
+        away = 2 * size_squared
+        expanded = stale = 0
+
+        while open_set:
+            key = heappop(open_set)
+            current = key % size
+            current_g = (key // size) % size
+
+            if current == goal_index:
+                self.expanded = expanded
+                # Every entry pushed was popped (expanded, stale or the goal) or is still open
+                self.pushed = expanded + stale + 1 + len(open_set)
+                return self._path(start_index, goal_index)
+
+            if scores[current] != base + current_g:
+                stale += 1
+                continue  # Stale entry: a shorter path to this cell was already expanded
+            expanded += 1
+
+            tentative_g_score = current_g + 1
+            limit = base + tentative_g_score
+            key = (key // size_squared * size + tentative_g_score) * size
+            row, col = divmod(current, width)
+
+            # Up, down, left, right (same order as a_star_search), unrolled
+            neighbor = current - width
+            if free[neighbor] and not base <= scores[neighbor] <= limit:
+                scores[neighbor] = limit
+                came_from[neighbor] = current
+                heappush(open_set, key + neighbor if row > goal_row else key + away + neighbor)
+            neighbor = current + width
+            if free[neighbor] and not base <= scores[neighbor] <= limit:
+                scores[neighbor] = limit
+                came_from[neighbor] = current
+                heappush(open_set, key + neighbor if row < goal_row else key + away + neighbor)
+            neighbor = current - 1
+            if free[neighbor] and not base <= scores[neighbor] <= limit:
+                scores[neighbor] = limit
+                came_from[neighbor] = current
+                heappush(open_set, key + neighbor if col > goal_col else key + away + neighbor)
+            neighbor = current + 1
+            if free[neighbor] and not base <= scores[neighbor] <= limit:
+                scores[neighbor] = limit
+                came_from[neighbor] = current
+                heappush(open_set, key + neighbor if col < goal_col else key + away + neighbor)
+
+        self.expanded = expanded
+        self.pushed = expanded + stale
+        return None  # No path found
+
+    def build_jump_tables(self):
+        """
+        Precomputes the horizontal jumps used by solve_jps.
+
+        For every cell, jump_right[i] / jump_left[i] hold the first cell past i in that
+        direction with a forced neighbor (a side cell that is only reachable optimally
+        through it because the cell behind it is blocked), or -1 if a wall comes first.
+        segment[i] numbers the horizontal run of free cells containing i, so a goal in
+        the same run is visible without scanning. Called by the first JPS query if needed.
+        """
+        free = self.free
+        width = self.width
+        self.jump_right = array("q", [-1]) * self.size
+        self.jump_left = array("q", [-1]) * self.size
+        self.segment = array("q", [-1]) * self.size
+
+        segment = 0
+        for row in range(1, self.rows + 1):
+            first = row * width + 1
+            last = first + self.cols - 1
+            for table, direction, cells in ((self.jump_right, 1, range(last, first - 1, -1)),
+                                            (self.jump_left, -1, range(first, last + 1))):
+                next_jump = -1
+                for node in cells:
+                    if not free[node]:
+                        next_jump = -1
+                        continue
+                    table[node] = next_jump
+                    if (free[node - width] and not free[node - direction - width]) or (
+                            free[node + width] and not free[node - direction + width]):
+                        next_jump = node
+            for node in range(first, last + 1):
+                if free[node]:
+                    if not free[node - 1]:
+                        segment += 1
+                    self.segment[node] = segment
+
+    def _jump_horizontal(self, node, direction, goal_index):
+        """Returns the first jump point right (direction 1) or left (-1) of node, or -1."""
+        if not self.free[node]:
+            # Only a blocked start cell gets here; the tables skip blocked cells, so step once
+            node += direction
+            if not self.free[node]:
+                return -1
+            width = self.width
+            if node == goal_index or (self.free[node - width] and not self.free[node - direction - width]) or (
+                    self.free[node + width] and not self.free[node - direction + width]):
+                return node
+        jump_point = (self.jump_right if direction == 1 else self.jump_left)[node]
+        # The goal is a jump point too when it sits further along the same free run
+        if self.segment[goal_index] == self.segment[node] and (goal_index - node) * direction > 0:
+            if jump_point == -1 or (jump_point - goal_index) * direction > 0:
+                return goal_index
+        return jump_point
+
+    def _jump(self, current, direction, goal_index):
+        """
+        Walks from current in a straight line and returns the first jump point, or -1.
+
+        A jump point is the goal, a cell with a forced neighbor or, when moving
+        vertically, a cell from which a horizontal jump finds a jump point.
+        """
+        if direction == 1 or direction == -1:
+            return self._jump_horizontal(current, direction, goal_index)
+
+        free = self.free
+        jump_right = self.jump_right
+        jump_left = self.jump_left
+        segment = self.segment
+        goal_segment = segment[goal_index]
+        node = current + direction
+        while free[node]:
+            if node == goal_index:
+                return node
+            if (free[node - 1] and not free[node - direction - 1]) or (
+                    free[node + 1] and not free[node - direction + 1]):
+                return node
+            if jump_right[node] != -1 or jump_left[node] != -1 or segment[node] == goal_segment:
+                return node
+            node += direction
+        return -1
+
+    def solve_jps(self, start, goal):
+        """
+        Finds a shortest path from start to goal with Jump Point Search.
+
+        Every move costs 1, so many paths of equal cost exist between two cells. JPS only
+        puts jump points in the open set and skips the straight runs between them, which
+        makes it expand far fewer nodes than A* on open maps. The returned path has the
+        same length as the one from a_star_search, but may take a different route among
+        the equally short ones.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+            goal (tuple): The coordinates of the goal cell (row, col).
+
+        Returns:
+            list or None: A list of coordinates representing a shortest path from start to goal,
+                         or None if no path is found.
+        """
+        start_index = self.index(start)
+        goal_index = self.index(goal)
+        base = self._next_generation()
+        if self.segment is None:
+            self.build_jump_tables()
+
+        free = self.free
+        scores = self.scores
+        came_from = self.came_from
+        width = self.width
+        goal_row, goal_col = divmod(goal_index, width)
+
+        def heuristic(index):
+            row, col = divmod(index, width)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        scores[start_index] = base
+        came_from[start_index] = start_index
+        open_set = [(heuristic(start_index), 0, start_index)]
+        expanded = stale = 0
+
+        while open_set:
+            f_score, current_g_score, current = heapq.heappop(open_set)
+
+            if current == goal_index:
+                self.expanded = expanded
+                self.pushed = expanded + stale + 1 + len(open_set)
+                return self._jps_path(start_index, goal_index)
+
+            if scores[current] != base + current_g_score:
+                stale += 1
+                continue  # Stale entry
+            expanded += 1
+
+            # Prune the moves using the direction we arrived from
+            parent = came_from[current]
+            if parent == current:
+                directions = (-width, width, -1, 1)
+            elif parent // width == current // width:
+                step = 1 if current > parent else -1
+                directions = (-width, width, step)
+            else:
+                step = width if current > parent else -width
+                directions = (-1, 1, step)
+
+            for direction in directions:
+                if not free[current + direction]:
+                    continue
+                jump_point = self._jump(current, direction, goal_index)
+                if jump_point == -1:
+                    continue
+                # Jump points lie on a straight line from current, so the cost is the distance
+                distance = (jump_point - current) // direction
+                tentative_g_score = current_g_score + distance
+                if not base <= scores[jump_point] <= base + tentative_g_score:
+                    scores[jump_point] = base + tentative_g_score
+                    came_from[jump_point] = current
+                    heapq.heappush(open_set, (tentative_g_score + heuristic(jump_point), tentative_g_score, jump_point))
+
+        self.expanded = expanded
+        self.pushed = expanded + stale
+        return None  # No path found
+
+    def _jps_path(self, start_index, goal_index):
+        """Expands the chain of jump points ending at goal_index into a cell-by-cell path."""
+        came_from = self.came_from
+        width = self.width
+        path = [self.cell(goal_index)]
+        current = goal_index
+        while current != start_index:
+            parent = came_from[current]
+            if parent // width == current // width:
+                step = 1 if current > parent else -1
+            else:
+                step = width if current > parent else -width
+            while current != parent:
+                current -= step
+                path.append(self.cell(current))
+        return path[::-1]
+
+    # Heuristic weights are fixed point with this many steps per unit, so heap keys stay ints
+    WEIGHT_SCALE = 1000
+
+    def iter_anytime(self, start, goal, epsilon=3.0, decrement=0.5, time_limit=None, max_expansions=None):
+        """
+        Anytime Repairing A* (ARA*): yields shorter and shorter paths until a shortest one is proven.
+
+        The first search inflates the heuristic by epsilon, so it finds a path at most epsilon
+        times longer than the shortest while expanding far fewer nodes than solve. Every
+        following search lowers epsilon by decrement and keeps the g-scores and open set of
+        the previous one: only nodes that are still open, or whose g-score improved after
+        they were expanded, are searched again instead of starting over.
+
+        Each path comes with its proven bound: the path is at most bound times longer than
+        a shortest one. The bound is the smaller of epsilon and g(goal) / min(g + h) over the
+        nodes left to expand, so it is often tighter than epsilon. A bound of 1.0 means the
+        path is a shortest one and ends the iteration. The time and expansion budgets cover
+        all searches together; when one runs out the iteration simply ends, and the last
+        path yielded is the best one found. engine.expanded and engine.pushed hold the
+        totals over all searches.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+            goal (tuple): The coordinates of the goal cell (row, col).
+            epsilon (float): The heuristic inflation of the first search, at least 1.
+            decrement (float): How much epsilon drops between searches.
+            time_limit (float, optional): Stop after this many seconds.
+            max_expansions (int, optional): Stop after expanding this many nodes.
+
+        Yields:
+            tuple: (path, bound) whenever the path or its bound improves, path being a list
+                   of (row, col) coordinates. Nothing is yielded if no path exists or the
+                   budget runs out before the first search finishes.
+        """
+        if epsilon < 1:
+            raise ValueError(f"epsilon must be at least 1, got {epsilon}")
+        if decrement <= 0:
+            raise ValueError(f"decrement must be positive, got {decrement}")
+        start_index = self.index(start)
+        goal_index = self.index(goal)
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        base = self._next_generation()
+        if self.closed is None:
+            self.closed = array("q", [-1]) * self.size
+
+        free = self.free
+        scores = self.scores
+        came_from = self.came_from
+        closed = self.closed
+        width = self.width
+        size = self.size
+        size_squared = size * size
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        scale = self.WEIGHT_SCALE
+        weight = max(round(epsilon * scale), scale)
+        step = max(round(decrement * scale), 1)
+
+        goal_row, goal_col = divmod(goal_index, width)
+
+        def heuristic(index):
+            row, col = divmod(index, width)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        # Each heap entry is one int: key = (f * size + size - 1 - g) * size + index with
+        # f = g * scale + weight * h, so among equal f the deeper node is expanded first.
+        top = size - 1
+        scores[start_index] = base
+        open_set = []
+        # Nodes whose g-score improved after this search expanded them (seeded with the start)
+        inconsistent = [start_index]
+        expanded = pushed = 0
+        best = None
+
+        while True:
+            # Re-key the open and inconsistent nodes with the current weight
+            self.closed_stamp += 1
+            stamp = self.closed_stamp
+            nodes = {key % size for key in open_set if scores[key % size] == base + top - key // size % size}
+            nodes.update(inconsistent)
+            inconsistent = []
+            open_set = []
+            for node in nodes:
+                g = scores[node] - base
+                open_set.append(((g * scale + weight * heuristic(node)) * size + top - g) * size + node)
+            heapq.heapify(open_set)
+            pushed += len(open_set)
+
+            while open_set:
+                key = open_set[0]
+                # The goal's f is g(goal) * scale; stop once no open node can beat it
+                if scores[goal_index] >= base and key // size_squared >= (scores[goal_index] - base) * scale:
+                    break
+                heappop(open_set)
+                current = key % size
+                current_g = top - key // size % size
+                if scores[current] != base + current_g:
+                    continue  # Stale entry: a shorter path to this cell was found since
+                expanded += 1
+                if max_expansions is not None and expanded > max_expansions or \
+                        deadline is not None and expanded % 256 == 0 and time.perf_counter() > deadline:
+                    self.expanded = expanded - 1
+                    self.pushed = pushed
+                    return
+                closed[current] = stamp
+
+                current_h = (key // size_squared - current_g * scale) // weight
+                tentative_g_score = current_g + 1
+                limit = base + tentative_g_score
+                row, col = divmod(current, width)
+                # f of a neighbor one step closer to / further from the goal
+                towards = ((tentative_g_score * scale + weight * (current_h - 1)) * size + top - tentative_g_score) * size
+                away = towards + 2 * weight * size_squared
+
+                for neighbor, closer in ((current - width, row > goal_row), (current + width, row < goal_row),
+                                         (current - 1, col > goal_col), (current + 1, col < goal_col)):
+                    if free[neighbor] and not base <= scores[neighbor] <= limit:
+                        scores[neighbor] = limit
+                        came_from[neighbor] = current
+                        if closed[neighbor] == stamp:
+                            inconsistent.append(neighbor)
+                        else:
+                            pushed += 1
+                            heappush(open_set, towards + neighbor if closer else away + neighbor)
+
+            self.expanded = expanded
+            self.pushed = pushed
+            if scores[goal_index] < base:
+                return  # No path found
+
+            # min(g + h) over the nodes left to expand is a lower bound on the shortest path
+            goal_g = scores[goal_index] - base
+            lower = goal_g
+            for key in open_set:
+                node = key % size
+                g = top - key // size % size
+                if scores[node] == base + g:
+                    lower = min(lower, g + heuristic(node))
+            for node in inconsistent:
+                lower = min(lower, scores[node] - base + heuristic(node))
+            bound = min(weight / scale, goal_g / lower) if lower else 1.0
+
+            if best is None or goal_g < best[0] or bound < best[1]:
+                best = (goal_g, bound)
+                yield self._path(start_index, goal_index), bound
+            if bound <= 1.0 or deadline is not None and time.perf_counter() > deadline:
+                return
+            # Never search again with a weight above the bound already proven
+            weight = max(min(weight - step, int(bound * scale)), scale)
+
+    def solve_anytime(self, start, goal, epsilon=3.0, decrement=0.5, time_limit=None, max_expansions=None):
+        """
+        Returns the best path iter_anytime finds within the budget, with its proven bound.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+            goal (tuple): The coordinates of the goal cell (row, col).
+            epsilon (float): The heuristic inflation of the first search, at least 1.
+            decrement (float): How much epsilon drops between searches.
+            time_limit (float, optional): Stop after this many seconds.
+            max_expansions (int, optional): Stop after expanding this many nodes.
+
+        Returns:
+            tuple: (path, bound), where the path is at most bound times longer than a shortest
+                   one, or (None, None) if no path exists or the budget ran out first.
+        """
+        path, bound = None, None
+        for path, bound in self.iter_anytime(start, goal, epsilon, decrement, time_limit, max_expansions):
+            pass
+        return path, bound
+
+class IncrementalPlanner:
+    """
+    Keeps a shortest path from start to goal up to date while grid cells change (D* Lite).
+
+    The search runs backwards from the goal and keeps its g/rhs values between calls, so
+    after a batch of cell updates only the nodes whose distance to the goal actually
+    changed are expanded again. The start may also move along the path between calls,
+    as it does for an agent following it.
+
+    Args:
+        grid (list of lists): A 2D grid where 0 represents a free cell and 1 represents an obstacle.
+        start (tuple): The coordinates of the starting cell (row, col).
+        goal (tuple): The coordinates of the goal cell (row, col).
+    """
+
+    def __init__(self, grid, start, goal):
+        self.engine = GridEngine(grid)
+        engine = self.engine
+        self.width = engine.width
+        self.start = engine.index(start)
+        self.goal = engine.index(goal)
+        # The last start the keys were computed against, and the key modifier (km) that
+        # keeps old queue entries valid after the start moves
+        self.last_start = self.start
+        self.key_modifier = 0
+
+        # Padding cells are never vertices of the graph
+        self.inside = bytearray(engine.size)
+        for row in range(1, engine.rows + 1):
+            base = row * self.width + 1
+            self.inside[base:base + engine.cols] = b"\x01" * engine.cols
+
+        self.infinity = engine.size + 1  # Longer than any path
+        self.g_score = array("q", [self.infinity]) * engine.size
+        self.rhs = array("q", [self.infinity]) * engine.size
+        self.rhs[self.goal] = 0
+
+        # Lazy-deletion priority queue: queued[node] holds the node's live key, and heap
+        # entries whose key no longer matches are skipped when popped
+        self.queued = {self.goal: self._key(self.goal)}
+        self.open_set = [(self.queued[self.goal], self.goal)]
+
+        # Number of nodes expanded by the most recent plan() call, for benchmarking
+        self.expanded = 0
+
+    def _key(self, node):
+        """Returns the priority of node: (min(g, rhs) + h + km, min(g, rhs)), h measured from the start."""
+        best = min(self.g_score[node], self.rhs[node])
+        row, col = divmod(node, self.width)
+        start_row, start_col = divmod(self.start, self.width)
+        return (best + abs(row - start_row) + abs(col - start_col) + self.key_modifier, best)
+
+    def _neighbors(self, node):
+        """Returns the in-grid neighbors of node (up, down, left, right)."""
+        inside = self.inside
+        width = self.width
+        return [neighbor for neighbor in (node - width, node + width, node - 1, node + 1) if inside[neighbor]]
+
+    def _update_vertex(self, node):
+        """Recomputes rhs for node and puts it in (or takes it out of) the queue."""
+        if node != self.goal:
+            # Moving into a cell costs 1 if it is free, as in a_star_search
+            free = self.engine.free
+            g_score = self.g_score
+            best = self.infinity
+            for neighbor in self._neighbors(node):
+                if free[neighbor] and g_score[neighbor] + 1 < best:
+                    best = g_score[neighbor] + 1
+            self.rhs[node] = best
+        if self.g_score[node] != self.rhs[node]:
+            key = self._key(node)
+            self.queued[node] = key
+            heapq.heappush(self.open_set, (key, node))
+        else:
+            self.queued.pop(node, None)
+
+    def _top(self):
+        """Drops stale heap entries and returns the smallest live (key, node), or None."""
+        open_set = self.open_set
+        while open_set:
+            key, node = open_set[0]
+            if self.queued.get(node) == key:
+                return open_set[0]
+            heapq.heappop(open_set)
+        return None
+
+    def _compute_shortest_path(self):
+        """Expands inconsistent nodes until the start's distance to the goal is settled."""
+        g_score = self.g_score
+        rhs = self.rhs
+        free = self.engine.free
+        expanded = 0
+
+        while True:
+            top = self._top()
+            if top is None:
+                break
+            if top[0] >= self._key(self.start) and rhs[self.start] == g_score[self.start]:
+                break
+            old_key, node = heapq.heappop(self.open_set)
+            new_key = self._key(node)
+            if old_key < new_key:
+                # Key is out of date because the start moved: requeue with the new key
+                self.queued[node] = new_key
+                heapq.heappush(self.open_set, (new_key, node))
+                continue
+
+            del self.queued[node]
+            expanded += 1
+            if g_score[node] > rhs[node]:
+                g_score[node] = rhs[node]
+            else:
+                g_score[node] = self.infinity
+                self._update_vertex(node)
+            if free[node]:
+                # Only a free node can be moved into, so only then do neighbors depend on it
+                for neighbor in self._neighbors(node):
+                    self._update_vertex(neighbor)
+
+        self.expanded = expanded
+
+    def plan(self):
+        """
+        Repairs the search and returns the current shortest path.
+
+        Returns:
+            list or None: A list of coordinates representing a shortest path from start to goal,
+                         or None if no path is found.
+        """
+        self._compute_shortest_path()
+        if self.g_score[self.start] >= self.infinity:
+            return None
+
+        # Walk downhill on g: each step moves to the free neighbor closest to the goal
+        engine = self.engine
+        free = engine.free
+        g_score = self.g_score
+        path = [engine.cell(self.start)]
+        node = self.start
+        while node != self.goal:
+            node = min((neighbor for neighbor in self._neighbors(node) if free[neighbor]),
+                       key=lambda neighbor: g_score[neighbor])
+            path.append(engine.cell(node))
+        return path
+
+    def update_cells(self, changes):
+        """
+        Applies a batch of cell changes; the next plan() call repairs the path.
+
+        Args:
+            changes (iterable): (node, value) pairs, where node is a (row, col) cell and
+                                value is 0 for free or 1 for obstacle.
+        """
+        engine = self.engine
+        for node, value in changes:
+            if engine.set_cell(node, value):
+                # Moving into the cell got cheaper or more expensive for every neighbor
+                for neighbor in self._neighbors(engine.index(node)):
+                    self._update_vertex(neighbor)
+
+    def move_start(self, start):
+        """
+        Moves the start, e.g. after the agent took some steps along the path.
+
+        Args:
+            start (tuple): The new starting cell (row, col).
+        """
+        self.start = self.engine.index(start)
+        start_row, start_col = divmod(self.start, self.width)
+        last_row, last_col = divmod(self.last_start, self.width)
+        self.key_modifier += abs(start_row - last_row) + abs(start_col - last_col)
+        self.last_start = self.start
+
+
+class HierarchicalPlanner:
+    """
+    Hierarchical pathfinding (HPA*) for very large grids.
+
+    The grid is split into square clusters. Where two neighboring clusters share a run of
+    free border cells, one or two entrances are placed, and inside each cluster the
+    entrance-to-entrance distances are found with a BFS limited to the cluster. A query
+    searches this small abstract graph first and then refines the abstract path back to
+    cells one cluster at a time.
+
+    Clusters and borders are built the first time a search reaches them and then cached,
+    so only the part of the map that queries actually touch is ever preprocessed. When a
+    cell changes, only its cluster (and the neighbor across a border it lies on) is
+    rebuilt. Paths are near-optimal: within a few percent of a_star_search on most maps,
+    but not guaranteed shortest.
+
+    Args:
+        grid (list of lists or GridEngine): A 2D grid where 0 represents a free cell and 1
+                                            represents an obstacle, or a GridEngine over one.
+        cluster_size (int): The side length of a cluster, in cells.
+    """
+
+    def __init__(self, grid, cluster_size=32):
+        self.engine = grid if isinstance(grid, GridEngine) else GridEngine(grid)
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.engine.rows // cluster_size)
+        self.cluster_cols = -(-self.engine.cols // cluster_size)
+
+        # border key -> list of (cell, cell across the border) entrance pairs
+        self.border_links = {}
+        # entrance cell -> set of entrance cells across a border (inter-cluster edges, cost 1)
+        self.partners = {}
+        # cluster -> {entrance cell: {entrance cell: distance}} (intra-cluster edges)
+        self.cluster_edges = {}
+
+        # Number of abstract nodes expanded by the most recent query, for benchmarking
+        self.expanded = 0
+
+    def cluster_of(self, index):
+        """Returns the (cluster row, cluster col) containing a flat cell index."""
+        row, col = divmod(index, self.engine.width)
+        return ((row - 1) // self.cluster_size, (col - 1) // self.cluster_size)
+
+    def _bounds(self, cluster):
+        """Returns the padded (first row, end row, first col, end col) of a cluster."""
+        size = self.cluster_size
+        cluster_row, cluster_col = cluster
+        first_row = cluster_row * size + 1
+        first_col = cluster_col * size + 1
+        return (first_row, min(first_row + size, self.engine.rows + 1),
+                first_col, min(first_col + size, self.engine.cols + 1))
+
+    def _borders(self, cluster):
+        """Returns the keys of the (up to four) borders of a cluster."""
+        cluster_row, cluster_col = cluster
+        borders = []
+        if cluster_col > 0:
+            borders.append(("vertical", cluster_row, cluster_col - 1))
+        if cluster_col < self.cluster_cols - 1:
+            borders.append(("vertical", cluster_row, cluster_col))
+        if cluster_row > 0:
+            borders.append(("horizontal", cluster_row - 1, cluster_col))
+        if cluster_row < self.cluster_rows - 1:
+            borders.append(("horizontal", cluster_row, cluster_col))
+        return borders
+
+    def _border(self, key):
+        """
+        Returns the entrance pairs on a border, computing them on first use.
+
+        A "vertical" border separates cluster (r, c) from (r, c + 1); a "horizontal" one
+        separates (r, c) from (r + 1, c). Each maximal run of cells that are free on both
+        sides gets one entrance in its middle, or one at each end if it is long.
+        """
+        if key in self.border_links:
+            return self.border_links[key]
+
+        kind, cluster_row, cluster_col = key
+        free = self.engine.free
+        width = self.engine.width
+        first_row, end_row, first_col, end_col = self._bounds((cluster_row, cluster_col))
+        if kind == "vertical":
+            # Walk down the cluster's last column; the partner is one to the right
+            cells = [row * width + end_col - 1 for row in range(first_row, end_row)]
+            across = 1
+        else:
+            # Walk along the cluster's last row; the partner is one below
+            cells = [(end_row - 1) * width + col for col in range(first_col, end_col)]
+            across = width
+
+        links = []
+        run = []
+        for cell in cells + [None]:
+            if cell is not None and free[cell] and free[cell + across]:
+                run.append(cell)
+                continue
+            if run:
+                if len(run) < 6:
+                    entrances = [run[len(run) // 2]]
+                else:
+                    entrances = [run[0], run[-1]]
+                links.extend((entrance, entrance + across) for entrance in entrances)
+                run = []
+
+        for cell, partner in links:
+            self.partners.setdefault(cell, set()).add(partner)
+            self.partners.setdefault(partner, set()).add(cell)
+        self.border_links[key] = links
+        return links
+
+    def _cluster_bfs(self, source, cluster, stop=None):
+        """
+        Breadth-first search from source that never leaves the cluster.
+
+        Returns (distance, parent) dicts. The search ends early once stop is reached.
+        """
+        free = self.engine.free
+        width = self.engine.width
+        first_row, end_row, first_col, end_col = self._bounds(cluster)
+        low, high = first_row * width, end_row * width
+
+        distance = {source: 0}
+        parent = {}
+        frontier = [source]
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                if node == stop:
+                    return distance, parent
+                step = distance[node] + 1
+                for neighbor in (node - width, node + width, node - 1, node + 1):
+                    if (free[neighbor] and neighbor not in distance and low <= neighbor < high
+                            and first_col <= neighbor % width < end_col):
+                        distance[neighbor] = step
+                        parent[neighbor] = node
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distance, parent
+
+    def _entrances(self, cluster):
+        """Returns the entrance cells lying inside a cluster."""
+        first_row, end_row, first_col, end_col = self._bounds(cluster)
+        width = self.engine.width
+        entrances = set()
+        for key in self._borders(cluster):
+            for pair in self._border(key):
+                for cell in pair:
+                    if first_row <= cell // width < end_row and first_col <= cell % width < end_col:
+                        entrances.add(cell)
+        return entrances
+
+    def _cluster(self, cluster):
+        """Returns the intra-cluster edges of a cluster, building them on first use."""
+        edges = self.cluster_edges.get(cluster)
+        if edges is None:
+            entrances = self._entrances(cluster)
+            edges = {}
+            for entrance in entrances:
+                distance, _ = self._cluster_bfs(entrance, cluster)
+                edges[entrance] = {other: distance[other] for other in entrances
+                                   if other != entrance and other in distance}
+            self.cluster_edges[cluster] = edges
+        return edges
+
+    def build_all(self):
+        """Builds every cluster up front instead of on first use."""
+        for cluster_row in range(self.cluster_rows):
+            for cluster_col in range(self.cluster_cols):
+                self._cluster((cluster_row, cluster_col))
+
+    def set_cell(self, node, value):
+        """
+        Changes one cell of the grid and drops the cached clusters it affects.
+
+        Args:
+            node (tuple): The (row, col) cell to change.
+            value (int): 0 to make the cell free, 1 to make it an obstacle.
+        """
+        if not self.engine.set_cell(node, value):
+            return
+        cluster = self.cluster_of(self.engine.index(node))
+        stale_clusters = {cluster}
+        row, col = node
+        size = self.cluster_size
+        for key in self._borders(cluster):
+            kind, cluster_row, cluster_col = key
+            # The cell only matters to a border it lies on
+            if kind == "vertical" and col not in ((cluster_col + 1) * size - 1, (cluster_col + 1) * size):
+                continue
+            if kind == "horizontal" and row not in ((cluster_row + 1) * size - 1, (cluster_row + 1) * size):
+                continue
+            for cell, partner in self.border_links.pop(key, []):
+                self.partners[cell].discard(partner)
+                self.partners[partner].discard(cell)
+            if kind == "vertical":
+                stale_clusters.update({(cluster_row, cluster_col), (cluster_row, cluster_col + 1)})
+            else:
+                stale_clusters.update({(cluster_row, cluster_col), (cluster_row + 1, cluster_col)})
+        for stale in stale_clusters:
+            self.cluster_edges.pop(stale, None)
+
+    def update_cells(self, changes):
+        """
+        Applies a batch of cell changes.
+
+        Args:
+            changes (iterable): (node, value) pairs, where node is a (row, col) cell and
+                                value is 0 for free or 1 for obstacle.
+        """
+        for node, value in changes:
+            self.set_cell(node, value)
+
+    def _abstract_path(self, start_index, goal_index):
+        """
+        A* over the entrance graph, with start and goal linked into their clusters.
+
+        Returns (abstract path, start_via), where start_via maps each node linked to the
+        start to the cell the start leaves through, or (None, None) if there is no path.
+        """
+        engine = self.engine
+        width = engine.width
+        goal_row, goal_col = divmod(goal_index, width)
+
+        def heuristic(node):
+            row, col = divmod(node, width)
+            return abs(row - goal_row) + abs(col - goal_col)
+
+        goal_cluster = self.cluster_of(goal_index)
+
+        # Temporary edges: start to the entrances of its cluster, and the entrances of the
+        # goal's cluster to the goal (plus start straight to goal when they share a cluster).
+        # A blocked start (allowed, as in a_star_search) can only step to a free neighbor,
+        # which may sit in another cluster, so its edges leave from those neighbors instead.
+        if engine.free[start_index]:
+            sources = [(start_index, 0)]
+        else:
+            sources = [(neighbor, 1) for neighbor in (start_index - width, start_index + width,
+                                                      start_index - 1, start_index + 1)
+                       if engine.free[neighbor]]
+        start_edges = {}
+        start_via = {}
+        for source, offset in sources:
+            source_cluster = self.cluster_of(source)
+            distance, _ = self._cluster_bfs(source, source_cluster)
+            targets = self._entrances(source_cluster) | {goal_index}
+            for node in targets:
+                if node in distance and (node not in start_edges or offset + distance[node] < start_edges[node]):
+                    start_edges[node] = offset + distance[node]
+                    start_via[node] = source
+        goal_distance, _ = self._cluster_bfs(goal_index, goal_cluster)
+        goal_edges = {node: goal_distance[node] for node in self._entrances(goal_cluster)
+                      if node in goal_distance}
+
+        open_set = [(heuristic(start_index), 0, start_index)]
+        g_score = {start_index: 0}
+        came_from = {}
+        expanded = 0
+
+        while open_set:
+            f_score, current_g_score, current = heapq.heappop(open_set)
+            if current == goal_index:
+                self.expanded = expanded
+                path = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    path.append(current)
+                return path[::-1], start_via
+            if current_g_score > g_score[current]:
+                continue  # Stale entry
+            expanded += 1
+
+            if current == start_index:
+                successors = list(start_edges.items())
+                if engine.free[start_index]:
+                    # The start may itself be an entrance with a partner across a border
+                    successors.extend((partner, 1) for partner in self.partners.get(start_index, ()))
             else:
-                row_str += ". "
-        print(row_str)
\ No newline at end of file
+                successors = list(self._cluster(self.cluster_of(current)).get(current, {}).items())
+                successors.extend((partner, 1) for partner in self.partners.get(current, ()))
+                if current in goal_edges:
+                    successors.append((goal_index, goal_edges[current]))
+            for neighbor, cost in successors:
+                tentative_g_score = current_g_score + cost
+                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g_score
+                    came_from[neighbor] = current
+                    heapq.heappush(open_set, (tentative_g_score + heuristic(neighbor), tentative_g_score, neighbor))
+
+        self.expanded = expanded
+        return None, None
+
+    def solve(self, start, goal, max_steps=None):
+        """
+        Finds a near-shortest path from start to goal.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+            goal (tuple): The coordinates of the goal cell (row, col).
+            max_steps (int, optional): Only refine the first max_steps moves and return
+                                       that prefix of the path, for low first-move latency.
+
+        Returns:
+            list or None: A list of coordinates from start towards goal (the whole path, or
+                         its first max_steps moves), or None if no path is found.
+        """
+        engine = self.engine
+        start_index = engine.index(start)
+        goal_index = engine.index(goal)
+        if start_index == goal_index:
+            return [start]
+        if not engine.free[goal_index]:
+            return None
+
+        abstract_path, start_via = self._abstract_path(start_index, goal_index)
+        if abstract_path is None:
+            return None
+
+        path = [start_index]
+        for current, following in zip(abstract_path, abstract_path[1:]):
+            if max_steps is not None and len(path) > max_steps:
+                break
+            if current == start_index and start_via.get(following, start_index) != start_index:
+                current = start_via[following]
+                path.append(current)  # Step off a blocked start
+            cluster = self.cluster_of(current)
+            if cluster != self.cluster_of(following):
+                path.append(following)  # Step across a border
+                continue
+            _, parent = self._cluster_bfs(current, cluster, stop=following)
+            segment = []
+            node = following
+            while node != current:
+                segment.append(node)
+                node = parent[node]
+            path.extend(reversed(segment))
+
+        if max_steps is not None:
+            path = path[:max_steps + 1]
+        return [engine.cell(index) for index in path]
+
+
+class DistanceField:
+    """
+    Distances from every cell to the nearest of one or more goal cells.
+
+    Built by a breadth-first search outward from the goals (every move costs 1, so BFS
+    is Dijkstra here). Alongside each cell's distance it stores the next cell to step
+    to, so any start's path is read off in O(path length) without searching.
+
+    Args:
+        engine (GridEngine): The grid to compute the field on.
+        goals (iterable): The goal cells (row, col).
+    """
+
+    def __init__(self, engine, goals):
+        self.engine = engine
+        self.version = engine.version
+        self.goals = frozenset(goals)
+        self.distances = array("i", [-1]) * engine.size
+        self.next_step = array("i", [-1]) * engine.size
+
+        free = engine.free
+        width = engine.width
+        distances = self.distances
+        next_step = self.next_step
+        # A goal can only be entered if it is free, as in a_star_search; a blocked goal is
+        # still reached from itself (distance 0) but from nowhere else
+        frontier = []
+        for goal in self.goals:
+            index = engine.index(goal)
+            distances[index] = 0
+            if free[index]:
+                frontier.append(index)
+
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbor in (node - width, node + width, node - 1, node + 1):
+                    if distances[neighbor] == -1:
+                        # Any cell may step into node, even a blocked one (it can only be
+                        # a start), but only free cells are expanded further
+                        distances[neighbor] = distance
+                        next_step[neighbor] = node
+                        if free[neighbor]:
+                            next_frontier.append(neighbor)
+            frontier = next_frontier
+
+    @property
+    def nbytes(self):
+        """The memory used by the field's arrays."""
+        return (len(self.distances) * self.distances.itemsize
+                + len(self.next_step) * self.next_step.itemsize)
+
+    def distance(self, start):
+        """Returns the number of moves from start to the nearest goal, or None if unreachable."""
+        distance = self.distances[self.engine.index(start)]
+        return None if distance == -1 else distance
+
+    def path(self, start):
+        """
+        Follows the next-step field from start to the nearest goal.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+
+        Returns:
+            list or None: A list of coordinates representing a shortest path from start to the
+                         nearest goal, or None if no goal is reachable.
+        """
+        engine = self.engine
+        node = engine.index(start)
+        if self.distances[node] == -1:
+            return None
+        next_step = self.next_step
+        path = [start]
+        while self.distances[node] != 0:
+            node = next_step[node]
+            path.append(engine.cell(node))
+        return path
+
+
+class DistanceFieldCache:
+    """
+    An LRU cache of DistanceFields for agents heading to shared goals.
+
+    The first query towards a goal (or set of goals) builds its field; every later query
+    towards the same goals is answered from the field in O(path length). Least recently
+    used fields are dropped to stay within the memory budget, and all fields are dropped
+    as soon as the grid changes.
+
+    Args:
+        grid (list of lists or GridEngine): A 2D grid where 0 represents a free cell and 1
+                                            represents an obstacle, or a GridEngine over one.
+        max_bytes (int): The memory budget for all cached fields together.
+    """
+
+    def __init__(self, grid, max_bytes=256 * 1024 * 1024):
+        self.engine = grid if isinstance(grid, GridEngine) else GridEngine(grid)
+        self.max_bytes = max_bytes
+        self.fields = OrderedDict()  # frozenset of goals -> DistanceField, oldest first
+        self.nbytes = 0
+        self.version = self.engine.version
+
+    def clear(self):
+        """Drops every cached field."""
+        self.fields.clear()
+        self.nbytes = 0
+
+    def field(self, goals):
+        """
+        Returns the distance field towards the nearest of goals, building it if needed.
+
+        Args:
+            goals (tuple or iterable): One goal cell (row, col), or several goal cells.
+
+        Returns:
+            DistanceField: The field for these goals.
+        """
+        if self.engine.version != self.version:
+            self.clear()
+            self.version = self.engine.version
+
+        key = frozenset([goals] if isinstance(goals, tuple) and goals and isinstance(goals[0], int) else goals)
+        field = self.fields.get(key)
+        if field is not None:
+            self.fields.move_to_end(key)
+            return field
+
+        field = DistanceField(self.engine, key)
+        self.fields[key] = field
+        self.nbytes += field.nbytes
+        # Evict least recently used fields, but always keep the one just built
+        while self.nbytes > self.max_bytes and len(self.fields) > 1:
+            _, evicted = self.fields.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+        return field
+
+    def path(self, start, goals):
+        """
+        Returns a shortest path from start to the nearest of goals.
+
+        Args:
+            start (tuple): The coordinates of the starting cell (row, col).
+            goals (tuple or iterable): One goal cell (row, col), or several goal cells.
+
+        Returns:
+            list or None: A list of coordinates representing a shortest path from start to the
+                         nearest goal, or None if no goal is reachable.
+        """
+        return self.field(goals).path(start)
+
+    def set_cell(self, node, value):
+        """Changes one cell of the grid; cached fields are dropped on the next query."""
+        self.engine.set_cell(node, value)
+
+    def update_cells(self, changes):
+        """Applies a batch of (node, value) cell changes."""
+        for node, value in changes:
+            self.engine.set_cell(node, value)
+
+
+class BitGrid:
+    """
+    A bit-packed occupancy buffer that GridEngine can use in place of its bytearray.
+
+    Cell i of the padded grid is bit (i % 8) of byte i // 8, 1 for free and 0 for an
+    obstacle, so a map takes one bit per cell instead of one byte. Every lookup costs a
+    Python method call, so searches run a few times slower than on bytes; this is meant
+    for maps too large to hold otherwise, typically with HierarchicalPlanner.
+
+    Args:
+        data (bytearray or memoryview): The packed bits, at least ceil(size / 8) bytes.
+        size (int): The number of cells (bits) in the buffer.
+    """
+
+    def __init__(self, data, size):
+        if len(data) * 8 < size:
+            raise ValueError(f"bit buffer has {len(data)} bytes, expected {-(-size // 8)}")
+        self.data = data
+        self.size = size
+
+    @classmethod
+    def pack(cls, free):
+        """Packs a byte-per-cell occupancy buffer (such as GridEngine.free) into a BitGrid."""
+        size = len(free)
+        if np is not None:
+            return cls(bytearray(np.packbits(np.frombuffer(free, dtype=np.uint8), bitorder="little")), size)
+        padded = bytes(free) + bytes(-size % 8)
+        packed = bytearray(len(padded) // 8)
+        # For eight 0/1 bytes read as a little-endian word, this multiply moves byte k's
+        # bit to bit 56 + k without any carries, packing the eight cells in one step
+        for i in range(len(packed)):
+            word = int.from_bytes(padded[8 * i:8 * i + 8], "little")
+            packed[i] = (word * 0x102040810204080 >> 56) & 0xFF
+        return cls(packed, size)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return (self.data[index >> 3] >> (index & 7)) & 1
+
+    def __setitem__(self, index, value):
+        if value:
+            self.data[index >> 3] |= 1 << (index & 7)
+        else:
+            self.data[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
+# Header of a saved occupancy file: magic, format (0 = bytes, 1 = bits), rows, cols
+_OCCUPANCY_HEADER = struct.Struct("<4sB3xII")
+_OCCUPANCY_MAGIC = b"GRID"
+
+
+def save_occupancy(engine, path, packed=False):
+    """
+    Writes a GridEngine's occupancy to a file that load_occupancy can memory-map.
+
+    The file holds a 16-byte header followed by the padded occupancy exactly as the
+    engine stores it, one byte per cell or (packed=True) one bit per cell.
+
+    Args:
+        engine (GridEngine): The grid to save.
+        path (str): The file to write.
+        packed (bool): Store one bit per cell instead of one byte.
+    """
+    free = engine.free
+    if packed:
+        body = (free if isinstance(free, BitGrid) else BitGrid.pack(free)).data
+    elif isinstance(free, BitGrid):
+        body = bytes(free[i] for i in range(engine.size))
+    else:
+        body = free
+    with open(path, "wb") as handle:
+        handle.write(_OCCUPANCY_HEADER.pack(_OCCUPANCY_MAGIC, 1 if packed else 0, engine.rows, engine.cols))
+        handle.write(body)
+
+
+def load_occupancy(path, writable=False):
+    """
+    Memory-maps an occupancy file written by save_occupancy.
+
+    Nothing is read up front: the engine indexes straight into the mapping, so opening
+    takes milliseconds and the operating system pages cells in as searches touch them.
+
+    Args:
+        path (str): The file to map.
+        writable (bool): Allow set_cell. Changes stay in memory (copy-on-write) and are
+                         never written back to the file.
+
+    Returns:
+        GridEngine: An engine whose free buffer is a view of the mapped file.
+    """
+    with open(path, "rb") as handle:
+        mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_COPY if writable else mmap.ACCESS_READ)
+    magic, packed, rows, cols = _OCCUPANCY_HEADER.unpack_from(mapping)
+    if magic != _OCCUPANCY_MAGIC:
+        raise ValueError(f"{path} is not an occupancy file")
+    size = (rows + 2) * (cols + 2)
+    start = _OCCUPANCY_HEADER.size
+    if packed:
+        free = BitGrid(memoryview(mapping)[start:start + -(-size // 8)], size)
+    else:
+        free = memoryview(mapping)[start:start + size]
+    return GridEngine.from_occupancy(free, rows, cols)
+
+
+# Passable terrain in the text .map format: '.' and 'G' are ground, 'S' is swamp.
+# Everything else ('@', 'O', 'T', 'W', ...) is an obstacle.
+_MAP_TRANSLATION = bytes(1 if chr(byte) in ".GS" else 0 for byte in range(256))
+
+
+def load_map(path):
+    """
+    Loads a grid in the common text .map format into a GridEngine.
+
+    The format is a short header ("type octile", "height H", "width W", "map") followed
+    by H lines of W terrain characters. The file is memory-mapped and each line is
+    converted with bytes.translate, so no per-cell Python objects are ever created and
+    the result takes one byte per cell. Save it with save_occupancy to reopen it
+    instantly next time.
+
+    Args:
+        path (str): The .map file to read.
+
+    Returns:
+        GridEngine: The loaded grid.
+    """
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+        header = {}
+        position = 0
+        while True:
+            end = mapping.find(b"\n", position)
+            if end == -1:
+                raise ValueError(f"{path} has no 'map' line")
+            line = mapping[position:end].strip()
+            position = end + 1
+            if line.lower() == b"map":
+                break
+            if line:
+                key, _, value = line.partition(b" ")
+                header[key.lower()] = value.strip()
+        rows = int(header[b"height"])
+        cols = int(header[b"width"])
+
+        width = cols + 2
+        free = bytearray(width * (rows + 2))
+        for row in range(rows):
+            if position >= len(mapping):
+                raise ValueError(f"{path}: row {row} is missing, expected {rows} rows")
+            # Bound the row by its own line ending, "\n" or "\r\n", so a short or long
+            # line is reported against the right row instead of shifting the rest
+            end = mapping.find(b"\n", position)
+            if end == -1:
+                end = len(mapping)
+            line = mapping[position:end]
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if len(line) != cols:
+                raise ValueError(f"{path}: row {row} has {len(line)} cells, expected {cols}")
+            base = (row + 1) * width + 1
+            free[base:base + cols] = line.translate(_MAP_TRANSLATION)
+            position = end + 1
+    return GridEngine.from_occupancy(free, rows, cols)
+
+
+_batch_engine = None  # The GridEngine of a batch_search worker process
+_batch_memory = None  # Keeps the worker's shared memory mapping open
+
+
+def _batch_worker_init(memory_name, rows, cols, packed):
+    """Attaches a batch_search worker to the grid in shared memory."""
+    global _batch_engine, _batch_memory
+    _batch_memory = shared_memory.SharedMemory(name=memory_name)
+    size = (rows + 2) * (cols + 2)
+    if packed:
+        free = BitGrid(_batch_memory.buf[:-(-size // 8)], size)
+    else:
+        free = _batch_memory.buf[:size]
+    _batch_engine = GridEngine.from_occupancy(free, rows, cols)
+
+
+def _batch_worker_solve(task):
+    """Solves one chunk of (start, goal) queries in a batch_search worker."""
+    mode, queries = task
+    solve = _batch_engine.solve_jps if mode == "jps" else _batch_engine.solve
+    return [solve(start, goal) for start, goal in queries]
+
+
+def batch_search(grid, queries, processes=None, chunk_size=256, mode="astar"):
+    """
+    Answers many (start, goal) queries on one grid with a pool of worker processes.
+
+    The occupancy grid is copied once into shared memory and every worker wraps it in
+    its own GridEngine, so the grid is never pickled per task; only the chunks of
+    queries and their paths travel between processes.
+
+    Args:
+        grid (list of lists or GridEngine): A 2D grid where 0 represents a free cell and 1
+                                            represents an obstacle, or a GridEngine over one.
+        queries (list of tuples): (start, goal) pairs of (row, col) cells.
+        processes (int, optional): The number of worker processes (default: CPU count).
+                                   With 1, the queries are solved in this process.
+        chunk_size (int): The number of queries sent to a worker at a time.
+        mode (str): "astar" for GridEngine.solve or "jps" for GridEngine.solve_jps.
+
+    Returns:
+        list: One path (list of coordinates, or None if no path is found) per query,
+              in the same order as queries.
+    """
+    if mode not in ("astar", "jps"):
+        raise ValueError(f"unknown mode {mode!r}, expected 'astar' or 'jps'")
+    engine = grid if isinstance(grid, GridEngine) else GridEngine(grid)
+    queries = list(queries)
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1 or len(queries) <= chunk_size:
+        solve = engine.solve_jps if mode == "jps" else engine.solve
+        return [solve(start, goal) for start, goal in queries]
+
+    # A bit-packed grid (BitGrid) is shared as its packed bytes and rebuilt by each worker
+    packed = isinstance(engine.free, BitGrid)
+    data = engine.free.data[:-(-engine.size // 8)] if packed else engine.free
+    memory = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        memory.buf[:len(data)] = data
+        chunks = [(mode, queries[i:i + chunk_size]) for i in range(0, len(queries), chunk_size)]
+        initargs = (memory.name, engine.rows, engine.cols, packed)
+        with multiprocessing.Pool(processes, _batch_worker_init, initargs) as pool:
+            results = []
+            for paths in pool.imap(_batch_worker_solve, chunks):
+                results.extend(paths)
+        return results
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def jump_point_search(grid, start, goal):
+    """
+    Finds a shortest path on a grid with Jump Point Search.
+
+    Convenience wrapper for one query; build a GridEngine and call solve_jps directly
+    when running many queries on the same grid.
+
+    Args:
+        grid (list of lists): A 2D grid where 0 represents a free cell and 1 represents an obstacle.
+        start (tuple): The coordinates of the starting cell (row, col).
+        goal (tuple): The coordinates of the goal cell (row, col).
+
+    Returns:
+        list or None: A list of coordinates representing a shortest path from start to goal,
+                     or None if no path is found.
+    """
+    return GridEngine(grid).solve_jps(start, goal)
+
+
+def anytime_search(grid, start, goal, epsilon=3.0, decrement=0.5, time_limit=None, max_expansions=None):
+    """
+    Finds the best path Anytime Repairing A* reaches within a time or expansion budget.
+
+    Convenience wrapper for one query; build a GridEngine and call iter_anytime directly
+    to act on each improved path as soon as it is found.
+
+    Args:
+        grid (list of lists): A 2D grid where 0 represents a free cell and 1 represents an obstacle.
+        start (tuple): The coordinates of the starting cell (row, col).
+        goal (tuple): The coordinates of the goal cell (row, col).
+        epsilon (float): The heuristic inflation of the first search, at least 1.
+        decrement (float): How much epsilon drops between searches.
+        time_limit (float, optional): Stop after this many seconds.
+        max_expansions (int, optional): Stop after expanding this many nodes.
+
+    Returns:
+        tuple: (path, bound), where the path is at most bound times longer than a shortest
+               one, or (None, None) if no path exists or the budget ran out first.
+    """
+    return GridEngine(grid).solve_anytime(start, goal, epsilon, decrement, time_limit, max_expansions)
+
+def main():
+    """
+    Runs A* on a small example grid and draws the path found.
+    """
+    # Example Grid:
+    # 0 = free, 1 = obstacle
+    grid = [
+        [0, 0, 0, 0, 0],
+        [0, 1, 0, 1, 0],
+        [0, 1, 0, 1, 0],
+        [0, 1, 0, 0, 0],
+        [0, 0, 0, 1, 0]
+    ]
+
+    start_node = (0, 0)
+    goal_node = (4, 4)
+
+    path = a_star_search(grid, start_node, goal_node)
+
+    if path:
+        print("Shortest path found:", path)
+    else:
+        print("No path found.")
+
+    # Visualizing the grid with the path
+    if path:
+        path_set = set(path)
+        for r in range(len(grid)):
+            row_str = ""
+            for c in range(len(grid[0])):
+                if (r, c) == start_node:
+                    row_str += "S "
+                elif (r, c) == goal_node:
+                    row_str += "G "
+                elif (r, c) in path_set:
+                    row_str += "* "
+                elif grid[r][c] == 1:
+                    row_str += "# "
+                else:
+                    row_str += ". "
+            print(row_str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+Cross-module benchmark suite: times a representative workload from every module.
+
+Each case builds its input with the generators of the per-module benchmarks (outside
+the timing), runs its workload --repeat times and reports every run's seconds. Hooks
+can instrument each case (per-call counts such as nodes expanded, heap pushes,
+backtracks and regex searches, peak memory, a cProfile dump), and the results can be
+written as JSON so runs on different machines or commits can be compared.
+
+Usage:
+    python bench_all.py [--scale 1.0] [--repeat 3] [--only PREFIX ...]
+                        [--hook counters memory profile] [--output results.json]
+"""
+import argparse
+import cProfile
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+
+import Astar
+import chatbot
+import dfsAndbfsGraph
+import helpdesk
+import raph_coloring_branch_and_bound as coloring
+import selectionsort
+from bench_astar import maze_grid, open_grid, random_queries
+from bench_chatbot import random_messages
+from bench_coloring import community_graph, random_graph as random_undirected_graph
+from bench_graph import random_graph as random_directed_graph
+from bench_rules import random_facts, random_rules
+from bench_selection import random_intervals
+
+# Registered cases: (name, setup). setup(scale, seed) returns (workload, parameters,
+# counter): counter runs the workload once with the solvers' counters switched on and
+# returns one dict of counts per call, or is None when the case has nothing to count.
+CASES = []
+
+
+def case(name):
+    """Registers a setup function as a benchmark case called name."""
+    def register(setup):
+        CASES.append((name, setup))
+        return setup
+    return register
+
+
+def _engine_counter(engine, solve, queries):
+    """Returns a counter recording engine.expanded and engine.pushed after each solve call."""
+    def counter():
+        counts = []
+        for start, goal in queries:
+            solve(start, goal)
+            counts.append({"expanded": engine.expanded, "pushed": engine.pushed})
+        return counts
+    return counter
+
+
+def _stats_counter(function, calls):
+    """Returns a counter calling function(*args, stats=stats) for each args tuple of calls."""
+    def counter():
+        counts = []
+        for args in calls:
+            stats = {}
+            function(*args, stats=stats)
+            counts.append(stats)
+        return counts
+    return counter
+
+
+@case("astar.a_star_search")
+def _astar_reference(scale, seed):
+    grid = open_grid(int(200 * scale), seed=seed)
+    queries = random_queries(grid, 10, seed)
+    return (lambda: [Astar.a_star_search(grid, start, goal) for start, goal in queries]), \
+        {"size": len(grid), "queries": len(queries)}, None
+
+
+@case("astar.GridEngine.solve")
+def _astar_engine(scale, seed):
+    grid = open_grid(int(200 * scale), seed=seed)
+    queries = random_queries(grid, 10, seed)
+    engine = Astar.GridEngine(grid)
+    return (lambda: [engine.solve(start, goal) for start, goal in queries]), \
+        {"size": len(grid), "queries": len(queries)}, _engine_counter(engine, engine.solve, queries)
+
+
+@case("astar.GridEngine.solve_jps")
+def _astar_jps(scale, seed):
+    grid = open_grid(int(200 * scale), seed=seed)
+    queries = random_queries(grid, 10, seed)
+    engine = Astar.GridEngine(grid)
+    engine.build_jump_tables()
+    return (lambda: [engine.solve_jps(start, goal) for start, goal in queries]), \
+        {"size": len(grid), "queries": len(queries)}, _engine_counter(engine, engine.solve_jps, queries)
+
+
+@case("astar.GridEngine.solve_anytime")
+def _astar_anytime(scale, seed):
+    grid = open_grid(int(200 * scale), density=0.3, seed=seed)
+    queries = random_queries(grid, 10, seed)
+    engine = Astar.GridEngine(grid)
+
+    def solve(start, goal):
+        return engine.solve_anytime(start, goal, 3.0, max_expansions=5000)
+    return (lambda: [solve(start, goal) for start, goal in queries]), \
+        {"size": len(grid), "queries": len(queries), "epsilon": 3.0, "max_expansions": 5000}, \
+        _engine_counter(engine, solve, queries)
+
+
+@case("astar.DistanceField")
+def _astar_field(scale, seed):
+    grid = maze_grid(int(201 * scale) | 1, seed=seed)
+    engine = Astar.GridEngine(grid)
+    goal = random_queries(grid, 1, seed)[0][1]
+    return (lambda: Astar.DistanceField(engine, [goal])), {"size": len(grid)}, None
+
+
+@case("graph.breadth_first_search_graph")
+def _graph_reference(scale, seed):
+    graph = random_directed_graph(int(50000 * scale), int(500000 * scale), seed)
+    graph["island"] = []
+    return (lambda: dfsAndbfsGraph.breadth_first_search_graph(graph, "n0", "island")), \
+        {"nodes": len(graph), "edges": int(500000 * scale)}, None
+
+
+@case("graph.CSRGraph.breadth_first_search")
+def _graph_csr(scale, seed):
+    graph = random_directed_graph(int(50000 * scale), int(500000 * scale), seed)
+    graph["island"] = []
+    csr = dfsAndbfsGraph.CSRGraph(graph)
+    return (lambda: csr.breadth_first_search("n0", "island")), {"nodes": csr.num_nodes, "edges": csr.num_edges}, \
+        _stats_counter(csr.breadth_first_search, [("n0", "island")])
+
+
+@case("graph.bfs_levels")
+def _graph_levels(scale, seed):
+    csr = dfsAndbfsGraph.CSRGraph(random_directed_graph(int(50000 * scale), int(500000 * scale), seed))
+
+    def counter():
+        return [{"visited": sum(1 for distance in dfsAndbfsGraph.bfs_levels(csr, "n0") if distance >= 0)}]
+    return (lambda: dfsAndbfsGraph.bfs_levels(csr, "n0")), {"nodes": csr.num_nodes, "edges": csr.num_edges}, counter
+
+
+@case("coloring.graph_coloring_dsatur")
+def _coloring_dsatur(scale, seed):
+    graph = random_undirected_graph(int(120 * scale), 0.1, seed)
+    return (lambda: coloring.graph_coloring_dsatur(graph, 5)), {"vertices": len(graph), "colors": 5}, \
+        _stats_counter(coloring.graph_coloring_dsatur, [(graph, 5)])
+
+
+@case("coloring.graph_coloring_preprocessed")
+def _coloring_preprocessed(scale, seed):
+    graph = community_graph(max(int(16 * scale), 1), 12, 0.5, seed)
+    return (lambda: coloring.graph_coloring_preprocessed(graph, 6)), {"vertices": len(graph), "colors": 6}, \
+        _stats_counter(coloring.graph_coloring_preprocessed, [(graph, 6)])
+
+
+@case("coloring.chromatic_number")
+def _coloring_chromatic(scale, seed):
+    graph = random_undirected_graph(int(60 * scale), 0.3, seed)
+
+    def counter():
+        result = coloring.chromatic_number(graph, time_limit=60)
+        return [{"nodes": result["nodes"], "backtracks": result["backtracks"]}]
+    return (lambda: coloring.chromatic_number(graph, time_limit=60)), {"vertices": len(graph)}, counter
+
+
+@case("selection.weighted_interval_scheduling")
+def _selection_weighted(scale, seed):
+    starts, finishes, weights = random_intervals(int(10 ** 6 * scale), seed)
+    return (lambda: selectionsort.weighted_interval_scheduling(starts, finishes, weights)), {"intervals": len(starts)}, None
+
+
+@case("selection.interval_partitioning")
+def _selection_partitioning(scale, seed):
+    starts, finishes, _ = random_intervals(int(10 ** 6 * scale), seed)
+    return (lambda: selectionsort.interval_partitioning(starts, finishes)), {"intervals": len(starts)}, None
+
+
+@case("selection.external_activity_selection")
+def _selection_external(scale, seed):
+    starts, finishes, _ = random_intervals(int(2 * 10 ** 5 * scale), seed)
+    activities = list(zip(starts.tolist(), finishes.tolist()))
+    run_size = max(len(activities) // 8, 1)
+    return (lambda: sum(1 for _ in selectionsort.external_activity_selection(activities, run_size))), \
+        {"activities": len(activities), "run_size": run_size}, None
+
+
+@case("chatbot.get_response")
+def _chatbot_response(scale, seed):
+    messages = random_messages(int(10 ** 5 * scale), seed)
+    # get_response matches exactly as match_intent does, so its counts are the same
+    return (lambda: [chatbot.get_response(message) for message in messages]), {"messages": len(messages)}, \
+        _stats_counter(chatbot.match_intent, [(message,) for message in messages])
+
+
+@case("chatbot.classify_batch")
+def _chatbot_batch(scale, seed):
+    messages = random_messages(int(10 ** 5 * scale), seed)
+    return (lambda: list(chatbot.classify_batch(messages, seed, processes=1))), {"messages": len(messages)}, \
+        _stats_counter(chatbot.match_intent, [(message,) for message in messages])
+
+
+@case("helpdesk.forward_chaining")
+def _helpdesk_scan(scale, seed):
+    count = int(10 ** 4 * scale)
+    rules = random_rules(count, max(count // 50, 1), seed=seed)
+    facts = random_facts(1000, max(count // 50, 1), seed=seed + 1)
+
+    def workload():
+        saved, helpdesk.KNOWLEDGE_BASE = helpdesk.KNOWLEDGE_BASE, rules
+        try:
+            return [helpdesk.forward_chaining(query) for query in facts]
+        finally:
+            helpdesk.KNOWLEDGE_BASE = saved
+    return workload, {"rules": count, "queries": len(facts)}, None
+
+
+@case("helpdesk.RuleEngine.first_match")
+def _helpdesk_engine(scale, seed):
+    count = int(10 ** 4 * scale)
+    engine = helpdesk.RuleEngine(random_rules(count, max(count // 50, 1), seed=seed))
+    facts = random_facts(1000, max(count // 50, 1), seed=seed + 1)
+    return (lambda: [engine.first_match(query) for query in facts]), {"rules": count, "queries": len(facts)}, None
+
+
+class CountersHook:
+    """
+    Records each case's per-call counts as "counts": the number of calls and the total
+    and mean of every count. The case's counter runs once in start, before the timed
+    runs, so the counting never slows them down.
+    """
+    name = "counters"
+
+    def start(self, name, counter):
+        self.counts = None if counter is None else counter()
+
+    def stop(self, name, record):
+        if self.counts is None:
+            return
+        total = {}
+        for counts in self.counts:
+            for key, value in counts.items():
+                total[key] = total.get(key, 0) + value
+        calls = len(self.counts)
+        record["counts"] = {"calls": calls, "total": total,
+                            "per_call": {key: value / calls for key, value in total.items()} if calls else {}}
+
+
+class MemoryHook:
+    """Records each case's peak traced allocation as "peak_bytes" (tracing slows the runs down)."""
+    name = "memory"
+
+    def start(self, name, counter):
+        tracemalloc.start()
+
+    def stop(self, name, record):
+        record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+
+class ProfileHook:
+    """Profiles each case with cProfile and writes <directory>/<case>.prof, recorded as "profile"."""
+    name = "profile"
+
+    def __init__(self, directory="profiles"):
+        self.directory = directory
+        self.profiler = None
+
+    def start(self, name, counter):
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def stop(self, name, record):
+        self.profiler.disable()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{name}.prof")
+        self.profiler.dump_stats(path)
+        record["profile"] = path
+
+
+HOOKS = {"counters": CountersHook, "memory": MemoryHook, "profile": ProfileHook}
+
+
+def run_suite(cases=None, scale=1.0, repeat=3, seed=0, hooks=(), report=None):
+    """
+    Runs benchmark cases and returns their records.
+
+    Args:
+        cases (list, optional): (name, setup) pairs (default: every registered case).
+        scale (float): Multiplies every case's input size.
+        repeat (int): Timed runs per case.
+        seed (int): Seed for the generators.
+        hooks (list): Objects with start(name, counter) and stop(name, record), called
+                      around each case's timed runs (counter is the case's, or None);
+                      stop may add fields to the record.
+        report (callable, optional): Called with each record as soon as it is complete.
+
+    Returns:
+        list of dict: One record per case with its name, parameters, setup time and
+                      the seconds of every run, plus whatever the hooks added.
+    """
+    records = []
+    for name, setup in CASES if cases is None else cases:
+        began = time.perf_counter()
+        workload, parameters, counter = setup(scale, seed)
+        record = {"name": name, "parameters": parameters, "setup_seconds": time.perf_counter() - began}
+        for hook in hooks:
+            hook.start(name, counter)
+        seconds = []
+        for _ in range(repeat):
+            began = time.perf_counter()
+            workload()
+            seconds.append(time.perf_counter() - began)
+        for hook in reversed(hooks):
+            hook.stop(name, record)
+        record.update(seconds=seconds, best=min(seconds), median=statistics.median(seconds))
+        records.append(record)
+        if report is not None:
+            report(record)
+    return records
+
+
+def environment():
+    """Returns a description of the machine and interpreter for the JSON results."""
+    return {"python": platform.python_version(), "implementation": platform.python_implementation(),
+            "platform": platform.platform(), "cpu_count": os.cpu_count(),
+            "numpy": selectionsort.np.__version__ if selectionsort.np is not None else None,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies every input size")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--only", nargs="+", metavar="PREFIX", help="run the cases whose names start with a prefix")
+    parser.add_argument("--hook", nargs="+", choices=sorted(HOOKS), default=[], help="instrument every case")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, _ in CASES:
+            print(name)
+        return
+    cases = [(name, setup) for name, setup in CASES
+             if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+    # Counting runs the workload in CountersHook.start, so it goes before the hooks that measure
+    hooks = [HOOKS[name]() for name in sorted(set(args.hook), key=lambda name: name != "counters")]
+
+    print(f"  {'case':<42}{'best s':>10}{'median s':>10}")
+
+    def report(record):
+        print(f"  {record['name']:<42}{record['best']:>10.4f}{record['median']:>10.4f}")
+
+    records = run_suite(cases, args.scale, args.repeat, args.seed, hooks, report)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump({"environment": environment(), "scale": args.scale, "repeat": args.repeat,
+                       "seed": args.seed, "results": records}, handle, indent=2)
+            handle.write("\n")
+
+
+if __name__ == "__main__":
+    main()
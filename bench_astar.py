@@ -0,0 +1,320 @@
+"""
+Benchmarks for the grid search modes in Astar.py.
+
+Usage:
+    python bench_astar.py [--size 1000] [--queries 5] [--seed 0]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from Astar import (DistanceFieldCache, GridEngine, HierarchicalPlanner, IncrementalPlanner, a_star_search,
+                   batch_search, load_map, load_occupancy, save_occupancy)
+
+
+def open_grid(size, density=0.005, seed=0):
+    """Returns a size x size grid with scattered single-cell obstacles."""
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(size)] for _ in range(size)]
+
+
+def maze_grid(size, seed=0):
+    """Returns a size x size perfect maze (walls = 1) carved with an iterative backtracker."""
+    rng = random.Random(seed)
+    grid = [[1] * size for _ in range(size)]
+    stack = [(0, 0)]
+    grid[0][0] = 0
+    while stack:
+        row, col = stack[-1]
+        steps = [(dr, dc) for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                 if 0 <= row + dr < size and 0 <= col + dc < size and grid[row + dr][col + dc] == 1]
+        if not steps:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(steps)
+        grid[row + dr // 2][col + dc // 2] = 0
+        grid[row + dr][col + dc] = 0
+        stack.append((row + dr, col + dc))
+    return grid
+
+
+def random_queries(grid, count, seed=0):
+    """Returns count (start, goal) pairs of free cells."""
+    rng = random.Random(seed)
+    free_cells = [(r, c) for r, row in enumerate(grid) for c, cell in enumerate(row) if cell == 0]
+    return [(rng.choice(free_cells), rng.choice(free_cells)) for _ in range(count)]
+
+
+def timed(function, queries, engine=None):
+    """
+    Runs function(start, goal) over all queries.
+
+    Returns (results, seconds, expanded), where expanded is the total of engine.expanded
+    over the queries, or None when no engine is given.
+    """
+    results = []
+    expanded = 0 if engine is not None else None
+    began = time.perf_counter()
+    for start, goal in queries:
+        results.append(function(start, goal))
+        if engine is not None:
+            expanded += engine.expanded
+    return results, time.perf_counter() - began, expanded
+
+
+def compare_modes(name, grid, queries):
+    """Prints time and nodes expanded for a_star_search, GridEngine.solve and GridEngine.solve_jps."""
+    engine = GridEngine(grid)
+
+    reference, reference_time, _ = timed(lambda start, goal: a_star_search(grid, start, goal), queries)
+    astar_paths, astar_time, astar_expanded = timed(engine.solve, queries, engine)
+    began = time.perf_counter()
+    engine.build_jump_tables()
+    tables_time = time.perf_counter() - began
+    jps_paths, jps_time, jps_expanded = timed(engine.solve_jps, queries, engine)
+
+    for a, b in zip(reference, jps_paths):
+        assert (a is None) == (b is None) and (a is None or len(a) == len(b)), "JPS path length differs"
+    assert astar_paths == reference, "GridEngine.solve path differs"
+
+    print(f"{name}: {len(queries)} queries")
+    print(f"  {'mode':<22}{'seconds':>10}{'expanded':>12}")
+    # GridEngine.solve expands exactly the nodes a_star_search expands
+    print(f"  {'a_star_search':<22}{reference_time:>10.3f}{astar_expanded:>12}")
+    print(f"  {'GridEngine.solve':<22}{astar_time:>10.3f}{astar_expanded:>12}")
+    print(f"  {'GridEngine.solve_jps':<22}{jps_time:>10.3f}{jps_expanded:>12}")
+    print(f"  (JPS tables built once in {tables_time:.3f}s)")
+
+
+def compare_replanning(name, grid, rounds=10, edits=5, seed=0):
+    """
+    Prints the work IncrementalPlanner saves over fresh searches after small grid edits.
+
+    Each round toggles a few cells on or right next to the first part of the current
+    path, where an agent following it would sense changes, then replans both
+    incrementally and from scratch with GridEngine.solve.
+    """
+    rng = random.Random(seed)
+    start, goal = random_queries(grid, 1, seed)[0]
+    planner = IncrementalPlanner(grid, start, goal)
+    engine = planner.engine  # Shares the edited grid
+
+    began = time.perf_counter()
+    path = planner.plan()
+    initial_time = time.perf_counter() - began
+    initial_expanded = planner.expanded
+
+    incremental_time = fresh_time = 0.0
+    incremental_expanded = fresh_expanded = 0
+    for _ in range(rounds):
+        changes = []
+        for _ in range(edits):
+            row, col = rng.choice(path[:len(path) // 4 + 1]) if path else (rng.randrange(len(grid)), rng.randrange(len(grid[0])))
+            row = min(max(row + rng.randint(-1, 1), 0), len(grid) - 1)
+            col = min(max(col + rng.randint(-1, 1), 0), len(grid[0]) - 1)
+            if (row, col) not in (start, goal):
+                changes.append(((row, col), 1 - (0 if engine.is_free((row, col)) else 1)))
+        planner.update_cells(changes)
+
+        began = time.perf_counter()
+        path = planner.plan()
+        incremental_time += time.perf_counter() - began
+        incremental_expanded += planner.expanded
+
+        fresh, seconds, expanded = timed(engine.solve, [(start, goal)], engine)
+        fresh_time += seconds
+        fresh_expanded += expanded
+        assert (path is None) == (fresh[0] is None) and (path is None or len(path) == len(fresh[0])), \
+            "incremental path length differs"
+
+    print(f"{name}: {rounds} rounds of {edits} cell edits near the path")
+    print(f"  {'mode':<22}{'seconds':>10}{'expanded':>12}")
+    print(f"  {'initial plan':<22}{initial_time:>10.3f}{initial_expanded:>12}")
+    print(f"  {'incremental replans':<22}{incremental_time:>10.3f}{incremental_expanded:>12}")
+    print(f"  {'fresh GridEngine.solve':<22}{fresh_time:>10.3f}{fresh_expanded:>12}")
+
+
+def compare_hierarchical(name, grid, queries, cluster_size=32):
+    """
+    Prints HierarchicalPlanner timings, path quality and first-move latency.
+
+    Clusters are built lazily, so the first pass over the queries includes preprocessing
+    of the clusters they touch and the second pass shows the cached cost.
+    """
+    engine = GridEngine(grid)
+    planner = HierarchicalPlanner(engine, cluster_size)
+
+    optimal, optimal_time, _ = timed(engine.solve, queries)
+    _, cold_time, _ = timed(planner.solve, queries)
+    paths, warm_time, _ = timed(planner.solve, queries)
+    _, first_move_time, _ = timed(lambda start, goal: planner.solve(start, goal, max_steps=1), queries)
+
+    optimal_length = sum(len(path) - 1 for path in optimal if path)
+    length = sum(len(path) - 1 for path in paths if path)
+    assert [path is None for path in optimal] == [path is None for path in paths], "HPA* reachability differs"
+
+    print(f"{name}: {len(queries)} queries, clusters of {cluster_size}")
+    print(f"  {'mode':<22}{'seconds':>10}")
+    print(f"  {'GridEngine.solve':<22}{optimal_time:>10.3f}")
+    print(f"  {'HPA* (cold clusters)':<22}{cold_time:>10.3f}")
+    print(f"  {'HPA* (cached)':<22}{warm_time:>10.3f}")
+    print(f"  {'HPA* first move only':<22}{first_move_time:>10.3f}")
+    print(f"  path length {length} vs optimal {optimal_length} "
+          f"(+{100.0 * (length - optimal_length) / max(optimal_length, 1):.1f}%), "
+          f"{len(planner.cluster_edges)} of {planner.cluster_rows * planner.cluster_cols} clusters built")
+
+
+def compare_batch(name, grid, queries, chunk_size=16):
+    """Prints batch_search throughput for 1, 2, 4, ... worker processes up to the CPU count."""
+    engine = GridEngine(grid)
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+
+    print(f"{name}: batch_search over {len(queries)} queries, chunks of {chunk_size}")
+    print(f"  {'processes':<22}{'seconds':>10}{'queries/s':>12}")
+    reference = None
+    for processes in counts:
+        began = time.perf_counter()
+        paths = batch_search(engine, queries, processes=processes, chunk_size=chunk_size)
+        seconds = time.perf_counter() - began
+        if reference is None:
+            reference = paths
+        assert paths == reference, "batch_search results differ between process counts"
+        print(f"  {processes:<22}{seconds:>10.3f}{len(queries) / seconds:>12.1f}")
+
+
+def compare_fields(name, grid, agents, seed=0):
+    """Prints the cost of routing many agents to one goal with per-agent A* versus a distance field."""
+    queries = random_queries(grid, agents, seed)
+    goal = queries[0][1]
+    queries = [(start, goal) for start, _ in queries]
+    engine = GridEngine(grid)
+    cache = DistanceFieldCache(engine)
+
+    paths, astar_time, _ = timed(engine.solve, queries)
+    began = time.perf_counter()
+    cache.field(goal)
+    build_time = time.perf_counter() - began
+    field_paths, field_time, _ = timed(cache.path, queries)
+    assert [len(path or []) for path in paths] == [len(path or []) for path in field_paths], \
+        "distance field path length differs"
+
+    print(f"{name}: {agents} agents heading to one goal")
+    print(f"  {'mode':<22}{'seconds':>10}")
+    print(f"  {'GridEngine.solve each':<22}{astar_time:>10.3f}")
+    print(f"  {'field build (once)':<22}{build_time:>10.3f}")
+    print(f"  {'field paths':<22}{field_time:>10.3f}")
+
+
+def compare_anytime(name, grid, queries, epsilon=3.0, decrement=0.5, budget=0.1):
+    """
+    Prints what GridEngine.iter_anytime trades between path quality and work.
+
+    Rows show the first (inflated) search, the final search that proves its path is a
+    shortest one, the same epsilon schedule run as fresh searches (what reusing earlier
+    effort saves), and solve_anytime capped at a fraction of the expansions solve needs.
+    Length is the mean path length over solve's; bound is the mean proven bound.
+    """
+    engine = GridEngine(grid)
+    optimal, optimal_time, optimal_expanded = timed(engine.solve, queries, engine)
+    schedule = []
+    weight = epsilon
+    while weight > 1:
+        schedule.append(weight)
+        weight -= decrement
+    schedule.append(1.0)
+
+    rows = {"first": [0.0, 0, 0.0, 0.0, 0], "final": [0.0, 0, 0.0, 0.0, 0],
+            "fresh searches": [0.0, 0, 0.0, 0.0, 0], "budgeted": [0.0, 0, 0.0, 0.0, 0]}
+
+    def add(row, seconds, expanded, path, bound, reference):
+        rows[row][0] += seconds
+        rows[row][1] += expanded
+        if path is not None:
+            rows[row][2] += (len(path) - 1) / max(len(reference) - 1, 1)
+            rows[row][3] += bound
+            rows[row][4] += 1
+
+    for (start, goal), reference in zip(queries, optimal):
+        if reference is None:
+            continue
+        began = time.perf_counter()
+        for count, (path, bound) in enumerate(engine.iter_anytime(start, goal, epsilon, decrement)):
+            if count == 0:
+                add("first", time.perf_counter() - began, engine.expanded, path, bound, reference)
+        add("final", time.perf_counter() - began, engine.expanded, path, bound, reference)
+        assert len(path) == len(reference) and bound == 1.0, "anytime path is not a shortest one"
+
+        # Each epsilon of the schedule searched from scratch: only the first search of a fresh run
+        began = time.perf_counter()
+        expanded = 0
+        for weight in schedule:
+            path, bound = next(engine.iter_anytime(start, goal, weight))
+            expanded += engine.expanded
+        add("fresh searches", time.perf_counter() - began, expanded, path, bound, reference)
+
+        limit = max(int(budget * optimal_expanded / len(queries)), 1)
+        began = time.perf_counter()
+        path, bound = engine.solve_anytime(start, goal, epsilon, decrement, max_expansions=limit)
+        add("budgeted", time.perf_counter() - began, engine.expanded, path, bound, reference)
+
+    print(f"{name}: {len(queries)} queries, epsilon {epsilon} - {decrement} per search, budget {budget:.0%} of solve")
+    print(f"  {'mode':<22}{'seconds':>10}{'expanded':>12}{'length':>10}{'bound':>10}{'solved':>8}")
+    print(f"  {'GridEngine.solve':<22}{optimal_time:>10.3f}{optimal_expanded:>12}{1:>10.3f}{1:>10.3f}"
+          f"{sum(path is not None for path in optimal):>8}")
+    for row, (seconds, expanded, length, bound, solved) in rows.items():
+        print(f"  {row:<22}{seconds:>10.3f}{expanded:>12}{length / max(solved, 1):>10.3f}"
+              f"{bound / max(solved, 1):>10.3f}{solved:>8}")
+
+def compare_loading(name, grid):
+    """Prints how long each on-disk grid format takes to open, and its bytes per cell."""
+    cells = len(grid) * len(grid[0])
+    with tempfile.TemporaryDirectory() as directory:
+        map_path = os.path.join(directory, "grid.map")
+        with open(map_path, "w") as handle:
+            handle.write(f"type octile\nheight {len(grid)}\nwidth {len(grid[0])}\nmap\n")
+            for row in grid:
+                handle.write("".join("@" if cell else "." for cell in row) + "\n")
+
+        began = time.perf_counter()
+        engine = load_map(map_path)
+        map_time = time.perf_counter() - began
+
+        print(f"{name}: opening a {len(grid)}x{len(grid[0])} grid from disk")
+        print(f"  {'format':<22}{'seconds':>10}{'bytes/cell':>12}")
+        print(f"  {'text .map':<22}{map_time:>10.4f}{len(engine.free) / cells:>12.3f}")
+        for label, packed in (("mmap bytes", False), ("mmap bits", True)):
+            path = os.path.join(directory, label.replace(" ", "_"))
+            save_occupancy(engine, path, packed=packed)
+            began = time.perf_counter()
+            mapped = load_occupancy(path)
+            seconds = time.perf_counter() - began
+            print(f"  {label:<22}{seconds:>10.4f}{os.path.getsize(path) / cells:>12.3f}")
+            del mapped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000, help="grid side length")
+    parser.add_argument("--queries", type=int, default=5, help="queries per map")
+    parser.add_argument("--batch-queries", type=int, default=200, help="queries per map for batch_search")
+    parser.add_argument("--agents", type=int, default=50, help="agents sharing one goal")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    for name, grid in (("open", open_grid(args.size, seed=args.seed)),
+                       ("maze", maze_grid(args.size, seed=args.seed))):
+        compare_modes(f"{name} {args.size}x{args.size}", grid, random_queries(grid, args.queries, args.seed))
+        compare_replanning(f"{name} {args.size}x{args.size}", grid, seed=args.seed)
+        compare_hierarchical(f"{name} {args.size}x{args.size}", grid, random_queries(grid, args.queries, args.seed))
+        compare_batch(f"{name} {args.size}x{args.size}", grid, random_queries(grid, args.batch_queries, args.seed))
+        compare_fields(f"{name} {args.size}x{args.size}", grid, args.agents, args.seed)
+        compare_anytime(f"{name} {args.size}x{args.size}", grid, random_queries(grid, args.queries, args.seed))
+    compare_loading(f"open {args.size}x{args.size}", open_grid(args.size, seed=args.seed))
+
+
+if __name__ == "__main__":
+    main()
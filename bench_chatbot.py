@@ -0,0 +1,91 @@
+"""
+Benchmarks for the intent matching in chatbot.py.
+
+Usage:
+    python bench_chatbot.py [--messages 200000] [--batch-messages 1000000] [--seed 0]
+"""
+import argparse
+import os
+import random
+import re
+import time
+
+from chatbot import RESPONSE_PATTERNS, classify_batch, get_response, match_intent
+
+TEMPLATES = [
+    "Hello there!", "What is my order status?", "order number {n}", "Can you track order {n} please",
+    "When is the delivery?", "What's your return policy?", "How do I contact you?", "I need help",
+    "cancel order {n}", "yes, cancel order {n}", "no, don't cancel order {n}", "change address on order {n}",
+    "the new address for order {n} is 12 Main Street", "Thank you!", "goodbye", "blah blah something else",
+]
+
+
+def random_messages(count, seed=0):
+    """Returns count customer messages drawn from TEMPLATES with random order numbers."""
+    rng = random.Random(seed)
+    return [rng.choice(TEMPLATES).format(n=rng.randrange(10 ** 6)) for _ in range(count)]
+
+
+def reference_response(user_input):
+    """get_response as it was before: rebuilds the pattern dict and re.searches each pattern string per call."""
+    user_input = re.sub(r"[^\w\s']", '', user_input.lower().strip())
+    response_patterns = dict(RESPONSE_PATTERNS)
+    for pattern, responses in response_patterns.items():
+        match = re.search(pattern, user_input)
+        if match:
+            format_args = match.groups()
+            response = random.choice(responses)
+            return response.format(*format_args) if format_args else response
+    return "I'm sorry, I don't understand.  Could you please rephrase your question?"
+
+
+def per_message(function, messages):
+    """Returns (results, microseconds per message)."""
+    began = time.perf_counter()
+    results = [function(message) for message in messages]
+    return results, 1e6 * (time.perf_counter() - began) / len(messages)
+
+
+def compare_batch(messages, seed=0, chunk_size=10000):
+    """Prints classify_batch throughput for 1, 2, 4, ... processes up to the CPU count."""
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    print(f"classify_batch over {len(messages)} messages, chunks of {chunk_size}")
+    print(f"  {'processes':<32}{'seconds':>12}{'messages/s':>14}")
+    reference = None
+    for processes in counts:
+        began = time.perf_counter()
+        results = list(classify_batch(messages, seed, processes, chunk_size))
+        seconds = time.perf_counter() - began
+        if reference is None:
+            reference = results
+        assert results == reference, "classify_batch results differ between process counts"
+        print(f"  {processes:<32}{seconds:>12.3f}{len(messages) / seconds:>14.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200000, help="number of messages")
+    parser.add_argument("--batch-messages", type=int, default=1000000, help="number of messages for classify_batch")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    messages = random_messages(args.messages, args.seed)
+
+    random.seed(args.seed)
+    expected, reference_time = per_message(reference_response, messages)
+    random.seed(args.seed)
+    responses, response_time = per_message(get_response, messages)
+    assert responses == expected, "get_response differs from the reference"
+    _, match_time = per_message(match_intent, messages)
+
+    print(f"{len(messages)} messages")
+    print(f"  {'mode':<32}{'us/message':>12}{'messages/s':>14}")
+    for label, micros in (("per-call patterns (before)", reference_time), ("get_response", response_time),
+                          ("match_intent", match_time)):
+        print(f"  {label:<32}{micros:>12.2f}{1e6 / micros:>14.0f}")
+    compare_batch(random_messages(args.batch_messages, args.seed), args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Load generator for the asyncio chat server in chatbot.py.
+
+Opens many concurrent sessions, each sending a conversation one message at a time,
+and reports response latency percentiles and throughput. Without --connect it starts
+a ChatServer in the same process (client and server then share one CPU core).
+
+Usage:
+    python bench_chatbot_server.py [--sessions 2000] [--messages 20] [--connect HOST:PORT]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from bench_chatbot import random_messages
+from chatbot import ChatServer
+
+
+async def run_session(host, port, messages, latencies, start_gate):
+    """Sends messages over one connection, waiting for each reply; appends each latency in seconds."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await start_gate.wait()
+    try:
+        for message in messages:
+            began = time.perf_counter()
+            writer.write(message.encode() + b"\n")
+            await writer.drain()
+            reply = await reader.readline()
+            if not reply:
+                raise ConnectionError("server closed the session")
+            latencies.append(time.perf_counter() - began)
+    finally:
+        writer.close()
+
+
+async def check_conversation(host, port):
+    """Checks that a session remembers the order in the cancel confirmation flow."""
+    reader, writer = await asyncio.open_connection(host, port)
+    replies = []
+    for message in ("cancel order 4242", "yes"):
+        writer.write(message.encode() + b"\n")
+        await writer.drain()
+        replies.append((await reader.readline()).decode())
+    writer.close()
+    assert "4242" in replies[1], f"session state lost: {replies}"
+
+
+def percentile(sorted_values, fraction):
+    """Returns the value at the given fraction (0..1) of a sorted list."""
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+
+async def load(args):
+    server = None
+    if args.connect:
+        host, _, port = args.connect.rpartition(":")
+        port = int(port)
+    else:
+        server = ChatServer(max_sessions=args.sessions + 1)
+        listener = await server.start("127.0.0.1", 0)
+        host, port = listener.sockets[0].getsockname()[:2]
+    try:
+        await check_conversation(host, port)
+        rng = random.Random(args.seed)
+        conversations = [random_messages(args.messages, rng.randrange(1 << 30)) for _ in range(args.sessions)]
+        latencies = []
+        start_gate = asyncio.Event()
+        # Connect everyone first so the timing covers only the messages
+        tasks = [asyncio.ensure_future(run_session(host, port, conversation, latencies, start_gate))
+                 for conversation in conversations]
+        while server is not None and len(server.sessions) < args.sessions:
+            await asyncio.sleep(0.01)
+        began = time.perf_counter()
+        start_gate.set()
+        await asyncio.gather(*tasks)
+        seconds = time.perf_counter() - began
+    finally:
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    print(f"{args.sessions} concurrent sessions x {args.messages} messages")
+    print(f"  {'messages/s':<16}{len(latencies) / seconds:>12.0f}")
+    print(f"  {'p50 latency ms':<16}{1e3 * percentile(latencies, 0.50):>12.3f}")
+    print(f"  {'p99 latency ms':<16}{1e3 * percentile(latencies, 0.99):>12.3f}")
+    print(f"  {'max latency ms':<16}{1e3 * latencies[-1]:>12.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=2000, help="concurrent sessions")
+    parser.add_argument("--messages", type=int, default=20, help="messages per session")
+    parser.add_argument("--connect", metavar="HOST:PORT", help="use a running server instead of starting one")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    asyncio.run(load(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
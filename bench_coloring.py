@@ -0,0 +1,257 @@
+"""
+Benchmarks for the graph coloring solvers in raph_coloring_branch_and_bound.py.
+
+Usage:
+    python bench_coloring.py [--time-limit 20] [--seed 0] [--dimacs FILE.col ...]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+
+from raph_coloring_branch_and_bound import (chromatic_number, graph_coloring_branch_and_bound, graph_coloring_dsatur,
+                                            graph_coloring_preprocessed, parallel_graph_coloring)
+
+
+def random_graph(num_vertices, density, seed=0):
+    """Returns an undirected G(n, p) random graph as an adjacency dict."""
+    rng = random.Random(seed)
+    graph = {v: [] for v in range(num_vertices)}
+    for u in range(num_vertices):
+        for v in range(u + 1, num_vertices):
+            if rng.random() < density:
+                graph[u].append(v)
+                graph[v].append(u)
+    return graph
+
+
+def community_graph(communities, size, density, seed=0):
+    """
+    Returns a sparse graph shaped like real-world networks: small dense communities,
+    each with a tail of low-degree tree vertices, a few twin vertices copying a member's
+    neighbors, and rare links between neighboring communities.
+    """
+    rng = random.Random(seed)
+    graph = {}
+
+    def link(u, v):
+        graph.setdefault(u, []).append(v)
+        graph.setdefault(v, []).append(u)
+
+    for c in range(communities):
+        members = [(c, i) for i in range(size)]
+        for member in members:
+            graph.setdefault(member, [])
+        for i, u in enumerate(members):
+            for v in members[i + 1:]:
+                if rng.random() < density:
+                    link(u, v)
+        tree = list(members)
+        for t in range(2 * size):
+            link((c, "tree", t), rng.choice(tree))
+            tree.append((c, "tree", t))
+        for t in range(size // 4):
+            original = rng.choice(members)
+            for v in list(graph[original]):
+                link((c, "twin", t), v)
+        if c and rng.random() < 0.5:
+            link((c, 0), (c - 1, rng.randrange(size)))
+    return graph
+
+
+def queen_graph(size):
+    """Returns the DIMACS queenN_N graph: squares of a size x size board, adjacent if queens attack."""
+    graph = {(r, c): [] for r in range(size) for c in range(size)}
+    for r, c in graph:
+        for r2, c2 in graph:
+            if (r, c) != (r2, c2) and (r == r2 or c == c2 or abs(r - r2) == abs(c - c2)):
+                graph[(r, c)].append((r2, c2))
+    return graph
+
+
+def mycielski_graph(steps):
+    """Returns the DIMACS mycielN graph (triangle-free, chromatic number steps + 1)."""
+    graph = {0: [1], 1: [0]}
+    for _ in range(steps - 1):
+        n = len(graph)
+        grown = {v: list(adjacent) for v, adjacent in graph.items()}
+        for v in range(n):
+            grown[n + v] = [n + u for u in graph[v]] + [2 * n]
+            for u in graph[v]:
+                grown[u].append(n + v)
+        grown[2 * n] = list(range(n, 2 * n))
+        graph = grown
+    return graph
+
+
+def read_dimacs(path):
+    """Reads a DIMACS .col file ("p edge N M" then "e u v" lines) into an adjacency dict."""
+    graph = {}
+    with open(path) as handle:
+        for line in handle:
+            fields = line.split()
+            if not fields:
+                continue
+            if fields[0] == "p":
+                graph = {v: [] for v in range(1, int(fields[2]) + 1)}
+            elif fields[0] == "e":
+                u, v = int(fields[1]), int(fields[2])
+                graph[u].append(v)
+                graph[v].append(u)
+    return graph
+
+
+def _run(connection, solver, args):
+    """Child process body for run_limited; a RecursionError is sent back as the result."""
+    stats = {}
+    began = time.perf_counter()
+    try:
+        result = solver(*args, stats=stats)
+    except RecursionError as error:
+        result = error
+    connection.send((result, stats, time.perf_counter() - began))
+
+
+def run_limited(solver, args, time_limit):
+    """
+    Runs solver(*args, stats=...) in a child process, killing it after time_limit seconds.
+
+    Returns (result, stats, seconds), or None if the time limit was hit.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run, args=(sender, solver, args))
+    process.start()
+    if receiver.poll(time_limit):
+        outcome = receiver.recv()
+        process.join()
+        return outcome
+    process.terminate()
+    process.join()
+    return None
+
+
+def is_valid_coloring(graph, coloring, num_colors):
+    """Returns True if coloring uses colors 1..num_colors and no edge joins two equal colors."""
+    return (all(1 <= coloring[v] <= num_colors for v in graph)
+            and all(coloring[u] != coloring[v] for u in graph for v in graph[u] if u != v))
+
+
+def compare_solvers(name, graph, num_colors, solvers, time_limit):
+    """Prints the outcome, nodes explored and time of each solver on one instance."""
+    edges = sum(len(neighbors) for neighbors in graph.values()) // 2
+    print(f"{name}: {len(graph)} vertices, {edges} edges, {num_colors} colors")
+    print(f"  {'solver':<34}{'result':>10}{'nodes':>12}{'seconds':>10}")
+    for label, solver in solvers:
+        outcome = run_limited(solver, (graph, num_colors), time_limit)
+        if outcome is None:
+            print(f"  {label:<34}{'timeout':>10}{'-':>12}{f'>{time_limit:g}':>10}")
+            continue
+        result, stats, seconds = outcome
+        if isinstance(result, RecursionError):
+            print(f"  {label:<34}{'recursion':>10}{'-':>12}{seconds:>10.3f}")
+            continue
+        if result is not None:
+            assert is_valid_coloring(graph, result, num_colors), f"{label} returned an invalid coloring"
+        print(f"  {label:<34}{'colored' if result else 'none':>10}{stats.get('nodes', '-'):>12}{seconds:>10.3f}")
+
+
+def compare_chromatic(name, graph, time_limit):
+    """Prints chromatic_number's bounds against trying k = 1, 2, ... with graph_coloring_dsatur."""
+    edges = sum(len(neighbors) for neighbors in graph.values()) // 2
+    print(f"{name}: {len(graph)} vertices, {edges} edges, minimum colors")
+
+    began = time.perf_counter()
+    result = chromatic_number(graph, time_limit=time_limit)
+    seconds = time.perf_counter() - began
+    assert is_valid_coloring(graph, result["coloring"], result["num_colors"]), "chromatic_number returned an invalid coloring"
+
+    # One decision search per k, each starting from scratch
+    k = result["lower_bound"]
+    scan_began = time.perf_counter()
+    scan_nodes = 0
+    while True:
+        remaining = time_limit - (time.perf_counter() - scan_began)
+        outcome = run_limited(graph_coloring_dsatur, (graph, k), remaining) if remaining > 0 else None
+        if outcome is None:
+            scan = f"timeout at k={k}"
+            break
+        coloring, stats, _ = outcome
+        scan_nodes += stats["nodes"]
+        if coloring is not None:
+            scan = f"k={k}"
+            break
+        k += 1
+    scan_seconds = time.perf_counter() - scan_began
+
+    found = f"{result['num_colors']} ({'optimal' if result['optimal'] else 'timeout'})"
+    print(f"  {'solver':<34}{'result':>18}{'nodes':>12}{'seconds':>10}")
+    print(f"  {'chromatic_number':<34}{found:>18}{result['nodes']:>12}{seconds:>10.3f}")
+    print(f"  {'graph_coloring_dsatur per k':<34}{scan:>18}{scan_nodes:>12}{scan_seconds:>10.3f}")
+    for elapsed, lower, upper in result["bounds"]:
+        print(f"    {elapsed:>8.3f}s  {lower} <= chi <= {upper}")
+
+
+def compare_preprocessing(name, graph, num_colors, time_limit):
+    """Prints the reductions graph_coloring_preprocessed makes and its time against the other solvers."""
+    stats = {}
+    graph_coloring_preprocessed(graph, num_colors, stats)
+    solvers = [("graph_coloring_branch_and_bound", graph_coloring_branch_and_bound),
+               ("graph_coloring_dsatur", graph_coloring_dsatur),
+               ("graph_coloring_preprocessed", graph_coloring_preprocessed)]
+    compare_solvers(name, graph, num_colors, solvers, time_limit)
+    print(f"  (peeled {stats['peeled']}, merged {stats['merged']}, "
+          f"{stats['components']} component(s) left to search)")
+
+
+def compare_parallel(name, graph, num_colors, time_limit):
+    """Prints serial DSATUR against split-tree search on 1, 2, 4, ... processes and a portfolio."""
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    solvers = [("graph_coloring_dsatur", graph_coloring_dsatur)]
+    for processes in counts:
+        solvers.append((f"parallel split, {processes} process(es)",
+                        lambda graph, k, stats, processes=processes:
+                        parallel_graph_coloring(graph, k, processes=processes, stats=stats)))
+    strategies = ["dsatur", "smallest-last"] + ["random"] * max(counts[-1] - 2, 1)
+    solvers.append((f"parallel portfolio of {len(strategies)}",
+                    lambda graph, k, stats: parallel_graph_coloring(graph, k, portfolio=strategies, stats=stats)))
+    compare_solvers(name, graph, num_colors, solvers, time_limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--time-limit", type=float, default=20, help="seconds per solver run")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--dimacs", nargs="*", default=[], metavar="FILE:K",
+                        help="DIMACS .col files for the parallel scaling runs, each with a color count")
+    args = parser.parse_args()
+
+    solvers = [("graph_coloring_branch_and_bound", graph_coloring_branch_and_bound),
+               ("graph_coloring_dsatur", graph_coloring_dsatur)]
+    for num_vertices, density, num_colors in ((30, 0.3, 5), (40, 0.15, 4), (50, 0.3, 6), (100, 0.1, 4), (300, 0.05, 6)):
+        graph = random_graph(num_vertices, density, args.seed)
+        compare_solvers(f"G({num_vertices}, {density})", graph, num_colors, solvers, args.time_limit)
+    for num_vertices, density in ((50, 0.3), (80, 0.2), (200, 0.1)):
+        compare_chromatic(f"G({num_vertices}, {density})", random_graph(num_vertices, density, args.seed), args.time_limit)
+
+    for communities, density, num_colors in ((20, 0.6, 5), (200, 0.5, 6)):
+        compare_preprocessing(f"communities x{communities}", community_graph(communities, 12, density, args.seed),
+                              num_colors, args.time_limit)
+    compare_preprocessing("G(2000, 0.002)", random_graph(2000, 0.002, args.seed), 3, args.time_limit)
+
+    # Parallel scaling on random graphs near the coloring threshold and DIMACS-style instances
+    instances = [("G(300, 0.05)", random_graph(300, 0.05, args.seed), 6),
+                 ("G(120, 0.1)", random_graph(120, 0.1, args.seed), 5),
+                 ("queen7_7", queen_graph(7), 7),
+                 ("myciel5", mycielski_graph(5), 6)]
+    for spec in args.dimacs:
+        path, _, num_colors = spec.rpartition(":")
+        instances.append((os.path.basename(path), read_dimacs(path), int(num_colors)))
+    for name, graph, num_colors in instances:
+        compare_parallel(name, graph, num_colors, args.time_limit)
+
+
+if __name__ == "__main__":
+    main()
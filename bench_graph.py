@@ -0,0 +1,146 @@
+"""
+Benchmarks for the graph searches in dfsAndbfsGraph.py.
+
+Usage:
+    python bench_graph.py [--nodes 200000] [--edges 2000000] [--seed 0]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from dfsAndbfsGraph import (CSRGraph, bfs_levels, bidirectional_search_graph, breadth_first_search_graph,
+                            depth_first_search_graph, iter_breadth_first, load_edge_list,
+                            multi_source_search_graph, reverse_graph)
+
+
+def random_graph(nodes, edges, seed=0):
+    """Returns an adjacency dict with string labels and edges random directed edges."""
+    rng = random.Random(seed)
+    labels = [f"n{i}" for i in range(nodes)]
+    graph = {label: [] for label in labels}
+    for _ in range(edges):
+        graph[labels[rng.randrange(nodes)]].append(labels[rng.randrange(nodes)])
+    return graph
+
+
+def timed(function, *args):
+    """Returns (result, seconds) for one call, or (exception, seconds) if it raised."""
+    began = time.perf_counter()
+    try:
+        result = function(*args)
+    except RecursionError as error:
+        result = error
+    return result, time.perf_counter() - began
+
+
+def compare_searches(graph, start, goal):
+    """Prints time for the dict-based searches and the CSRGraph ones on one query."""
+    csr, build_time = timed(CSRGraph, graph)
+    print(f"{csr.num_nodes} nodes, {csr.num_edges} edges, query {start} -> {goal}")
+    print(f"  {'mode':<32}{'seconds':>10}{'path length':>16}")
+    print(f"  {'CSRGraph build (once)':<32}{build_time:>10.3f}{'':>16}")
+
+    for name, function, arguments in (
+            ("breadth_first_search_graph", breadth_first_search_graph, (graph, start, goal)),
+            ("CSRGraph.breadth_first_search", csr.breadth_first_search, (start, goal)),
+            ("depth_first_search_graph", depth_first_search_graph, (graph, start, goal)),
+            ("CSRGraph.depth_first_search", csr.depth_first_search, (start, goal))):
+        result, seconds = timed(function, *arguments)
+        if isinstance(result, RecursionError):
+            length = "RecursionError"
+        else:
+            length = "no path" if result is None else str(len(result))
+        print(f"  {name:<32}{seconds:>10.3f}{length:>16}")
+
+
+def bfs_visited(graph, start, goal):
+    """Returns how many nodes breadth_first_search_graph discovers before it reaches goal."""
+    visited = 0
+    for node, _, _ in iter_breadth_first(graph, start):
+        visited += 1
+        if node == goal:
+            break
+    return visited
+
+
+def compare_visited(graph, queries, sources=4, seed=0):
+    """Prints nodes visited and time for BFS, bidirectional BFS and multi-source BFS."""
+    rng = random.Random(seed + 2)
+    reverse, reverse_time = timed(reverse_graph, graph)
+    print(f"visited nodes over {len(queries)} queries (reverse graph built once in {reverse_time:.3f}s)")
+    print(f"  {'mode':<32}{'seconds':>10}{'visited':>16}")
+
+    expected, bfs_time = timed(lambda: [breadth_first_search_graph(graph, s, g) for s, g in queries])
+    bfs_visited_total = sum(bfs_visited(graph, s, g) for s, g in queries)
+    print(f"  {'breadth_first_search_graph':<32}{bfs_time:>10.3f}{bfs_visited_total:>16}")
+
+    stats = {}
+    visited = 0
+    paths = []
+    began = time.perf_counter()
+    for start, goal in queries:
+        paths.append(bidirectional_search_graph(graph, start, goal, reverse, stats))
+        visited += stats["visited"]
+    print(f"  {'bidirectional_search_graph':<32}{time.perf_counter() - began:>10.3f}{visited:>16}")
+    for path, reference in zip(paths, expected):
+        assert (path is None) == (reference is None) and (path is None or len(path) == len(reference)), \
+            "bidirectional path length differs"
+
+    labels = list(graph)
+    starts = rng.sample(labels, sources)
+    goals = rng.sample(labels, sources)
+    _, pairwise_time = timed(lambda: [breadth_first_search_graph(graph, s, g) for s in starts for g in goals])
+    pairwise_visited = sum(bfs_visited(graph, s, g) for s in starts for g in goals)
+    path, multi_time = timed(multi_source_search_graph, graph, starts, goals, stats)
+    print(f"  {f'BFS per pair ({sources}x{sources})':<32}{pairwise_time:>10.3f}{pairwise_visited:>16}")
+    print(f"  {'multi_source_search_graph':<32}{multi_time:>10.3f}{stats['visited']:>16}")
+
+
+def compare_edge_list(nodes, edges, seed=0):
+    """Prints edge-list loading time and single-source BFS time per node loop vs per level."""
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.txt")
+        with open(path, "w") as handle:
+            handle.write("# source target\n")
+            for _ in range(edges):
+                handle.write(f"{rng.randrange(nodes)} {rng.randrange(nodes)}\n")
+        csr, load_time = timed(load_edge_list, path)
+        size = os.path.getsize(path)
+
+    graph = {node: [int(csr.targets[position]) for position in range(csr.offsets[node], csr.offsets[node + 1])]
+             for node in range(csr.num_nodes)}
+    per_node, per_node_time = timed(lambda: {node: depth for node, depth, _ in iter_breadth_first(graph, 0)})
+    levels, levels_time = timed(bfs_levels, csr, 0)
+    assert sum(1 for distance in levels if distance >= 0) == len(per_node), "bfs_levels reached different nodes"
+
+    print(f"edge list: {edges} edges, {size / 1e6:.1f} MB of text")
+    print(f"  {'mode':<32}{'seconds':>10}")
+    print(f"  {'load_edge_list':<32}{load_time:>10.3f}")
+    print(f"  {'iter_breadth_first (per node)':<32}{per_node_time:>10.3f}")
+    print(f"  {'bfs_levels (per frontier)':<32}{levels_time:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=200000, help="number of nodes")
+    parser.add_argument("--edges", type=int, default=2000000, help="number of directed edges")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    graph = random_graph(args.nodes, args.edges, args.seed)
+    # An unreachable goal makes every search visit everything reachable from the start
+    graph["island"] = []
+    compare_searches(graph, "n0", "island")
+    compare_searches(graph, "n0", f"n{args.nodes - 1}")
+
+    rng = random.Random(args.seed + 1)  # Not the edge generator's sequence
+    queries = [(f"n{rng.randrange(args.nodes)}", f"n{rng.randrange(args.nodes)}") for _ in range(10)]
+    compare_visited(graph, queries, seed=args.seed)
+    compare_edge_list(args.nodes, args.edges, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmarks for the forward chaining in helpdesk.py.
+
+Usage:
+    python bench_rules.py [--rules 10000 100000] [--queries 1000] [--tickets 100000] [--seed 0]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import helpdesk
+
+
+def random_rules(count, attributes=200, values=20, seed=0):
+    """
+    Returns count rules testing 1-3 random attribute/value pairs.
+
+    A tenth of the rules derive a "stage" fact that other rules test, so facts chain
+    through several rules.
+    """
+    rng = random.Random(seed)
+    rules = []
+    for i in range(count):
+        condition = {f"attr{rng.randrange(attributes)}": f"v{rng.randrange(values)}" for _ in range(rng.randint(1, 3))}
+        if rng.random() < 0.1:
+            condition[f"stage{rng.randrange(attributes)}"] = "yes"
+        if rng.random() < 0.1:
+            action = {f"stage{rng.randrange(attributes)}": "yes"}
+        else:
+            action = {"action": f"action{i}"}
+        rules.append((condition, action))
+    return rules
+
+
+def random_facts(count, attributes=200, values=20, size=8, seed=0):
+    """Returns count fact dicts of size random attribute/value pairs."""
+    rng = random.Random(seed)
+    return [{f"attr{rng.randrange(attributes)}": f"v{rng.randrange(values)}" for _ in range(size)}
+            for _ in range(count)]
+
+
+def compare(count, queries, seed=0):
+    """
+    Prints per-query and per-update time for forward_chaining and RuleEngine on count rules.
+
+    The vocabulary grows with the knowledge base (one attribute per 50 rules), as it does
+    when rules are added for new kinds of problems, so each fact is tested by about as
+    many rules at every size.
+    """
+    attributes = max(count // 50, 1)
+    rules = random_rules(count, attributes, seed=seed)
+    facts = random_facts(queries, attributes, seed=seed + 1)
+
+    began = time.perf_counter()
+    engine = helpdesk.RuleEngine(rules)
+    build_time = time.perf_counter() - began
+
+    helpdesk.KNOWLEDGE_BASE = rules
+    began = time.perf_counter()
+    expected = [helpdesk.forward_chaining(query) for query in facts]
+    scan_time = time.perf_counter() - began
+    began = time.perf_counter()
+    matched = [engine.first_match(query) for query in facts]
+    match_time = time.perf_counter() - began
+    assert matched == expected, "first_match differs from forward_chaining"
+
+    # Stream facts into one working memory: assert a fact and chain, then retract an old one
+    rng = random.Random(seed + 2)
+    asserted = []
+    fired = 0
+    began = time.perf_counter()
+    for query in facts:
+        pair = rng.choice(list(query.items()))
+        engine.assert_facts([pair])
+        fired += len(engine.run())
+        asserted.append(pair)
+        if len(asserted) > 50:
+            engine.retract_facts([asserted.pop(0)])
+    update_time = time.perf_counter() - began
+
+    # Retraction must leave exactly what chaining the remaining given facts derives from
+    # scratch, including where "stage" rules support each other in a cycle
+    fresh = helpdesk.RuleEngine(rules)
+    fresh.assert_facts([pair for pair, support in engine.facts.items() if None in support])
+    fresh.run()
+    assert engine.facts.keys() == fresh.facts.keys(), "facts after retraction differ from a fresh run"
+
+    print(f"{count} rules ({len(engine._node_sizes)} condition nodes, built in {build_time:.2f}s)")
+    print(f"  {'mode':<36}{'us/call':>12}")
+    print(f"  {'forward_chaining (scan)':<36}{1e6 * scan_time / queries:>12.1f}")
+    print(f"  {'RuleEngine.first_match':<36}{1e6 * match_time / queries:>12.1f}")
+    print(f"  {'assert + run + retract':<36}{1e6 * update_time / queries:>12.1f}  ({fired} rules fired)")
+
+
+def check_cyclic_retraction():
+    """Checks that retracting a fact also retracts the facts that only derive each other from it."""
+    engine = helpdesk.RuleEngine([({"a": 1}, {"b": 1}), ({"b": 1}, {"a": 1})])
+    engine.assert_facts({"a": 1})
+    engine.run()
+    assert engine.facts.keys() == {("a", 1), ("b", 1)}
+    engine.retract_facts({"a": 1})
+    engine.run()
+    assert not engine.facts, "facts in a support cycle survived retraction"
+    assert not engine.fired
+
+
+def compare_loading(count, tickets, seed=0):
+    """Prints knowledge base load time from JSON and from the compiled cache, then triage throughput."""
+    attributes = max(count // 50, 1)
+    rules = random_rules(count, attributes, seed=seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "kb.json")
+        helpdesk.save_knowledge_base(path, rules, {})
+        began = time.perf_counter()
+        helpdesk.load_knowledge_base(path)
+        cold_time = time.perf_counter() - began
+        began = time.perf_counter()
+        engine, _ = helpdesk.load_knowledge_base(path)
+        cached_time = time.perf_counter() - began
+        size = os.path.getsize(path)
+
+    # Tickets carry list-valued fields, as JSONL exports do; they must not break matching
+    stream = [dict(facts, id=i, tags=["urgent"] if i % 2 else [])
+              for i, facts in enumerate(random_facts(tickets, attributes, seed=seed + 3))]
+    began = time.perf_counter()
+    results = list(helpdesk.triage(stream, engine))
+    triage_time = time.perf_counter() - began
+    helpdesk.KNOWLEDGE_BASE = rules
+    for ticket, result in zip(stream[:1000], results):
+        expected = helpdesk.forward_chaining({key: value for key, value in ticket.items() if key != "id"})
+        assert result["action"] == (None if expected is None else expected.get("action")), "triage differs from forward_chaining"
+    recommended = sum(1 for result in results if result["action"] is not None)
+
+    print(f"knowledge base file with {count} rules ({size / 1e6:.1f} MB of JSON)")
+    print(f"  {'mode':<36}{'seconds':>12}")
+    print(f"  {'parse + compile + write cache':<36}{cold_time:>12.3f}")
+    print(f"  {'load compiled cache':<36}{cached_time:>12.3f}")
+    print(f"  triage: {tickets / triage_time:.0f} tickets/s, {recommended} of {tickets} with an action")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, nargs="+", default=[10000, 100000], help="knowledge base sizes")
+    parser.add_argument("--queries", type=int, default=1000, help="fact sets per size")
+    parser.add_argument("--tickets", type=int, default=100000, help="tickets for the triage run")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    check_cyclic_retraction()
+    for count in args.rules:
+        compare(count, args.queries, args.seed)
+    compare_loading(args.rules[-1], args.tickets, args.seed)
+
+
+if __name__ == "__main__":
+    main()
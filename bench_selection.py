@@ -0,0 +1,110 @@
+"""
+Benchmarks for the interval scheduling functions in selectionsort.py.
+
+Usage:
+    python bench_selection.py [--max-size 10000000] [--stream-size 1000000] [--seed 0]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from selectionsort import (external_activity_selection, greedy_activity_selection, interval_partitioning,
+                           iter_activity_selection, read_activities, weighted_interval_scheduling)
+
+
+def random_intervals(count, seed=0):
+    """Returns (starts, finishes, weights) NumPy arrays for count random jobs over a long horizon."""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(0, 10 * count, count)
+    finishes = starts + rng.integers(1, 200, count)
+    weights = rng.integers(1, 100, count)
+    return starts, finishes, weights
+
+
+def timed(function, *args):
+    """Returns (result, seconds) for one call."""
+    began = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - began
+
+
+def compare_sizes(sizes, seed=0, greedy_limit=10 ** 6):
+    """Prints time per function for each number of intervals."""
+    print(f"  {'intervals':>12}{'greedy (list)':>16}{'unweighted':>14}{'weighted':>14}{'partitioning':>14}{'resources':>11}")
+    for count in sizes:
+        starts, finishes, weights = random_intervals(count, seed)
+        greedy_time = "-"
+        if count <= greedy_limit:
+            # The list-of-tuples function, including building its input
+            greedy, seconds = timed(lambda: greedy_activity_selection(list(zip(starts.tolist(), finishes.tolist()))))
+            greedy_time = f"{seconds:.3f}"
+        (selected, _), unweighted_time = timed(weighted_interval_scheduling, starts, finishes)
+        if count <= greedy_limit:
+            assert selected == len(greedy), "unweighted selection count differs from greedy_activity_selection"
+        _, weighted_time = timed(weighted_interval_scheduling, starts, finishes, weights)
+        (resources, _), partition_time = timed(interval_partitioning, starts, finishes)
+        print(f"  {count:>12}{greedy_time:>16}{unweighted_time:>14.3f}{weighted_time:>14.3f}"
+              f"{partition_time:>14.3f}{resources:>11}")
+
+
+def peak_memory(function):
+    """Returns (result, seconds, peak bytes traced) for function(); tracing slows the call down."""
+    tracemalloc.start()
+    try:
+        result, seconds = timed(function)
+        return result, seconds, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def compare_streaming(count, run_size, seed=0):
+    """Prints time and peak memory for in-memory, presorted streaming and external-sort selection from a file."""
+    starts, finishes, _ = random_intervals(count, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        unsorted_path = os.path.join(directory, "activities.txt")
+        sorted_path = os.path.join(directory, "sorted.txt")
+        np.savetxt(unsorted_path, np.column_stack((starts, finishes)), fmt="%d")
+        order = np.argsort(finishes, kind="stable")
+        np.savetxt(sorted_path, np.column_stack((starts[order], finishes[order])), fmt="%d")
+
+        print(f"selection from a file of {count} activities ({os.path.getsize(unsorted_path) / 1e6:.1f} MB), "
+              f"runs of {run_size}")
+        print(f"  {'mode':<36}{'seconds':>10}{'peak MB':>10}{'selected':>10}")
+        reference = None
+        for label, function in (
+                ("greedy_activity_selection", lambda: greedy_activity_selection(list(read_activities(unsorted_path)))),
+                ("iter_activity_selection (sorted)", lambda: sum(1 for _ in iter_activity_selection(
+                    read_activities(sorted_path)))),
+                ("external_activity_selection", lambda: sum(1 for _ in external_activity_selection(
+                    read_activities(unsorted_path), run_size, directory)))):
+            result, seconds = timed(function)
+            _, _, peak = peak_memory(function)
+            selected = result if isinstance(result, int) else len(result)
+            if reference is None:
+                reference = selected
+            assert selected == reference, f"{label} selected a different number of activities"
+            print(f"  {label:<36}{seconds:>10.3f}{peak / 1e6:>10.1f}{selected:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=10 ** 7, help="largest number of intervals")
+    parser.add_argument("--stream-size", type=int, default=10 ** 6, help="activities for the streaming comparison")
+    parser.add_argument("--run-size", type=int, default=10 ** 5, help="activities per external sort run")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    sizes = [10 ** 4]
+    while sizes[-1] * 10 <= args.max_size:
+        sizes.append(sizes[-1] * 10)
+    print("seconds per call")
+    compare_sizes(sizes, args.seed)
+    compare_streaming(args.stream_size, args.run_size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,180 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
 import re
+import sys
 import random
+import time
+from collections import OrderedDict, deque
+
+# Possible responses by pattern. Patterns are tried in this order against the
+# normalized input and the first one that matches wins; capture groups (e.g. the order
+# number) are substituted into the chosen response.
+RESPONSE_PATTERNS = {
+    r".*hello.*": [
+        "Hello! How can I assist you today?",
+        "Hi there! What can I do for you?",
+        "Greetings! How may I help?"
+    ],
+    r".*goodbye.*": [
+        "Goodbye! Have a great day!",
+        "Bye! Feel free to reach out again if you need anything.",
+        "Farewell!"
+    ],
+    r".*thank you.*": [
+        "You're welcome!",
+        "No problem!",
+        "Happy to help!"
+    ],
+    r".*order status.*": [
+        "To check your order status, please provide your order number.",
+        "Can I get your order number to look that up for you?",
+        "Please provide your order number."
+    ],
+    r".*order number (\d+).*": [  # Using a capture group to extract the number
+        "Okay, I'm checking the status of order number {}.  It is currently being processed.",
+        "Order number {} is being shipped to you.",
+        "I found order number {}.  It was delivered on [some date]."
+    ],
+    r".*track order (\d+).*": [ #order tracking
+        "Your order number {} is currently in transit.",
+        "I am looking up the tracking information for order number {}.",
+        "To track your order, please visit our website and enter {}."
+    ],
+    r".*delivery.*": [
+        "Our standard delivery time is 3-5 business days.",
+        "Delivery usually takes between 3 and 7 days.",
+        "For expedited shipping, it's 1-2 business days."
+    ],
+    r".*return policy.*": [
+        "Our return policy allows returns within 30 days of purchase.",
+        "You can return items within 30 days for a full refund.",
+        "Please see our website for details on our return policy."
+    ],
+    r".*contact.*": [
+        "You can contact us via email at support@example.com or by phone at 123-456-7890.",
+        "Our customer service email is support@example.com.  You can also call us.",
+        "Reach out to us at support@example.com or call 123-456-7890."
+    ],
+    r".*help.*": [
+        "I can help you with order status, delivery information, returns, and contact information.",
+        "How can I help you today?",
+        "What information are you looking for?"
+    ],
+    r".*cancel order (\d+).*": [
+        "I can cancel order number {}.  Are you sure you want to cancel it?",
+        "Order number {} can be cancelled. Please confirm your cancellation.",
+        "To cancel order {}, I will need your confirmation."
+    ],
+    r".*yes.*cancel order (\d+).*": [
+        "Your order number {} has been cancelled.",
+        "Order {} is now cancelled.",
+        "I have cancelled order {}."
+    ],
+    r".*no.*cancel order (\d+).*": [
+        "Okay, I have not cancelled order number {}.",
+        "Order {} cancellation aborted.",
+        "I will proceed with order {}."
+    ],
+    r".*change address.*order (\d+).*": [
+        "To change the address for order {}, please provide the new address.",
+        "Please provide the new address for order {}.",
+        "I can help change the address for order {}. What is the new address?"
+    ],
+    r".*new address for order (\d+) is (.*).*": [
+        "The address for order {} has been changed to {}.",
+        "I've updated the address for order {} to {}.",
+        "Okay, order {} will be shipped to {}."
+    ],
+    r".*default.*": [
+        "I am a basic chatbot designed to answer common customer service questions.",
+        "I am a simple chatbot.",
+        "I am here to assist you."
+    ],
+}
+
+_PUNCTUATION = re.compile(r"[^\w\s']")
+_WILDCARDS_AND_GROUPS = re.compile(r"\.\*|\([^()]*\)")
+_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _compile_patterns(patterns):
+    """
+    Compiles the response patterns into (pattern, keywords, regex, responses) entries.
+
+    The keywords are the literal pieces of a pattern between its .* wildcards and
+    capture groups; each must appear in any input the pattern matches, so plain
+    substring tests rule most patterns out before a regex runs. A pattern that is just
+    one literal wrapped in .* matches exactly when that literal appears, so it gets no
+    regex at all (None).
+    """
+    compiled = []
+    for pattern, responses in patterns.items():
+        regex = re.compile(pattern)
+        keywords = tuple(piece for piece in _WILDCARDS_AND_GROUPS.split(pattern)
+                         if piece and not _METACHARACTERS.intersection(piece))
+        if not regex.groups and len(keywords) == 1 and pattern == f".*{keywords[0]}.*":
+            regex = None
+        compiled.append((pattern, keywords, regex, responses))
+    return compiled
+
+
+# Compiled once at import time
+_INTENTS = _compile_patterns(RESPONSE_PATTERNS)
+
+
+def _normalize(user_input):
+    """Lowercases the input, strips surrounding whitespace and removes punctuation except apostrophes."""
+    return _PUNCTUATION.sub('', user_input.lower().strip())
+
+
+def _match(text, stats=None):
+    """
+    Returns (pattern, responses, captured groups) for normalized text, or None if nothing matches.
+
+    If stats is a dict, stats["regex"] is set to the number of regex searches run.
+    """
+    searches = 0
+    matched = None
+    for pattern, keywords, regex, responses in _INTENTS:
+        for keyword in keywords:
+            if keyword not in text:
+                break
+        else:
+            if regex is None:
+                matched = pattern, responses, ()
+                break
+            searches += 1
+            match = regex.search(text)
+            if match:
+                matched = pattern, responses, match.groups()
+                break
+    if stats is not None:
+        stats["regex"] = searches
+    return matched
+
+
+def match_intent(user_input, stats=None):
+    """
+    Finds which response pattern get_response would use for the user's input.
+
+    Args:
+        user_input (str): The text input from the user.
+        stats (dict, optional): If given, "regex" is set to the number of regex searches
+                                the keyword prefilter let through for this input.
+
+    Returns:
+        tuple: (pattern, captured groups), or (None, ()) if no pattern matches.
+    """
+    matched = _match(_normalize(user_input), stats)
+    if matched is None:
+        return None, ()
+    pattern, _, groups = matched
+    return pattern, groups
+
 
 def get_response(user_input):
     """
@@ -11,119 +186,336 @@ def get_response(user_input):
     Returns:
         str: The chatbot's response to the user.
     """
-    # Convert user input to lowercase for easier matching
-    user_input = user_input.lower()
-
-    # Remove any leading/trailing whitespace
-    user_input = user_input.strip()
-
-    # Remove punctuation (except for apostrophes)
-    user_input = re.sub(r"[^\w\s']", '', user_input)
-
-    # Split the input into a list of words
-    words = user_input.split()
-
-    # Define a dictionary of possible responses based on keywords
-    response_patterns = {
-        r".*hello.*": [
-            "Hello! How can I assist you today?",
-            "Hi there! What can I do for you?",
-            "Greetings! How may I help?"
-        ],
-        r".*goodbye.*": [
-            "Goodbye! Have a great day!",
-            "Bye! Feel free to reach out again if you need anything.",
-            "Farewell!"
-        ],
-        r".*thank you.*": [
-            "You're welcome!",
-            "No problem!",
-            "Happy to help!"
-        ],
-        r".*order status.*": [
-            "To check your order status, please provide your order number.",
-            "Can I get your order number to look that up for you?",
-            "Please provide your order number."
-        ],
-        r".*order number (\d+).*": [  # Using a capture group to extract the number
-            "Okay, I'm checking the status of order number {}.  It is currently being processed.",
-            "Order number {} is being shipped to you.",
-            "I found order number {}.  It was delivered on [some date]."
-        ],
-        r".*track order (\d+).*": [ #order tracking
-            "Your order number {} is currently in transit.",
-            "I am looking up the tracking information for order number {}.",
-            "To track your order, please visit our website and enter {}."
-        ],
-        r".*delivery.*": [
-            "Our standard delivery time is 3-5 business days.",
-            "Delivery usually takes between 3 and 7 days.",
-            "For expedited shipping, it's 1-2 business days."
-        ],
-        r".*return policy.*": [
-            "Our return policy allows returns within 30 days of purchase.",
-            "You can return items within 30 days for a full refund.",
-            "Please see our website for details on our return policy."
-        ],
-        r".*contact.*": [
-            "You can contact us via email at support@example.com or by phone at 123-456-7890.",
-            "Our customer service email is support@example.com.  You can also call us.",
-            "Reach out to us at support@example.com or call 123-456-7890."
-        ],
-        r".*help.*": [
-            "I can help you with order status, delivery information, returns, and contact information.",
-            "How can I help you today?",
-            "What information are you looking for?"
-        ],
-        r".*cancel order (\d+).*": [
-            "I can cancel order number {}.  Are you sure you want to cancel it?",
-            "Order number {} can be cancelled. Please confirm your cancellation.",
-            "To cancel order {}, I will need your confirmation."
-        ],
-        r".*yes.*cancel order (\d+).*": [
-            "Your order number {} has been cancelled.",
-            "Order {} is now cancelled.",
-            "I have cancelled order {}."
-        ],
-        r".*no.*cancel order (\d+).*": [
-            "Okay, I have not cancelled order number {}.",
-            "Order {} cancellation aborted.",
-            "I will proceed with order {}."
-        ],
-        r".*change address.*order (\d+).*": [
-            "To change the address for order {}, please provide the new address.",
-            "Please provide the new address for order {}.",
-            "I can help change the address for order {}. What is the new address?"
-        ],
-        r".*new address for order (\d+) is (.*).*": [
-            "The address for order {} has been changed to {}.",
-            "I've updated the address for order {} to {}.",
-            "Okay, order {} will be shipped to {}."
-        ],
-        r".*default.*": [
-            "I am a basic chatbot designed to answer common customer service questions.",
-            "I am a simple chatbot.",
-            "I am here to assist you."
-        ],
-    }
-
-    # Check for a match in the response patterns
-    for pattern, responses in response_patterns.items():
-        match = re.search(pattern, user_input)
-        if match:
-            # If there's a match, extract any captured groups (e.g., order number)
-            format_args = match.groups()
-            # Choose a random response from the list of possible responses
-            response = random.choice(responses)
-            # Format the response with the captured groups, if any
-            if format_args:
-                return response.format(*format_args)
-            else:
-                return response
+    # Lowercase, strip and remove punctuation, then find the first matching pattern
+    matched = _match(_normalize(user_input))
+    if matched:
+        _, responses, format_args = matched
+        # Choose a random response from the list of possible responses
+        response = random.choice(responses)
+        # Format the response with the captured groups, if any
+        if format_args:
+            return response.format(*format_args)
+        else:
+            return response
 
     # Default response if no pattern matches
     return "I'm sorry, I don't understand.  Could you please rephrase your question?"
 
+def _choice_index(seed, index, count):
+    """
+    Picks one of count responses for message number index, reproducibly.
+
+    A splitmix64 step over (seed, index) stands in for a seeded random.Random per
+    message, which would cost far more to create; the choice depends only on the seed
+    and the message's position, not on how messages are split between processes.
+    """
+    value = (seed * 0x9E3779B97F4A7C15 + index + 1) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return (value ^ (value >> 31)) % count
+
+
+def classify_message(user_input, seed=0, index=0):
+    """
+    Classifies one message the way get_response answers it, with a reproducible response.
+
+    Args:
+        user_input (str): The text input from the user.
+        seed (int): Seed for choosing among a pattern's responses.
+        index (int): The message's position in its batch; with the seed it fixes the choice.
+
+    Returns:
+        dict: "intent" (the matched pattern, or None), "groups" (the captured groups)
+              and "response" (the formatted response).
+    """
+    matched = _match(_normalize(user_input))
+    if matched is None:
+        return {"intent": None, "groups": [],
+                "response": "I'm sorry, I don't understand.  Could you please rephrase your question?"}
+    pattern, responses, format_args = matched
+    response = responses[_choice_index(seed, index, len(responses))]
+    return {"intent": pattern, "groups": list(format_args),
+            "response": response.format(*format_args) if format_args else response}
+
+
+def _classify_chunk(task):
+    """Classifies one chunk of messages in a classify_batch worker."""
+    start, seed, messages = task
+    return [classify_message(message, seed, start + offset) for offset, message in enumerate(messages)]
+
+
+def classify_batch(messages, seed=0, processes=None, chunk_size=10000):
+    """
+    Classifies a stream of messages with a pool of worker processes.
+
+    Messages are read chunk_size at a time and at most two chunks per process are in
+    flight, so memory stays bounded however long the input is; results are yielded in
+    input order. Each response is chosen by classify_message from the seed and the
+    message's position, so the output is the same for any number of processes.
+
+    Args:
+        messages (iterable of str): The messages, e.g. from read_messages.
+        seed (int): Seed for choosing responses.
+        processes (int, optional): The number of worker processes (default: CPU count).
+                                   With 1, the messages are classified in this process.
+        chunk_size (int): The number of messages sent to a worker at a time.
+
+    Yields:
+        dict: classify_message's result for each message, in input order.
+    """
+    processes = processes or os.cpu_count() or 1
+    messages = iter(messages)
+    if processes == 1:
+        for index, message in enumerate(messages):
+            yield classify_message(message, seed, index)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        pending = deque()
+        start = 0
+        while True:
+            while len(pending) < 2 * processes:
+                chunk = list(itertools.islice(messages, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_classify_chunk, ((start, seed, chunk),)))
+                start += len(chunk)
+            if not pending:
+                return
+            yield from pending.popleft().get()
+
+
+def read_messages(path):
+    """
+    Yields messages from a text file (one per line) or a JSONL file.
+
+    A file ending in .jsonl holds one JSON value per line: either a string or an object
+    whose "message" (or "text") field is the message. Blank lines are skipped in both.
+    """
+    jsonl = path.endswith(".jsonl")
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            if not line.strip():
+                continue
+            if not jsonl:
+                yield line.rstrip("\n")
+                continue
+            record = json.loads(line)
+            yield record if isinstance(record, str) else record.get("message", record.get("text", ""))
+
+
+def run_classification(path, output=None, seed=0, processes=None, chunk_size=10000):
+    """
+    Writes one JSON line per message of the input file with its intent, groups and response.
+
+    Args:
+        path (str): The input file (see read_messages).
+        output (str, optional): Where to write the JSONL results (default: standard output).
+        seed (int): Seed for choosing responses.
+        processes (int, optional): The number of worker processes (default: CPU count).
+        chunk_size (int): The number of messages sent to a worker at a time.
+    """
+    handle = open(output, "w", encoding="utf-8") if output else sys.stdout
+    try:
+        results = classify_batch(read_messages(path), seed, processes, chunk_size)
+        for index, result in enumerate(results):
+            result["index"] = index
+            handle.write(json.dumps(result) + "\n")
+    finally:
+        if output:
+            handle.close()
+
+
+# Multi-turn conversations: the cancel confirmation flow and remembered order numbers
+_ORDER_STATUS = r".*order status.*"
+_ORDER_NUMBER = r".*order number (\d+).*"
+_CANCEL = r".*cancel order (\d+).*"
+_CONFIRM_CANCEL = r".*yes.*cancel order (\d+).*"
+_ABORT_CANCEL = r".*no.*cancel order (\d+).*"
+_YES = re.compile(r"\b(?:yes|yeah|yep|sure|confirm)\b")
+_NO = re.compile(r"\b(?:no|nope|dont|don't)\b")
+
+
+class Session:
+    """
+    Conversation state for one user, a fixed-size record (no per-message history).
+
+    Attributes:
+        order (str or None): The last order number the user mentioned.
+        pending_cancel (str or None): The order awaiting a yes/no cancel confirmation.
+        last_active (float): time.monotonic() of the last message.
+    """
+    __slots__ = ("order", "pending_cancel", "last_active")
+
+    def __init__(self):
+        self.order = None
+        self.pending_cancel = None
+        self.last_active = time.monotonic()
+
+
+def respond(session, user_input):
+    """
+    Generates a response like get_response, using and updating the session's state.
+
+    A message ending in "order" (e.g. "track order", "cancel order") and a question
+    about the order status refer to the order discussed earlier. After "cancel order N",
+    a plain yes or no confirms or aborts cancelling N.
+
+    Args:
+        session (Session): The user's conversation state.
+        user_input (str): The text input from the user.
+
+    Returns:
+        str: The chatbot's response to the user.
+    """
+    session.last_active = time.monotonic()
+    text = _normalize(user_input)
+    if session.order is not None and text.endswith("order"):
+        text = f"{text} {session.order}"
+    matched = _match(text)
+
+    if matched is not None and matched[0] == _ORDER_STATUS and session.order is not None:
+        matched = (_ORDER_NUMBER, RESPONSE_PATTERNS[_ORDER_NUMBER], (session.order,))
+    elif matched is None and session.pending_cancel is not None:
+        answer = _CONFIRM_CANCEL if _YES.search(text) else _ABORT_CANCEL if _NO.search(text) else None
+        if answer is not None:
+            matched = (answer, RESPONSE_PATTERNS[answer], (session.pending_cancel,))
+
+    if matched is None:
+        return "I'm sorry, I don't understand.  Could you please rephrase your question?"
+    pattern, responses, format_args = matched
+    if format_args:
+        session.order = format_args[0]
+    if pattern == _CANCEL:
+        session.pending_cancel = format_args[0]
+    elif pattern in (_CONFIRM_CANCEL, _ABORT_CANCEL):
+        session.pending_cancel = None
+    response = random.choice(responses)
+    return response.format(*format_args) if format_args else response
+
+
+class ChatServer:
+    """
+    Serves many concurrent chat sessions over TCP or a Unix socket with asyncio.
+
+    The protocol is line based: each line a client sends is one message and gets one
+    line back. Every connection is a session with its own Session record. Sessions are
+    kept in least-recently-active order, so idle ones are evicted from the front: after
+    idle_timeout seconds without a message, or the oldest one when a new connection
+    would exceed max_sessions. Each session reads its next message only after the
+    previous response has been flushed to the client (writer.drain), so a client that
+    stops reading cannot make the server buffer unbounded output, and lines longer
+    than max_line bytes are rejected.
+
+    Attributes:
+        sessions (OrderedDict): Connection ID -> (Session, StreamWriter), oldest activity first.
+        evicted (int): The number of sessions closed for being idle or the oldest.
+        messages (int): The number of messages answered.
+    """
+
+    def __init__(self, max_sessions=10000, idle_timeout=300.0, max_line=4096):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_line = max_line
+        self.sessions = OrderedDict()
+        self.evicted = 0
+        self.messages = 0
+        self._ids = itertools.count()
+        self._server = None
+        self._sweeper = None
+        self._handlers = set()
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """Starts listening on host:port, or on the Unix socket at path if given; returns the asyncio server."""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path, limit=self.max_line)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=self.max_line, backlog=1024)
+        self._sweeper = asyncio.ensure_future(self._sweep())
+        return self._server
+
+    async def close(self):
+        """Stops listening and closes every session."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        if self._server is not None:
+            self._server.close()
+        for _, writer in list(self.sessions.values()):
+            writer.close()
+        self.sessions.clear()
+        # Let the handlers see their connections close and finish
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def _evict_oldest(self):
+        _, (_, writer) = self.sessions.popitem(last=False)
+        writer.close()  # The session's reader sees end of input and its handler exits
+        self.evicted += 1
+
+    async def _sweep(self):
+        """Evicts sessions idle for longer than idle_timeout, checking a few times per timeout."""
+        while True:
+            await asyncio.sleep(self.idle_timeout / 4)
+            cutoff = time.monotonic() - self.idle_timeout
+            while self.sessions and next(iter(self.sessions.values()))[0].last_active < cutoff:
+                self._evict_oldest()
+
+    async def _handle(self, reader, writer):
+        key = next(self._ids)
+        while len(self.sessions) >= self.max_sessions:
+            self._evict_oldest()
+        session = Session()
+        self.sessions[key] = (session, writer)
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Longer than max_line
+                    writer.write(b"Message too long.\n")
+                    break
+                if not line:
+                    break
+                reply = respond(session, line.decode("utf-8", "replace"))
+                if key in self.sessions:
+                    self.sessions.move_to_end(key)
+                self.messages += 1
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.pop(key, None)
+            self._handlers.discard(handler)
+            writer.close()
+
+
+def run_server(host="127.0.0.1", port=8765, path=None, **options):
+    """
+    Runs a ChatServer until interrupted.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The TCP port to listen on.
+        path (str, optional): Listen on this Unix socket path instead of TCP.
+        **options: max_sessions, idle_timeout and max_line for ChatServer.
+    """
+    async def serve():
+        server = ChatServer(**options)
+        listener = await server.start(host, port, path)
+        try:
+            await listener.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     """
     Main function to run the chatbot.  This function handles the interaction loop
@@ -132,13 +524,32 @@ def main():
     print("Welcome to our Customer Service Chatbot!")
     print("Type 'goodbye' to exit.")
 
+    session = Session()
     while True:
         user_input = input("You: ")
-        response = get_response(user_input)
+        response = respond(session, user_input)
         print("Chatbot:", response)
         if "goodbye" in response.lower():
             break
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Customer service chatbot.")
+    parser.add_argument("--serve", action="store_true", help="run the asyncio chat server instead of the console")
+    parser.add_argument("--classify", metavar="FILE", help="classify every message of a text or JSONL file")
+    parser.add_argument("--output", help="where to write --classify results (default: standard output)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --classify response choices")
+    parser.add_argument("--processes", type=int, help="worker processes for --classify (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="messages per --classify task")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="most concurrent sessions")
+    parser.add_argument("--idle-timeout", type=float, default=300.0, help="seconds before an idle session is closed")
+    args = parser.parse_args()
+    if args.classify:
+        run_classification(args.classify, args.output, args.seed, args.processes, args.chunk_size)
+    elif args.serve:
+        run_server(args.host, args.port, args.unix, max_sessions=args.max_sessions, idle_timeout=args.idle_timeout)
+    else:
+        main()
 
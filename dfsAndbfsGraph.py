@@ -1,3 +1,11 @@
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it speeds up load_edge_list and bfs_levels
+    np = None
+
 # Depth-First Search (DFS) for Graphs
 def depth_first_search_graph(graph, start_node, goal_node):
     visited = set()
@@ -54,21 +62,567 @@ def breadth_first_search_graph(graph, start_node, goal_node):
 
     return None  # No path found
 
-# Example Usage (Adjacency List Representation)
-graph = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
+# Streaming traversals: yield nodes as they are discovered
+def iter_depth_first(graph, start_node, max_depth=None):
+    """
+    Walks the graph depth-first with an explicit stack and yields each node as it is found.
+
+    Nodes come out in the same order depth_first_search_graph visits them, but there is
+    no recursion, so graphs of any depth work. Each item is (node, depth, parent), where
+    depth is the node's depth in the DFS tree and parent is None for the start. Stop
+    early by breaking out of the loop; memory is the visited set plus one neighbor
+    iterator per level of the current branch, never the whole result.
+
+    Args:
+        graph (dict): An adjacency list where keys are nodes and values are lists of neighbors.
+        start_node: The node to start from.
+        max_depth (int, optional): Do not go deeper than this many edges from the start.
+
+    Yields:
+        tuple: (node, depth, parent) for every reachable node, in visit order.
+    """
+    visited = {start_node}
+    yield start_node, 0, None
+    if max_depth is not None and max_depth <= 0:
+        return
+    stack = [(start_node, iter(graph.get(start_node, ())))]
+
+    while stack:
+        node, neighbors = stack[-1]
+        for neighbor in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                depth = len(stack)
+                yield neighbor, depth, node
+                if max_depth is None or depth < max_depth:
+                    stack.append((neighbor, iter(graph.get(neighbor, ()))))
+                break
+        else:
+            stack.pop()  # Backtrack
+
+
+def iter_breadth_first(graph, start_node, max_depth=None):
+    """
+    Walks the graph breadth-first and yields each node as it is found.
+
+    Nodes come out in the same order breadth_first_search_graph discovers them. Each
+    item is (node, depth, parent), where depth is the number of edges from the start
+    and parent is None for the start. The queue is a deque, so memory is the visited
+    set plus the current frontier.
+
+    Args:
+        graph (dict): An adjacency list where keys are nodes and values are lists of neighbors.
+        start_node: The node to start from.
+        max_depth (int, optional): Do not go further than this many edges from the start.
+
+    Yields:
+        tuple: (node, depth, parent) for every reachable node, in discovery order.
+    """
+    visited = {start_node}
+    yield start_node, 0, None
+    queue = deque([(start_node, 0)])
+
+    while queue:
+        node, depth = queue.popleft()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        for neighbor in graph.get(node, ()):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                yield neighbor, depth + 1, node
+                queue.append((neighbor, depth + 1))
+
+# Bidirectional and multi-source BFS
+def reverse_graph(graph):
+    """Returns the adjacency list with every edge reversed (node -> nodes that point to it)."""
+    reverse = {}
+    for node, neighbors in graph.items():
+        for neighbor in neighbors:
+            reverse.setdefault(neighbor, []).append(node)
+    return reverse
+
+
+def bidirectional_search_graph(graph, start_node, goal_node, reverse=None, stats=None):
+    """
+    Finds a shortest (fewest edges) path by searching forward from the start and backward
+    from the goal at the same time.
+
+    Each round expands one full level of whichever frontier is smaller, and the search
+    stops in the first round where the two sides meet, so on low-diameter graphs both
+    sides only go about half as deep as breadth_first_search_graph. The path has the
+    same length as the one breadth_first_search_graph returns.
+
+    Args:
+        graph (dict): An adjacency list where keys are nodes and values are lists of neighbors.
+        start_node: The node to start from.
+        goal_node: The node to reach.
+        reverse (dict, optional): reverse_graph(graph), if already built. Built here when
+                                  not given; pass it in when running many queries.
+        stats (dict, optional): Receives "visited", the number of nodes discovered.
+
+    Returns:
+        list or None: The nodes on a shortest path from start_node to goal_node, or None
+                      if no path is found.
+    """
+    if start_node == goal_node:
+        if stats is not None:
+            stats["visited"] = 1
+        return [start_node]
+    if reverse is None:
+        reverse = reverse_graph(graph)
+
+    # parents[node] is the previous node towards the side's origin
+    forward_parents = {start_node: None}
+    backward_parents = {goal_node: None}
+    forward_frontier = [start_node]
+    backward_frontier = [goal_node]
+
+    meeting = None
+    while forward_frontier and backward_frontier and meeting is None:
+        if len(forward_frontier) <= len(backward_frontier):
+            adjacency, parents, others, frontier = graph, forward_parents, backward_parents, forward_frontier
+        else:
+            adjacency, parents, others, frontier = reverse, backward_parents, forward_parents, backward_frontier
+
+        # Expand the whole level; of all meetings in it, keep the one with the shortest
+        # remaining distance on the other side
+        next_frontier = []
+        best = None
+        for node in frontier:
+            for neighbor in adjacency.get(node, ()):
+                if neighbor in parents:
+                    continue
+                parents[neighbor] = node
+                next_frontier.append(neighbor)
+                if neighbor in others:
+                    remaining = _depth(others, neighbor)
+                    if best is None or remaining < best:
+                        best, meeting = remaining, neighbor
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    if stats is not None:
+        stats["visited"] = len(forward_parents) + len(backward_parents)
+    if meeting is None:
+        return None  # No path found
+
+    path = []
+    node = meeting
+    while node is not None:
+        path.append(node)
+        node = forward_parents[node]
+    path.reverse()
+    node = backward_parents[meeting]
+    while node is not None:
+        path.append(node)
+        node = backward_parents[node]
+    return path
+
+
+def _depth(parents, node):
+    """Counts the parent links from node back to its search's origin."""
+    depth = 0
+    while parents[node] is not None:
+        node = parents[node]
+        depth += 1
+    return depth
+
+
+def multi_source_search_graph(graph, start_nodes, goal_nodes, stats=None):
+    """
+    Finds a shortest path from any of start_nodes to any of goal_nodes in one BFS.
+
+    All starts are queued at distance 0, so the first goal the search reaches is the
+    nearest goal to the nearest start. This replaces one breadth_first_search_graph
+    call per (start, goal) pair and returns a path of the same, minimal, length.
+
+    Args:
+        graph (dict): An adjacency list where keys are nodes and values are lists of neighbors.
+        start_nodes (iterable): The nodes to start from.
+        goal_nodes (iterable): The nodes to reach.
+        stats (dict, optional): Receives "visited", the number of nodes discovered.
+
+    Returns:
+        list or None: The nodes on a shortest path from one of start_nodes to one of
+                      goal_nodes, or None if no goal is reachable.
+    """
+    goals = set(goal_nodes)
+    came_from = {}
+    queue = deque()
+    for start_node in start_nodes:
+        if start_node not in came_from:
+            came_from[start_node] = None
+            queue.append(start_node)
+
+    found = None
+    while queue and found is None:
+        current_node = queue.popleft()
+        if current_node in goals:
+            found = current_node
+            break
+        for neighbor in graph.get(current_node, ()):
+            if neighbor not in came_from:
+                came_from[neighbor] = current_node
+                queue.append(neighbor)
+
+    if stats is not None:
+        stats["visited"] = len(came_from)
+    if found is None:
+        return None  # No path found
+
+    path = []
+    node = found
+    while node is not None:
+        path.append(node)
+        node = came_from[node]
+    return path[::-1]
+
+# Compressed-sparse-row (CSR) graph for large graphs
+class CSRGraph:
+    """
+    An array-backed copy of an adjacency-dict graph for fast BFS and DFS.
+
+    Node labels are mapped to integer IDs once. The neighbors of node i are
+    targets[offsets[i]:offsets[i + 1]], in the same order as in the dict, and the
+    searches keep visited flags and parents in flat arrays instead of sets and dicts.
+    Both searches run in O(nodes + edges) and return the same paths as
+    depth_first_search_graph and breadth_first_search_graph.
+
+    Args:
+        graph (dict): An adjacency list where keys are nodes and values are lists of neighbors.
+    """
+
+    def __init__(self, graph):
+        self.labels = list(graph)
+        self.ids = {label: i for i, label in enumerate(self.labels)}
+        # Nodes that only appear as neighbors get IDs after the keys
+        for neighbors in graph.values():
+            for neighbor in neighbors:
+                if neighbor not in self.ids:
+                    self.ids[neighbor] = len(self.labels)
+                    self.labels.append(neighbor)
+
+        self.offsets = array("q", [0]) * (len(self.labels) + 1)
+        self.targets = array("q")
+        ids = self.ids
+        for i, neighbors in enumerate(graph.values()):
+            self.targets.extend(ids[neighbor] for neighbor in neighbors)
+            self.offsets[i + 1] = len(self.targets)
+        for i in range(len(graph) + 1, len(self.labels) + 1):
+            self.offsets[i] = len(self.targets)
+
+    @classmethod
+    def from_arrays(cls, offsets, targets):
+        """
+        Wraps existing CSR arrays whose node labels are simply the IDs 0 .. n - 1.
+
+        Args:
+            offsets (array): n + 1 edge offsets; node i's edges are offsets[i]:offsets[i + 1].
+            targets (array): The target node ID of every edge.
+
+        Returns:
+            CSRGraph: A graph over the arrays, without copying them.
+        """
+        csr = cls.__new__(cls)
+        csr.labels = range(len(offsets) - 1)
+        csr.ids = _IntegerIds(len(offsets) - 1)
+        csr.offsets = offsets
+        csr.targets = targets
+        return csr
+
+    @property
+    def num_nodes(self):
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def _path(self, parent, goal):
+        """Follows parent IDs back from goal and returns the labels from the start to goal."""
+        labels = self.labels
+        path = []
+        node = goal
+        while node != -1:
+            path.append(labels[node])
+            node = parent[node]
+        path.reverse()
+        return path
+
+    def breadth_first_search(self, start_node, goal_node, stats=None):
+        """
+        Same result as breadth_first_search_graph, with an O(1) queue and array storage.
+
+        If stats is a dict, stats["visited"] is set to the number of nodes discovered.
+        """
+        if stats is not None:
+            stats["visited"] = 1 if start_node == goal_node else 0
+        if start_node == goal_node:
+            return [start_node]
+        start = self.ids.get(start_node)
+        goal = self.ids.get(goal_node)
+        if start is None or goal is None:
+            return None
+
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(self.num_nodes)
+        parent = array("q", [-1]) * self.num_nodes
+        # The queue is an array that only grows; head marks the next node to visit
+        queue = array("q", [start])
+        visited[start] = 1
+        head = 0
+
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+            for position in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[position]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    parent[neighbor] = current
+                    if neighbor == goal:
+                        if stats is not None:
+                            stats["visited"] = len(queue) + 1
+                        return self._path(parent, goal)
+                    queue.append(neighbor)
+
+        if stats is not None:
+            stats["visited"] = len(queue)
+        return None  # No path found
+
+    def depth_first_search(self, start_node, goal_node):
+        """Same result as depth_first_search_graph, with an explicit stack instead of recursion."""
+        if start_node == goal_node:
+            return [start_node]
+        start = self.ids.get(start_node)
+        goal = self.ids.get(goal_node)
+        if start is None or goal is None:
+            return None
+
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(self.num_nodes)
+        visited[start] = 1
+        # path holds the nodes on the current branch and positions the next edge of each
+        path = array("q", [start])
+        positions = array("q", [offsets[start]])
+
+        while path:
+            current = path[-1]
+            position = positions[-1]
+            if position == offsets[current + 1]:
+                path.pop()  # Backtrack
+                positions.pop()
+                continue
+            positions[-1] = position + 1
+            neighbor = targets[position]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                path.append(neighbor)
+                positions.append(offsets[neighbor])
+                if neighbor == goal:
+                    labels = self.labels
+                    return [labels[node] for node in path]
+
+        return None  # No path found
+
+class _IntegerIds:
+    """The label -> ID mapping of a graph whose labels already are the IDs 0 .. n - 1."""
+
+    def __init__(self, num_nodes):
+        self.num_nodes = num_nodes
+
+    def get(self, label, default=None):
+        if isinstance(label, int) and 0 <= label < self.num_nodes:
+            return label
+        return default
+
+    def __contains__(self, label):
+        return self.get(label) is not None
+
+
+# Streaming edge-list ingestion
+def _edge_chunks(path, chunk_bytes):
+    """Yields (sources, targets) arrays for successive blocks of a text edge-list file."""
+    with open(path, "rb") as handle:
+        leftover = b""
+        line_number = 0
+        while True:
+            block = handle.read(chunk_bytes)
+            if block:
+                # Parse whole lines only; carry the partial last line into the next block
+                block = leftover + block
+                cut = block.rfind(b"\n") + 1
+                block, leftover = block[:cut], block[cut:]
+            elif leftover:
+                block, leftover = leftover, b""
+            else:
+                return
+            sources = array("q")
+            targets = array("q")
+            for line in block.splitlines():
+                line_number += 1
+                fields = line.split()
+                # Skip blank and comment lines; extra columns (weights, timestamps) are ignored
+                if not fields or fields[0].startswith(b"#"):
+                    continue
+                if len(fields) < 2:
+                    raise ValueError(f"{path}: line {line_number} has one field, expected two node IDs")
+                sources.append(int(fields[0]))
+                targets.append(int(fields[1]))
+            yield sources, targets
+
+
+def load_edge_list(path, chunk_bytes=1 << 24):
+    """
+    Builds a CSRGraph from a text edge list without ever holding a graph dict.
+
+    Each line is "source target" with integer node IDs; lines starting with '#' are
+    comments, and any columns after the first two are ignored. The file is read
+    twice in blocks of chunk_bytes: the first pass counts out-degrees, the second drops
+    each target straight into its final slot. Peak memory is the CSR arrays (8 bytes per
+    node and per edge) plus one block, and neighbor order follows the file.
+
+    Args:
+        path (str): The edge-list file.
+        chunk_bytes (int): How much of the file to parse at a time.
+
+    Returns:
+        CSRGraph: The graph, labelled by the integer IDs from the file.
+    """
+    # Pass 1: out-degree of every node
+    degrees = array("q")
+    for sources, targets in _edge_chunks(path, chunk_bytes):
+        if not sources:
+            continue
+        highest = max(max(sources), max(targets))
+        if highest >= len(degrees):
+            degrees.extend(array("q", [0]) * (highest + 1 - len(degrees)))
+        if np is not None:
+            np.frombuffer(degrees, dtype=np.int64)[:] += np.bincount(
+                np.frombuffer(sources, dtype=np.int64), minlength=len(degrees))
+        else:
+            for source in sources:
+                degrees[source] += 1
+
+    num_nodes = len(degrees)
+    offsets = array("q", [0]) * (num_nodes + 1)
+    total = 0
+    for node in range(num_nodes):
+        offsets[node] = total
+        total += degrees[node]
+    offsets[num_nodes] = total
+
+    # Pass 2: place each edge at its source's next free slot
+    targets = array("q", [0]) * total
+    cursor = offsets[:-1]
+    for sources, chunk_targets in _edge_chunks(path, chunk_bytes):
+        if np is not None and sources:
+            sources_np = np.frombuffer(sources, dtype=np.int64)
+            order = np.argsort(sources_np, kind="stable")
+            sorted_sources = sources_np[order]
+            nodes, first, counts = np.unique(sorted_sources, return_index=True, return_counts=True)
+            cursor_np = np.frombuffer(cursor, dtype=np.int64)
+            rank = np.arange(len(sorted_sources)) - np.repeat(first, counts)
+            np.frombuffer(targets, dtype=np.int64)[cursor_np[sorted_sources] + rank] = \
+                np.frombuffer(chunk_targets, dtype=np.int64)[order]
+            cursor_np[nodes] += counts
+        else:
+            for source, target in zip(sources, chunk_targets):
+                targets[cursor[source]] = target
+                cursor[source] += 1
+
+    return CSRGraph.from_arrays(offsets, targets)
+
+
+def bfs_levels(csr, start_node):
+    """
+    Computes the hop distance from start_node to every node, one whole frontier at a time.
+
+    With NumPy, each level gathers all frontier edges with one vectorized index
+    operation and keeps the unvisited targets as the next frontier, so the Python loop
+    runs once per level instead of once per node. Without NumPy it falls back to the
+    same level-synchronous loop in plain Python.
+
+    Args:
+        csr (CSRGraph): The graph to search.
+        start_node: The node to start from.
+
+    Returns:
+        array: distances[i] is the number of edges from start_node to node ID i, or -1 if
+               node i is unreachable (a NumPy array when NumPy is installed).
+    """
+    start = csr.ids.get(start_node)
+    if start is None:
+        raise KeyError(start_node)
+
+    if np is None:
+        offsets = csr.offsets
+        targets = csr.targets
+        distances = array("q", [-1]) * csr.num_nodes
+        distances[start] = 0
+        frontier = [start]
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for node in frontier:
+                for position in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[position]
+                    if distances[neighbor] == -1:
+                        distances[neighbor] = level
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int64)
+    distances = np.full(csr.num_nodes, -1, dtype=np.int64)
+    distances[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    level = 0
+    while frontier.size:
+        level += 1
+        starts = offsets[frontier]
+        lengths = offsets[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            break
+        # Positions of every edge leaving the frontier: for each node, starts..starts+length
+        positions = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths) + np.repeat(starts, lengths)
+        neighbors = targets[positions]
+        neighbors = np.unique(neighbors[distances[neighbors] == -1])
+        distances[neighbors] = level
+        frontier = neighbors
+    return distances
+
+
+def main():
+    """
+    Runs DFS and BFS on a small example graph.
+    """
+    # Example Usage (Adjacency List Representation)
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    }
+
+    start_node = 'A'
+    goal_node = 'F'
+
+    dfs_path = depth_first_search_graph(graph, start_node, goal_node)
+    bfs_path = breadth_first_search_graph(graph, start_node, goal_node)
 
-start_node = 'A'
-goal_node = 'F'
+    print("DFS Path:", dfs_path)
+    print("BFS Path:", bfs_path)
 
-dfs_path = depth_first_search_graph(graph, start_node, goal_node)
-bfs_path = breadth_first_search_graph(graph, start_node, goal_node)
 
-print("DFS Path:", dfs_path)
-print("BFS Path:", bfs_path)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
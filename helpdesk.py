@@ -0,0 +1,591 @@
+import argparse
+import heapq
+import json
+import os
+import pickle
+import re
+import tempfile
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; it is only needed for .yaml knowledge base files
+    yaml = None
+
+# Define the knowledge base as a set of rules.
+# Each rule is a tuple: (condition, action)
+# The condition is a dictionary of attribute-value pairs.
+# The action is a dictionary specifying what to do.
+KNOWLEDGE_BASE = [
+    # Rule 1: Problem with network connectivity
+    (
+        {"problem": "network"},
+        {"action": "troubleshoot_network"}
+    ),
+    # Rule 2: Problem with email access
+    (
+        {"problem": "email"},
+        {"action": "troubleshoot_email"}
+    ),
+    # Rule 3: Problem with software installation
+    (
+        {"problem": "software"},
+        {"action": "troubleshoot_software"}
+    ),
+    # Rule 4:  Password reset request
+    (
+        {"problem": "password"},
+        {"action": "reset_password"}
+    ),
+    # Rule 5:  Hardware malfunction
+    (
+        {"problem": "hardware"},
+        {"action": "troubleshoot_hardware"}
+    ),
+    # Rule 6:  Printer problem
+    (
+        {"problem": "printer"},
+        {"action": "troubleshoot_printer"}
+    ),
+     # Rule 7:  Slow computer
+    (
+        {"problem": "slow computer"},
+        {"action": "troubleshoot_slow_computer"}
+    ),
+    # Rule 8:  Cannot access website
+    (
+        {"problem": "website access"},
+        {"action": "troubleshoot_website_access"}
+    ),
+    # Rule 9:  File recovery
+    (
+        {"problem": "file recovery"},
+        {"action": "troubleshoot_file_recovery"}
+    ),
+    # Rule 10: System crash
+    (
+        {"problem": "system crash"},
+        {"action": "troubleshoot_system_crash"}
+    ),
+]
+
+def forward_chaining(facts, engine=None):
+    """
+    Performs forward chaining to infer actions based on given facts.
+
+    Args:
+        facts (dict): A dictionary of known facts (e.g., {"problem": "network"}).
+        engine (RuleEngine, optional): Match against this engine's rules through its index
+                                       instead of scanning KNOWLEDGE_BASE.
+
+    Returns:
+        dict: The action to be taken, or None if no matching rule is found.
+    """
+    if engine is not None:
+        return engine.first_match(facts)
+    for condition, action in KNOWLEDGE_BASE:
+        # Check if the condition part of the rule matches the given facts
+        match = True
+        for key, value in condition.items():
+            if key not in facts or facts[key] != value:
+                match = False
+                break  # If any part of the condition doesn't match, move to the next rule
+        if match:
+            return action  # If all parts of the condition match, return the action
+    return None  # If no rule matches the facts, return None
+
+class RuleEngine:
+    """
+    Incremental forward chaining over (condition, action) rules like KNOWLEDGE_BASE.
+
+    The rules are compiled into a small discrimination network. Rules with the same
+    condition share one condition node, which counts how many of its attribute/value
+    pairs are currently facts, and a hash index maps each pair to the nodes that test
+    it. Adding or retracting a fact therefore only touches the nodes indexed under that
+    pair, however many rules there are.
+
+    When a node becomes satisfied its rules go on the agenda, which fires them in rule
+    order (the order forward_chaining tries them). Firing a rule records its action and
+    asserts the action's own attribute/value pairs as derived facts (e.g. ("action",
+    "reset_password")), so rules conditioned on them fire in turn. Each derived fact
+    remembers the rules supporting it; when a fired rule's condition stops holding
+    because a fact was retracted, its support is withdrawn, and facts that can no
+    longer be derived from the given facts are retracted too, including facts that
+    only supported each other in a cycle.
+
+    Attributes:
+        rules (list of tuples): The (condition, action) rules, in priority order.
+        facts (dict): Each current (attribute, value) fact -> the set of its supports
+                      (None for a given fact, or the index of the rule that derived it).
+        fired (set): Indices of the rules that fired and whose condition still holds.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = []
+        self.facts = {}
+        self.fired = set()
+        self._node_ids = {}  # frozenset of condition pairs -> node index
+        self._node_sizes = []  # Pairs tested by each node
+        self._node_counts = []  # How many of them are facts now
+        self._node_rules = []  # Rule indices sharing each node, in order
+        self._rule_nodes = []
+        self._index = {}  # (attribute, value) -> indices of the nodes that test it
+        self._agenda = []  # Heap of rule indices; entries no longer pending are skipped
+        self._pending = set()
+        self._withdrawn = []  # Rules whose support must be withdrawn
+        for condition, action in rules if rules is not None else KNOWLEDGE_BASE:
+            self.add_rule(condition, action)
+
+    def add_rule(self, condition, action):
+        """Adds a rule after the existing ones; it goes on the agenda if it already matches."""
+        rule = len(self.rules)
+        self.rules.append((condition, action))
+        pairs = frozenset(condition.items())
+        node = self._node_ids.get(pairs)
+        if node is None:
+            node = len(self._node_sizes)
+            self._node_ids[pairs] = node
+            self._node_sizes.append(len(pairs))
+            self._node_counts.append(sum(1 for pair in pairs if pair in self.facts))
+            self._node_rules.append([])
+            for pair in pairs:
+                self._index.setdefault(pair, []).append(node)
+        self._node_rules[node].append(rule)
+        self._rule_nodes.append(node)
+        if self._node_counts[node] == self._node_sizes[node]:
+            self._activate(rule)
+        return rule
+
+    def _activate(self, rule):
+        self._pending.add(rule)
+        heapq.heappush(self._agenda, rule)
+
+    def _add_support(self, pair, source):
+        support = self.facts.get(pair)
+        if support is None:
+            self.facts[pair] = {source}
+            for node in self._index.get(pair, ()):
+                self._node_counts[node] += 1
+                if self._node_counts[node] == self._node_sizes[node]:
+                    for rule in self._node_rules[node]:
+                        self._activate(rule)
+        else:
+            support.add(source)
+
+    def _remove_support(self, pair, source):
+        support = self.facts.get(pair)
+        if support is None or source not in support:
+            return
+        support.discard(source)
+        if not support:
+            self._delete_fact(pair)
+
+    def _delete_fact(self, pair):
+        del self.facts[pair]
+        for node in self._index.get(pair, ()):
+            if self._node_counts[node] == self._node_sizes[node]:
+                for rule in self._node_rules[node]:
+                    self._pending.discard(rule)
+                    if rule in self.fired:
+                        self.fired.discard(rule)
+                        self._withdrawn.append(rule)
+            self._node_counts[node] -= 1
+
+    def assert_facts(self, facts):
+        """
+        Adds given facts, from a dict like {"problem": "network"} or (attribute, value) pairs.
+
+        Call run to fire the rules they activate.
+        """
+        for pair in facts.items() if isinstance(facts, dict) else facts:
+            self._add_support(pair, None)
+
+    def retract_facts(self, facts):
+        """
+        Removes given facts (a dict or pairs) and everything derived only from them.
+
+        Counting supports is not enough once rules form a cycle (a derives b, b derives
+        a), so retraction over-deletes and then re-derives: every derived fact that a
+        fired rule could have derived from a retracted fact is a suspect, and a suspect
+        is kept only if a fired rule still derives it from facts that are kept.
+        """
+        suspects = set()
+        stack = []
+        for pair in facts.items() if isinstance(facts, dict) else facts:
+            support = self.facts.get(pair)
+            if support is not None and None in support:
+                support.discard(None)
+                if pair not in suspects:
+                    suspects.add(pair)
+                    stack.append(pair)
+        # Over-delete: derived facts reachable from the retracted ones through fired rules
+        while stack:
+            pair = stack.pop()
+            for node in self._index.get(pair, ()):
+                if self._node_counts[node] != self._node_sizes[node]:
+                    continue
+                for rule in self._node_rules[node]:
+                    if rule not in self.fired:
+                        continue
+                    for derived in self.rules[rule][1].items():
+                        support = self.facts.get(derived)
+                        if support is not None and None not in support and derived not in suspects:
+                            suspects.add(derived)
+                            stack.append(derived)
+
+        # Re-derive: blocked[node] counts the suspects a satisfied node tests, and a
+        # suspect is kept once a fired rule on an unblocked node supports it
+        blocked = {}
+        for pair in suspects:
+            for node in self._index.get(pair, ()):
+                if self._node_counts[node] == self._node_sizes[node]:
+                    blocked[node] = blocked.get(node, 0) + 1
+        kept = {pair for pair in suspects
+                if any(blocked.get(self._rule_nodes[rule], 0) == 0 for rule in self.facts[pair])}
+        stack = list(kept)
+        while stack:
+            pair = stack.pop()
+            for node in self._index.get(pair, ()):
+                if node not in blocked:
+                    continue
+                blocked[node] -= 1
+                if blocked[node]:
+                    continue
+                for rule in self._node_rules[node]:
+                    if rule not in self.fired:
+                        continue
+                    for derived in self.rules[rule][1].items():
+                        if derived in suspects and derived not in kept:
+                            kept.add(derived)
+                            stack.append(derived)
+
+        for pair in suspects - kept:
+            self._delete_fact(pair)
+        # Withdraw what the rules that no longer match derived
+        while self._withdrawn:
+            rule = self._withdrawn.pop()
+            for pair in self.rules[rule][1].items():
+                self._remove_support(pair, rule)
+
+    def run(self, max_steps=None):
+        """
+        Fires activated rules in rule order until the agenda is empty.
+
+        Args:
+            max_steps (int, optional): Stop after firing this many rules.
+
+        Returns:
+            list: The actions of the rules fired, in firing order.
+        """
+        actions = []
+        while self._agenda and (max_steps is None or len(actions) < max_steps):
+            rule = heapq.heappop(self._agenda)
+            if rule not in self._pending:
+                continue  # Deactivated, or a duplicate entry
+            self._pending.discard(rule)
+            self.fired.add(rule)
+            action = self.rules[rule][1]
+            actions.append(action)
+            for pair in action.items():
+                self._add_support(pair, rule)
+        return actions
+
+    def first_match(self, facts):
+        """
+        Returns the action forward_chaining would return for facts, without changing state.
+
+        Only the nodes indexed under the given facts are counted, so the cost depends on
+        the facts, not on the number of rules.
+        """
+        counts = {}
+        best = None
+        for pair in facts.items():
+            try:
+                nodes = self._index.get(pair, ())
+            except TypeError:
+                continue  # An unhashable value (e.g. a list of tags) matches no indexed condition
+            for node in nodes:
+                count = counts.get(node, 0) + 1
+                counts[node] = count
+                if count == self._node_sizes[node] and (best is None or self._node_rules[node][0] < best):
+                    best = self._node_rules[node][0]
+        empty = self._node_ids.get(frozenset())
+        if empty is not None and (best is None or self._node_rules[empty][0] < best):
+            best = self._node_rules[empty][0]
+        return None if best is None else self.rules[best][1]
+
+# Knowledge base files
+#
+# A knowledge base file (JSON, or YAML with PyYAML installed) looks like:
+#     {"rules": [{"if": {"problem": "network"}, "then": {"action": "troubleshoot_network"}}, ...],
+#      "actions": {"troubleshoot_network": ["Troubleshooting Network Connectivity:", ...], ...}}
+# It is compiled into a RuleEngine and cached next to the file as a pickle, which is
+# reused until the file's size or modification time changes.
+
+_CACHE_VERSION = 1
+
+
+def _read_knowledge_base(path):
+    """Parses a knowledge base file into (rules, action scripts)."""
+    with open(path, encoding="utf-8") as handle:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError("PyYAML is required to read YAML knowledge bases")
+            data = yaml.safe_load(handle)
+        else:
+            data = json.load(handle)
+    rules = [(rule["if"], rule["then"]) for rule in data.get("rules", [])]
+    return rules, dict(data.get("actions", {}))
+
+
+def load_knowledge_base(path, cache_path=None):
+    """
+    Loads a knowledge base file, compiled, from its cache when the file is unchanged.
+
+    Args:
+        path (str): The JSON or YAML knowledge base file.
+        cache_path (str, optional): Where to keep the compiled form (default: path + ".cache").
+
+    Returns:
+        tuple: (RuleEngine over the file's rules, action scripts by action name).
+    """
+    cache_path = cache_path or path + ".cache"
+    source = os.stat(path)
+    stamp = (_CACHE_VERSION, source.st_size, source.st_mtime_ns)
+    try:
+        with open(cache_path, "rb") as handle:
+            if pickle.load(handle) == stamp:
+                state, scripts = pickle.load(handle)
+                engine = RuleEngine.__new__(RuleEngine)
+                engine.__dict__.update(state)
+                return engine, scripts
+    except Exception:
+        # No usable cache: missing, truncated, corrupt, or written by an incompatible
+        # version (unpickling can raise nearly anything), so compile below
+        pass
+
+    rules, scripts = _read_knowledge_base(path)
+    engine = RuleEngine(rules)
+    # The engine's state is all plain containers; caching it rather than the engine
+    # keeps the cache loadable whether this module runs as a script or is imported
+    compiled = (vars(engine), scripts)
+    # Write to a temporary file and rename, so a reader never sees a partial cache; a
+    # cache that cannot be written only costs compiling again next time
+    try:
+        descriptor, temporary = tempfile.mkstemp(suffix=".cache", dir=os.path.dirname(os.path.abspath(cache_path)))
+    except OSError:
+        return engine, scripts
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            pickle.dump(stamp, handle, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(compiled, handle, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_path)
+    except OSError:
+        os.unlink(temporary)
+    return engine, scripts
+
+
+def save_knowledge_base(path, rules=None, scripts=None):
+    """Writes rules (default: KNOWLEDGE_BASE) and action scripts (default: ACTION_SCRIPTS) as a JSON knowledge base."""
+    rules = KNOWLEDGE_BASE if rules is None else rules
+    scripts = ACTION_SCRIPTS if scripts is None else scripts
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump({"rules": [{"if": condition, "then": action} for condition, action in rules],
+                   "actions": scripts}, handle, indent=2)
+        handle.write("\n")
+
+
+def _print_script(lines):
+    for line in lines:
+        print(line)
+
+
+def action_handlers(scripts):
+    """Returns a dispatch table that prints the given action scripts (see ACTION_HANDLERS)."""
+    return {name: (lambda action, lines=lines: _print_script(lines)) for name, lines in scripts.items()}
+
+
+def triage(tickets, engine=None):
+    """
+    Recommends an action for each ticket in a stream, without any interaction.
+
+    Args:
+        tickets (iterable of dict): Tickets whose fields are the facts (e.g.
+                                    {"id": 7, "problem": "printer"}); an "id" field is
+                                    copied to the result rather than matched.
+        engine (RuleEngine, optional): The compiled rules (default: KNOWLEDGE_BASE).
+
+    Yields:
+        dict: {"id": ..., "action": action name or None} for each ticket, in order; the
+              action is None when no rule matches or the matching rule names no action.
+    """
+    engine = engine if engine is not None else RuleEngine()
+    for ticket in tickets:
+        facts = {key: value for key, value in ticket.items() if key != "id"}
+        action = forward_chaining(facts, engine)
+        yield {"id": ticket.get("id"), "action": None if action is None else action.get("action")}
+
+
+def triage_file(path, output=None, engine=None):
+    """Triages a JSONL file of tickets, writing one JSON result line per ticket to output (default: stdout)."""
+    handle = open(output, "w", encoding="utf-8") if output else None
+    try:
+        with open(path, encoding="utf-8") as tickets:
+            for result in triage((json.loads(line) for line in tickets if line.strip()), engine):
+                line = json.dumps(result) + "\n"
+                if handle is None:
+                    print(line, end="")
+                else:
+                    handle.write(line)
+    finally:
+        if handle is not None:
+            handle.close()
+
+
+def get_user_input():
+    """
+    Gets user input about the help desk problem.  Added input validation.
+    """
+    valid_problems = ["network", "email", "software", "password", "hardware", "printer",
+                      "slow computer", "website access", "file recovery", "system crash"]
+    while True:
+        print("Please describe your problem.  Choose from the following categories:")
+        print(", ".join(valid_problems))
+        problem = input("Problem: ").lower()
+        if problem in valid_problems:
+            return {"problem": problem}
+        else:
+            print("Invalid problem category.  Please choose from the list.")
+
+# Action scripts: the lines handle_action prints for each action name
+ACTION_SCRIPTS = {
+    "troubleshoot_network": [
+        "Troubleshooting Network Connectivity:",
+        "1. Check your network cable connection.",
+        "2. Restart your router and modem.",
+        "3. Try connecting to a different network.",
+        "4. Contact your internet service provider.",
+    ],
+    "troubleshoot_email": [
+        "Troubleshooting Email Access:",
+        "1. Check your internet connection.",
+        "2. Verify your email address and password.",
+        "3. Check your email server settings.",
+        "4. Contact your email provider.",
+    ],
+    "troubleshoot_software": [
+        "Troubleshooting Software Installation:",
+        "1. Ensure your system meets the minimum requirements.",
+        "2. Download the latest version of the software.",
+        "3. Check for conflicting software.",
+        "4. Run the installer as administrator.",
+    ],
+    "reset_password": [
+        "Resetting Password:",
+        "1. Go to the password reset page on our website.",
+        "2. Enter your username or email address.",
+        "3. Follow the instructions to create a new password.",
+    ],
+    "troubleshoot_hardware": [
+        "Troubleshooting Hardware Malfunction:",
+        "1. Identify the faulty hardware component.",
+        "2. Check power connections and cables.",
+        "3. Restart your computer.",
+        "4. Contact technical support for repair or replacement.",
+    ],
+    "troubleshoot_printer": [
+        "Troubleshooting Printer Problem:",
+        "1. Check if the printer is turned on and connected.",
+        "2. Verify that the printer has paper and ink/toner.",
+        "3. Restart the printer and your computer.",
+        "4. Check for any error messages on the printer display.",
+    ],
+    "troubleshoot_slow_computer": [
+        "Troubleshooting Slow Computer:",
+        "1. Close unnecessary programs and browser tabs.",
+        "2. Run a virus scan.",
+        "3. Check your hard drive space.",
+        "4. Defragment your hard drive (for traditional hard drives).",
+    ],
+    "troubleshoot_website_access": [
+        "Troubleshooting Website Access:",
+        "1. Check your internet connection.",
+        "2. Clear your browser's cache and cookies.",
+        "3. Try a different browser.",
+        "4. Check if the website is down for everyone.",
+    ],
+    "troubleshoot_file_recovery": [
+        "Troubleshooting File Recovery:",
+        "1. Check the Recycle Bin or Trash folder.",
+        "2. Use file recovery software.",
+        "3. Check your backups.",
+        "4. Contact data recovery services if the data is critical.",
+    ],
+    "troubleshoot_system_crash": [
+        "Troubleshooting System Crash:",
+        "1. Restart your computer.",
+        "2. Check for recent software or hardware changes.",
+        "3. Run a system file checker.",
+        "4. Consider restoring your system to a previous state.",
+    ],
+}
+
+
+# Dispatch table: action name -> function taking the action dict. Every scripted action
+# prints its script; register a function here for actions that need to do more.
+ACTION_HANDLERS = action_handlers(ACTION_SCRIPTS)
+
+
+def handle_action(action, handlers=None):
+    """
+    Performs the action recommended by the expert system.
+    This function simulates the help desk actions.
+
+    Args:
+        action (dict): The action to be taken (returned by forward_chaining).
+        handlers (dict, optional): Action name -> handler function (default: ACTION_HANDLERS).
+    """
+    if action is None:
+        print("I could not identify the problem. Please provide more details or contact a human agent.")
+        return
+
+    handler = (ACTION_HANDLERS if handlers is None else handlers).get(action["action"])
+    if handler is None:
+        print("I don't know how to handle that action.  This is a placeholder.") #Should not reach here
+    else:
+        handler(action)
+
+
+def main(knowledge_base=None):
+    """
+    Main function to run the expert system.
+
+    Args:
+        knowledge_base (str, optional): A knowledge base file to use instead of the
+                                        built-in rules and action scripts.
+    """
+    print("Welcome to the Help Desk Expert System!")
+    print("I can help you with common technical problems.")
+
+    engine = handlers = None
+    if knowledge_base:
+        engine, scripts = load_knowledge_base(knowledge_base)
+        handlers = action_handlers(scripts)
+    facts = get_user_input()  # Get user input as facts
+    action = forward_chaining(facts, engine)  # Infer action using forward chaining
+    handle_action(action, handlers)  # Perform the recommended action
+
+def command_line(argv=None):
+    """Runs the expert system, or batch triage with --triage, from command-line arguments."""
+    parser = argparse.ArgumentParser(description="Help desk expert system.")
+    parser.add_argument("--kb", metavar="FILE", help="JSON or YAML knowledge base (default: built-in rules)")
+    parser.add_argument("--triage", metavar="FILE", help="recommend actions for a JSONL file of tickets")
+    parser.add_argument("--output", help="where to write --triage results (default: standard output)")
+    args = parser.parse_args(argv)
+    if args.triage:
+        engine = load_knowledge_base(args.kb)[0] if args.kb else None
+        triage_file(args.triage, args.output, engine)
+    else:
+        main(args.kb)
+
+if __name__ == "__main__":
+    command_line()
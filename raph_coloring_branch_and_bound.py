@@ -1,4 +1,9 @@
-def graph_coloring_branch_and_bound(graph, num_colors):
+import multiprocessing
+import os
+import random
+import time
+
+def graph_coloring_branch_and_bound(graph, num_colors, stats=None):
     """
     Solves the graph coloring problem using Branch and Bound with Backtracking.
 
@@ -6,6 +11,9 @@ def graph_coloring_branch_and_bound(graph, num_colors):
         graph (dict): An adjacency list representation of the graph where keys are
                       vertices and values are lists of their neighbors.
         num_colors (int): The maximum number of colors allowed.
+        stats (dict, optional): Receives "nodes", the number of color assignments tried,
+                                and "backtracks", the number of times a vertex ran out
+                                of colors.
 
     Returns:
         dict or None: A dictionary where keys are vertices and values are their assigned
@@ -42,6 +50,8 @@ def graph_coloring_branch_and_bound(graph, num_colors):
             if is_safe(vertex, color):
                 # Assign the color
                 coloring[vertex] = color
+                if stats is not None:
+                    stats["nodes"] += 1
 
                 # Branch: Explore the next vertex
                 result = backtrack(vertex_index + 1)
@@ -52,26 +62,665 @@ def graph_coloring_branch_and_bound(graph, num_colors):
                 del coloring[vertex]
 
         # No valid color could be assigned to the current vertex
+        if stats is not None:
+            stats["backtracks"] += 1
         return None
 
+    if stats is not None:
+        stats["nodes"] = 0
+        stats["backtracks"] = 0
+
     # Start the backtracking process from the first vertex
     return backtrack(0)
 
-# Example Graph (Adjacency List)
-graph = {
-    'A': ['B', 'C'],
-    'B': ['A', 'C', 'D'],
-    'C': ['A', 'B', 'D', 'E'],
-    'D': ['B', 'C', 'E'],
-    'E': ['C', 'D']
-}
-num_colors_available = 3
-
-coloring_result = graph_coloring_branch_and_bound(graph, num_colors_available)
-
-if coloring_result:
-    print(f"Valid coloring found using {num_colors_available} colors:")
-    for vertex, color in coloring_result.items():
-        print(f"Vertex {vertex}: Color {color}")
-else:
-    print(f"No valid coloring found using {num_colors_available} colors.")
\ No newline at end of file
+
+def _index_graph(graph):
+    """
+    Numbers the vertices 0 .. n - 1 and returns (vertices, neighbor sets by index).
+
+    Edges are treated as undirected (an edge listed on either end counts) and
+    self-loops are ignored.
+    """
+    vertices = list(graph.keys())
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    neighbors = [set() for _ in vertices]
+    for vertex, adjacent in graph.items():
+        i = index[vertex]
+        for neighbor in adjacent:
+            j = index.get(neighbor)
+            if j is not None and j != i:
+                neighbors[i].add(j)
+                neighbors[j].add(i)
+    return vertices, neighbors
+
+
+def graph_coloring_dsatur(graph, num_colors, stats=None):
+    """
+    Solves the graph coloring problem with DSATUR ordering and forward checking.
+
+    The next vertex to color is the one with the fewest colors left (highest saturation),
+    ties going to the vertex with the most neighbors. Each vertex's available colors are
+    an integer bitmask; assigning a color clears that bit in every uncolored neighbor,
+    and a branch is abandoned as soon as some neighbor has no color left. This explores
+    far fewer nodes than graph_coloring_branch_and_bound.
+
+    Args:
+        graph (dict): An adjacency list representation of the graph where keys are
+                      vertices and values are lists of their neighbors.
+        num_colors (int): The maximum number of colors allowed.
+        stats (dict, optional): Receives "nodes", the number of color assignments tried,
+                                and "backtracks", the number of times a vertex ran out
+                                of colors.
+
+    Returns:
+        dict or None: A dictionary where keys are vertices and values are their assigned
+                      colors (integers from 1 to num_colors), or None if no valid
+                      coloring is found.
+    """
+    vertices, neighbors = _index_graph(graph)
+    colors = _dsatur_search(neighbors, num_colors, stats=stats)
+    if colors is None:
+        return None
+    return {vertex: colors[i] for i, vertex in enumerate(vertices)}
+
+
+def _dsatur_search(neighbors, num_colors, fixed=(), rank=None, symmetry=False, stats=None):
+    """
+    Forward-checking DSATUR search over indexed vertices (see graph_coloring_dsatur).
+
+    With symmetry, a vertex may only take a color already in use or the next unused
+    index (highest color so far + 1). The unused colors are interchangeable, so this
+    skips colorings that only rename colors without losing any solution.
+
+    Args:
+        neighbors (list of sets): Neighbor indices of each vertex, from _index_graph.
+        num_colors (int): The maximum number of colors allowed.
+        fixed (iterable): (vertex, color) pairs assigned before the search starts.
+        rank (list, optional): Tie-break key per vertex among equally saturated ones
+                               (default: highest degree first).
+        symmetry (bool): Whether to break color symmetry as described above.
+        stats (dict, optional): Receives "nodes" and "backtracks" (see graph_coloring_dsatur).
+
+    Returns:
+        list or None: The color (from 1) of each vertex, or None if no valid coloring
+                      extends the fixed colors.
+    """
+    num_vertices = len(neighbors)
+    if rank is None:
+        rank = [-len(adjacent) for adjacent in neighbors]
+    domains = [(1 << num_colors) - 1] * num_vertices  # bit c set = color c + 1 still allowed
+    colors = [0] * num_vertices  # 0 = uncolored
+    nodes = backtracks = 0
+
+    def select():
+        """Returns the uncolored vertex with the fewest colors left (then lowest rank)."""
+        best = -1
+        best_key = None
+        for v in range(num_vertices):
+            if not colors[v]:
+                key = (domains[v].bit_count(), rank[v])
+                if best_key is None or key < best_key:
+                    best, best_key = v, key
+        return best
+
+    def assign(v, bit):
+        """
+        Colors v and removes the color from its uncolored neighbors.
+
+        Returns (neighbors whose domain changed, ok), where ok is False if one of them
+        was left without any color.
+        """
+        colors[v] = bit.bit_length()
+        changed = []
+        ok = True
+        for u in neighbors[v]:
+            if not colors[u] and domains[u] & bit:
+                domains[u] &= ~bit
+                changed.append(u)
+                if not domains[u]:
+                    ok = False
+                    break
+        return changed, ok
+
+    def unassign(v, bit, changed):
+        colors[v] = 0
+        for u in changed:
+            domains[u] |= bit
+
+    remaining = num_vertices
+    highest = 0  # Highest color in use
+    for v, color in fixed:
+        bit = 1 << (color - 1)
+        if colors[v] or not domains[v] & bit or not assign(v, bit)[1]:
+            if stats is not None:
+                stats["nodes"] = stats["backtracks"] = 0
+            return None
+        highest = max(highest, color)
+        remaining -= 1
+
+    # Iterative search: each frame is [vertex, colors not yet tried, bit in use, changed,
+    # highest color in use before this vertex]
+    stack = []
+    while remaining:
+        v = select()
+        untried = domains[v]
+        if symmetry:
+            untried &= (1 << (highest + 1)) - 1  # Colors 1 .. highest + 1
+        stack.append([v, untried, 0, None, highest])
+        remaining -= 1
+
+        # Find the next workable color for the top frame, backtracking while none is left
+        while stack:
+            frame = stack[-1]
+            v, untried, bit, changed, highest = frame
+            if bit:
+                unassign(v, bit, changed)
+            while untried:
+                bit = untried & -untried  # Lowest remaining color
+                untried ^= bit
+                nodes += 1
+                changed, ok = assign(v, bit)
+                if ok:
+                    break
+                unassign(v, bit, changed)
+            else:
+                stack.pop()  # No color works: backtrack
+                backtracks += 1
+                remaining += 1
+                continue
+            frame[1:4] = [untried, bit, changed]
+            highest = max(highest, bit.bit_length())
+            break
+        else:
+            if stats is not None:
+                stats["nodes"] = nodes
+                stats["backtracks"] = backtracks
+            return None
+
+    if stats is not None:
+        stats["nodes"] = nodes
+        stats["backtracks"] = backtracks
+    return colors
+
+def greedy_dsatur_coloring(graph):
+    """
+    Colors the graph greedily in DSATUR order, without backtracking.
+
+    Returns a valid coloring quickly; the number of colors it uses is an upper bound on
+    the chromatic number.
+
+    Args:
+        graph (dict): An adjacency list representation of the graph.
+
+    Returns:
+        dict: A dictionary where keys are vertices and values are their colors (from 1).
+    """
+    vertices, neighbors = _index_graph(graph)
+    colors = [0] * len(vertices)
+    neighbor_colors = [set() for _ in vertices]
+    uncolored = set(range(len(vertices)))
+    while uncolored:
+        v = max(uncolored, key=lambda u: (len(neighbor_colors[u]), len(neighbors[u]), -u))
+        color = 1
+        while color in neighbor_colors[v]:
+            color += 1
+        colors[v] = color
+        uncolored.remove(v)
+        for u in neighbors[v]:
+            neighbor_colors[u].add(color)
+    return {vertex: colors[i] for i, vertex in enumerate(vertices)}
+
+
+def greedy_clique(graph):
+    """
+    Finds a large clique with a greedy heuristic.
+
+    Starting from each vertex, the clique is grown by repeatedly adding the candidate
+    with the most neighbors among the remaining candidates. Every vertex of a clique
+    needs its own color, so its size is a lower bound on the chromatic number.
+
+    Args:
+        graph (dict): An adjacency list representation of the graph.
+
+    Returns:
+        list: The vertices of the largest clique found.
+    """
+    vertices, neighbors = _index_graph(graph)
+    best = []
+    for start in sorted(range(len(vertices)), key=lambda v: -len(neighbors[v])):
+        if len(neighbors[start]) < len(best):
+            break  # Cannot be part of a larger clique
+        clique = [start]
+        candidates = set(neighbors[start])
+        while candidates:
+            v = max(candidates, key=lambda u: (len(neighbors[u] & candidates), -u))
+            clique.append(v)
+            candidates &= neighbors[v]
+        if len(clique) > len(best):
+            best = clique
+    return [vertices[v] for v in best]
+
+
+def chromatic_number(graph, time_limit=None):
+    """
+    Finds the minimum number of colors with branch and bound.
+
+    The greedy DSATUR coloring gives the first upper bound and a greedy clique the lower
+    bound; the clique is pre-colored 1..L, which loses nothing since colors can be
+    permuted. A single DSATUR search tree then looks for colorings with fewer colors
+    than the best so far: every time it finds one, the bound is tightened and the same
+    search carries on, instead of restarting from zero for the next k. A branch is cut
+    as soon as it would need as many colors as the best coloring, and a new color is
+    only opened as the next unused index (1, 2, ... in order), which skips colorings
+    that differ only by renaming colors.
+
+    Args:
+        graph (dict): An adjacency list representation of the graph where keys are
+                      vertices and values are lists of their neighbors.
+        time_limit (float, optional): Stop after this many seconds and return the best
+                                      coloring found so far.
+
+    Returns:
+        dict: With keys
+            "coloring": the best coloring found ({vertex: color from 1}),
+            "num_colors": the number of colors it uses (upper bound),
+            "lower_bound": the best proven lower bound,
+            "optimal": True if num_colors == lower_bound, i.e. it is the chromatic number,
+            "bounds": a list of (seconds, lower bound, upper bound) each time a bound improved,
+            "nodes": the number of color assignments tried,
+            "backtracks": the number of times a vertex ran out of colors.
+    """
+    began = time.perf_counter()
+    deadline = None if time_limit is None else began + time_limit
+    vertices, neighbors = _index_graph(graph)
+    num_vertices = len(vertices)
+    degree = [len(adjacent) for adjacent in neighbors]
+
+    best_coloring = greedy_dsatur_coloring(graph)
+    best = max(best_coloring.values(), default=0)
+    clique = [vertices.index(vertex) for vertex in greedy_clique(graph)] if num_vertices else []
+    lower = len(clique)
+    bounds = [(time.perf_counter() - began, lower, best)]
+
+    def result(nodes, lower):
+        return {"coloring": best_coloring, "num_colors": best, "lower_bound": lower,
+                "optimal": best == lower, "bounds": bounds, "nodes": nodes, "backtracks": backtracks}
+
+    backtracks = 0
+    if best <= lower:
+        return result(0, lower)
+
+    # neighbor_counts[v][c] = number of neighbors of v with color c; saturation[v] is how
+    # many distinct colors appear among v's neighbors
+    colors = [0] * num_vertices
+    neighbor_counts = [[0] * (best + 1) for _ in range(num_vertices)]
+    saturation = [0] * num_vertices
+
+    def assign(v, color):
+        colors[v] = color
+        for u in neighbors[v]:
+            if not neighbor_counts[u][color]:
+                saturation[u] += 1
+            neighbor_counts[u][color] += 1
+
+    def unassign(v):
+        color = colors[v]
+        colors[v] = 0
+        for u in neighbors[v]:
+            neighbor_counts[u][color] -= 1
+            if not neighbor_counts[u][color]:
+                saturation[u] -= 1
+
+    for color, v in enumerate(clique, 1):
+        assign(v, color)
+    max_color = lower
+    remaining = num_vertices - lower
+
+    def try_next(frame):
+        """Gives the frame's vertex its next allowed color; False when none is left."""
+        nonlocal max_color
+        v, color, max_before = frame
+        if colors[v]:
+            unassign(v)
+        max_color = max_before
+        if max_before >= best:
+            return False  # The colors above already match the best coloring
+        # Colors up to one past those in use, and fewer than the best coloring found
+        limit = min(max_before + 1, best - 1)
+        while color <= limit:
+            if not neighbor_counts[v][color]:
+                assign(v, color)
+                max_color = max(max_before, color)
+                frame[1] = color + 1
+                return True
+            color += 1
+        return False
+
+    nodes = 0
+    stack = []  # Frames: [vertex, next color to try, max color used before this vertex]
+    while True:
+        if remaining == 0:
+            # Found a coloring with fewer colors: tighten the bound and keep searching
+            best = max_color
+            best_coloring = {vertex: colors[i] for i, vertex in enumerate(vertices)}
+            bounds.append((time.perf_counter() - began, lower, best))
+            if best <= lower:
+                return result(nodes, lower)
+        else:
+            v = max((u for u in range(num_vertices) if not colors[u]),
+                    key=lambda u: (saturation[u], degree[u]))
+            stack.append([v, 1, max_color])
+            remaining -= 1
+
+        while stack:
+            nodes += 1
+            if deadline is not None and nodes % 1024 == 0 and time.perf_counter() > deadline:
+                return result(nodes, lower)
+            if try_next(stack[-1]):
+                break
+            stack.pop()  # No color left for this vertex: backtrack
+            backtracks += 1
+            remaining += 1
+        else:
+            # The whole tree is exhausted, so no coloring beats the best one
+            lower = best
+            bounds.append((time.perf_counter() - began, lower, best))
+            return result(nodes, lower)
+
+def _split_tree(neighbors, num_colors, depth=None, target=1):
+    """
+    Expands the DSATUR search tree level by level and returns its open branches.
+
+    The expansion stops after depth levels or, without a depth, once there are at least
+    target branches. Each branch is a list of (vertex, color) pairs for the first
+    vertices in DSATUR order. Branches that already leave some vertex without a color are dropped, and a
+    vertex may only open the next unused color index, so branches that differ only by
+    renaming colors are generated once. Together the branches cover every coloring up
+    to such renaming.
+    """
+    num_vertices = len(neighbors)
+    degree = [len(adjacent) for adjacent in neighbors]
+    branches = [[]]
+    for level in range(num_vertices):
+        if level == depth or (depth is None and len(branches) >= target):
+            break
+        expanded = []
+        for branch in branches:
+            colors = dict(branch)
+            used = [set() for _ in range(num_vertices)]
+            for v, color in branch:
+                for u in neighbors[v]:
+                    used[u].add(color)
+            v = max((u for u in range(num_vertices) if u not in colors),
+                    key=lambda u: (len(used[u]), degree[u], -u))
+            highest = max(colors.values(), default=0)
+            for color in range(1, min(highest + 1, num_colors) + 1):
+                if color in used[v]:
+                    continue
+                # Forward check: every uncolored neighbor must keep some color
+                if all(u in colors or color in used[u] or len(used[u]) < num_colors - 1
+                       for u in neighbors[v]):
+                    expanded.append(branch + [(v, color)])
+        branches = expanded
+    return branches
+
+
+def _vertex_ranks(neighbors, strategy, seed):
+    """
+    Returns the DSATUR tie-break rank of each vertex for a portfolio strategy.
+
+    "dsatur" breaks ties by highest degree, "smallest-last" by the reverse of the
+    smallest-last (degeneracy) elimination order, and "random" by a seeded shuffle.
+    """
+    num_vertices = len(neighbors)
+    if strategy == "dsatur":
+        return [-len(adjacent) for adjacent in neighbors]
+    if strategy == "random":
+        rank = list(range(num_vertices))
+        random.Random(seed).shuffle(rank)
+        return rank
+    if strategy == "smallest-last":
+        degree = [len(adjacent) for adjacent in neighbors]
+        removed = [False] * num_vertices
+        rank = [0] * num_vertices
+        for position in range(num_vertices - 1, -1, -1):
+            v = min((u for u in range(num_vertices) if not removed[u]), key=lambda u: degree[u])
+            removed[v] = True
+            rank[v] = position
+            for u in neighbors[v]:
+                degree[u] -= 1
+        return rank
+    raise ValueError(f"unknown strategy {strategy!r}, expected 'dsatur', 'smallest-last' or 'random'")
+
+
+def _coloring_worker_init(neighbors, num_colors):
+    """Stores the indexed graph once per parallel_graph_coloring worker."""
+    global _worker_neighbors, _worker_num_colors
+    _worker_neighbors = neighbors
+    _worker_num_colors = num_colors
+
+
+def _coloring_worker_solve(task):
+    """Runs one subproblem (fixed colors, tie-break ranks) in a worker; returns (colors, stats)."""
+    fixed, rank = task
+    stats = {}
+    colors = _dsatur_search(_worker_neighbors, _worker_num_colors, fixed, rank, True, stats)
+    return colors, stats
+
+
+def parallel_graph_coloring(graph, num_colors, processes=None, split_depth=None, portfolio=None,
+                            seed=0, stats=None):
+    """
+    Solves the graph coloring problem with forward-checking DSATUR on several processes.
+
+    By default the search tree is split: its first split_depth levels are expanded here
+    into independent subproblems (see _split_tree), and a pool of workers searches them.
+    With portfolio, every worker instead searches the whole graph with a different
+    vertex ordering, since one ordering is often much faster than another on a given
+    instance. Either way the pool is terminated as soon as one worker finds a coloring
+    (or, in a portfolio, proves there is none).
+
+    Args:
+        graph (dict): An adjacency list representation of the graph where keys are
+                      vertices and values are lists of their neighbors.
+        num_colors (int): The maximum number of colors allowed.
+        processes (int, optional): The number of worker processes (default: CPU count).
+        split_depth (int, optional): How many vertices to fix per subproblem (default:
+                                     deep enough for at least 8 subproblems per process).
+        portfolio (list of str, optional): Orderings to race, each one of "dsatur",
+                                           "smallest-last" or "random" (one process each;
+                                           repeated "random" entries get different seeds).
+        seed (int): Seed for the "random" orderings.
+        stats (dict, optional): Receives "tasks", the number of subproblems, and "nodes"
+                                and "backtracks" (see graph_coloring_dsatur) summed over
+                                the tasks that finished.
+
+    Returns:
+        dict or None: A dictionary where keys are vertices and values are their assigned
+                      colors (integers from 1 to num_colors), or None if no valid
+                      coloring is found.
+    """
+    vertices, neighbors = _index_graph(graph)
+    processes = processes or os.cpu_count() or 1
+
+    if portfolio is not None:
+        if not portfolio:
+            raise ValueError("portfolio needs at least one strategy")
+        tasks = [((), _vertex_ranks(neighbors, strategy, seed + i)) for i, strategy in enumerate(portfolio)]
+        processes = len(tasks)
+    else:
+        tasks = [(branch, None) for branch in _split_tree(neighbors, num_colors, split_depth, 8 * processes)]
+
+    colors = None
+    nodes = backtracks = 0
+    if tasks:
+        with multiprocessing.Pool(min(processes, len(tasks)), _coloring_worker_init,
+                                  (neighbors, num_colors)) as pool:
+            for result, task_stats in pool.imap_unordered(_coloring_worker_solve, tasks):
+                nodes += task_stats["nodes"]
+                backtracks += task_stats["backtracks"]
+                if result is not None or portfolio is not None:
+                    colors = result
+                    break
+        # Leaving the with block terminates the workers still searching
+
+    if stats is not None:
+        stats["tasks"] = len(tasks)
+        stats["nodes"] = nodes
+        stats["backtracks"] = backtracks
+    if colors is None:
+        return None
+    return {vertex: colors[i] for i, vertex in enumerate(vertices)}
+
+def _reduce_graph(neighbors, num_colors):
+    """
+    Shrinks a k-coloring instance (k = num_colors) with two safe reductions.
+
+    Peeling: a vertex with fewer than k neighbors can always be colored last, since
+    some color is left whatever its neighbors take. Merging: if u and v are not adjacent
+    and every neighbor of u is a neighbor of v, u can simply copy v's color. Both are
+    applied until neither fires, each removal possibly enabling more.
+
+    Args:
+        neighbors (list of sets): Neighbor indices of each vertex, from _index_graph.
+        num_colors (int): The number of colors allowed.
+
+    Returns:
+        tuple: (kept, removed), where kept is the set of vertices left to search and
+               removed lists (vertex, copied vertex or None if peeled) in removal order.
+    """
+    residual = [set(adjacent) for adjacent in neighbors]
+    kept = set(range(len(neighbors)))
+    removed = []
+    pending = list(kept)
+
+    def remove(u, target):
+        kept.discard(u)
+        removed.append((u, target))
+        for w in residual[u]:
+            residual[w].discard(u)
+            pending.append(w)  # Its degree dropped
+            pending.extend(residual[w])  # It no longer blocks dominations through u
+        residual[u] = set()
+
+    while pending:
+        u = pending.pop()
+        if u not in kept:
+            continue
+        if len(residual[u]) < num_colors:
+            remove(u, None)
+            continue
+        # Any vertex dominating u shares u's lowest-degree neighbor
+        pivot = min(residual[u], key=lambda w: len(residual[w]), default=None)
+        if pivot is None:
+            continue
+        for v in residual[pivot]:
+            if v != u and v not in residual[u] and residual[u] <= residual[v]:
+                remove(u, v)
+                break
+    return kept, removed
+
+
+def _components(neighbors, vertices):
+    """Splits the given vertex set into connected components (lists of vertices)."""
+    unseen = set(vertices)
+    components = []
+    while unseen:
+        root = unseen.pop()
+        component = [root]
+        stack = [root]
+        while stack:
+            for u in neighbors[stack.pop()]:
+                if u in unseen:
+                    unseen.remove(u)
+                    component.append(u)
+                    stack.append(u)
+        components.append(component)
+    return components
+
+
+def graph_coloring_preprocessed(graph, num_colors, stats=None):
+    """
+    Solves the graph coloring problem after shrinking and splitting the graph.
+
+    Vertices with fewer than num_colors neighbors are peeled off and dominated vertices
+    merged into the vertex they can copy (see _reduce_graph). What is left is split into
+    connected components, each searched on its own with forward-checking DSATUR and
+    color symmetry breaking, so a hard component never multiplies the work of the
+    others. The removed vertices are then put back in reverse order.
+
+    Args:
+        graph (dict): An adjacency list representation of the graph where keys are
+                      vertices and values are lists of their neighbors.
+        num_colors (int): The maximum number of colors allowed.
+        stats (dict, optional): Receives "peeled" and "merged" (vertices removed by each
+                                reduction), "components" (the number searched) and
+                                "nodes" and "backtracks" (see graph_coloring_dsatur)
+                                summed over all components.
+
+    Returns:
+        dict or None: A dictionary where keys are vertices and values are their assigned
+                      colors (integers from 1 to num_colors), or None if no valid
+                      coloring is found.
+    """
+    vertices, neighbors = _index_graph(graph)
+    kept, removed = _reduce_graph(neighbors, num_colors)
+    components = _components(neighbors, kept)
+    if stats is not None:
+        stats["peeled"] = sum(1 for _, target in removed if target is None)
+        stats["merged"] = len(removed) - stats["peeled"]
+        stats["components"] = len(components)
+        stats["nodes"] = stats["backtracks"] = 0
+
+    colors = [0] * len(vertices)
+    for component in components:
+        position = {v: i for i, v in enumerate(component)}
+        local = [{position[u] for u in neighbors[v] if u in position} for v in component]
+        # Ties go by degree in the whole graph, as in graph_coloring_dsatur
+        rank = [-len(neighbors[v]) for v in component]
+        component_stats = {}
+        result = _dsatur_search(local, num_colors, rank=rank, symmetry=True, stats=component_stats)
+        if stats is not None:
+            stats["nodes"] += component_stats["nodes"]
+            stats["backtracks"] += component_stats["backtracks"]
+        if result is None:
+            return None
+        for v, color in zip(component, result):
+            colors[v] = color
+
+    # Put removed vertices back, last removed first
+    for u, target in reversed(removed):
+        if target is not None:
+            colors[u] = colors[target]
+        else:
+            taken = {colors[w] for w in neighbors[u]}
+            colors[u] = next(color for color in range(1, num_colors + 1) if color not in taken)
+    return {vertex: colors[i] for i, vertex in enumerate(vertices)}
+
+
+def main():
+    """
+    Colors a small example graph with three colors.
+    """
+    # Example Graph (Adjacency List)
+    graph = {
+        'A': ['B', 'C'],
+        'B': ['A', 'C', 'D'],
+        'C': ['A', 'B', 'D', 'E'],
+        'D': ['B', 'C', 'E'],
+        'E': ['C', 'D']
+    }
+    num_colors_available = 3
+
+    coloring_result = graph_coloring_branch_and_bound(graph, num_colors_available)
+
+    if coloring_result:
+        print(f"Valid coloring found using {num_colors_available} colors:")
+        for vertex, color in coloring_result.items():
+            print(f"Vertex {vertex}: Color {color}")
+    else:
+        print(f"No valid coloring found using {num_colors_available} colors.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,15 @@
+import heapq
+import os
+import pickle
+import tempfile
+from bisect import bisect_right
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; it speeds up the sorting and binary searches
+    np = None
+
 def greedy_activity_selection(activities):
     """
     Implements a greedy approach to solve the Activity Selection Problem.
@@ -12,6 +24,8 @@ def greedy_activity_selection(activities):
 
     # 1. Sort the activities based on their finish times in non-decreasing order.
     sorted_activities = sorted(activities, key=lambda x: x[1])
+    if not sorted_activities:
+        return []
 
     # 2. Select the first activity (it has the earliest finish time).
     selected_activities = [sorted_activities[0]]
@@ -27,10 +41,237 @@ def greedy_activity_selection(activities):
 
     return selected_activities
 
-# Example Activities (start_time, finish_time)
-activities = [(1, 4), (3, 5), (0, 6), (5, 7), (3, 9), (5, 9), (6, 10), (8, 11), (8, 12), (2, 14), (12, 16)]
 
-selected_activities = greedy_activity_selection(activities)
+def _sort_by(keys, ties, values):
+    """Returns the stable order that sorts by keys then ties, and each of values reordered by it."""
+    if np is not None:
+        order = np.lexsort((ties, keys))
+        return order, [np.asarray(value)[order] for value in values]
+    order = sorted(range(len(keys)), key=lambda i: (keys[i], ties[i]))
+    return order, [[value[i] for i in order] for value in values]
+
+
+def weighted_interval_scheduling(starts, finishes, weights=None):
+    """
+    Selects non-overlapping intervals with the largest total weight.
+
+    Intervals are sorted by finish time (then start time) once; a binary search over the sorted finish
+    times then gives, for each interval, how many earlier intervals end by its start.
+    The dynamic program best[j + 1] = max(best[j], weight[j] + best[compatible[j]])
+    then runs in one linear pass, for O(n log n) overall. As in greedy_activity_selection,
+    an interval may start exactly when the previous one finishes.
+
+    Args:
+        starts (array-like): Start time of each interval (a NumPy array or a sequence).
+        finishes (array-like): Finish time of each interval.
+        weights (array-like, optional): Weight of each interval (default: 1 each, which
+                                        maximizes the number of intervals selected).
+
+    Returns:
+        tuple: (total weight, indices of the selected intervals in finish time order);
+               the indices are a NumPy array when NumPy is installed.
+    """
+    n = len(starts)
+    if len(finishes) != n or (weights is not None and len(weights) != n):
+        raise ValueError("starts, finishes and weights must have the same length")
+    if weights is None:
+        weights = np.ones(n, dtype=np.int64) if np is not None else [1] * n
+
+    # Zero-length intervals sort after the others finishing at the same time, which
+    # they are compatible with
+    order, (sorted_starts, sorted_finishes, sorted_weights) = _sort_by(finishes, starts, (starts, finishes, weights))
+    if np is not None:
+        compatible = np.searchsorted(sorted_finishes, sorted_starts, side="right")
+        # A zero-length interval must not count itself as compatible
+        compatible = np.minimum(compatible, np.arange(n)).tolist()
+        sorted_weights = sorted_weights.tolist()
+    else:
+        compatible = [min(bisect_right(sorted_finishes, start), j) for j, start in enumerate(sorted_starts)]
+
+    best = [0] * (n + 1)
+    for j in range(n):
+        take = sorted_weights[j] + best[compatible[j]]
+        best[j + 1] = take if take > best[j] else best[j]
+
+    # Walk back through the table to recover the chosen intervals
+    chosen = []
+    j = n
+    while j > 0:
+        if sorted_weights[j - 1] + best[compatible[j - 1]] >= best[j - 1]:
+            chosen.append(j - 1)
+            j = compatible[j - 1]
+        else:
+            j -= 1
+    chosen.reverse()
+    if np is not None:
+        return best[n], order[np.array(chosen, dtype=np.int64)]
+    return best[n], [order[j] for j in chosen]
+
+
+def interval_partitioning(starts, finishes):
+    """
+    Assigns intervals to the minimum number of resources (rooms, machines) without overlap.
+
+    Intervals are taken in order of start time. A heap holds the finish time of the
+    interval each resource is busy with; an interval reuses the resource that frees up
+    first if it is already free, and opens a new resource otherwise. The number of
+    resources opened equals the largest number of intervals that overlap at any time,
+    which no assignment can beat.
+
+    Args:
+        starts (array-like): Start time of each interval (a NumPy array or a sequence).
+        finishes (array-like): Finish time of each interval.
+
+    Returns:
+        tuple: (number of resources, resource index from 0 for each interval); the
+               assignment is a NumPy array when NumPy is installed.
+    """
+    n = len(starts)
+    if len(finishes) != n:
+        raise ValueError("starts and finishes must have the same length")
+
+    order, (sorted_starts, sorted_finishes) = _sort_by(starts, finishes, (starts, finishes))
+    if np is not None:
+        order = order.tolist()
+        sorted_starts = sorted_starts.tolist()
+        sorted_finishes = sorted_finishes.tolist()
+
+    assignment = [0] * n
+    busy = []  # (finish time, resource) for every resource
+    resources = 0
+    for i, start, finish in zip(order, sorted_starts, sorted_finishes):
+        if busy and busy[0][0] <= start:
+            resource = busy[0][1]
+            heapq.heapreplace(busy, (finish, resource))
+        else:
+            resource = resources
+            resources += 1
+            heapq.heappush(busy, (finish, resource))
+        assignment[i] = resource
+    if np is not None:
+        return resources, np.array(assignment, dtype=np.int64)
+    return resources, assignment
+
+def iter_activity_selection(sorted_activities):
+    """
+    Yields the activities greedy_activity_selection selects, one at a time.
+
+    The input must already be sorted by finish time and may be any iterable, including
+    an unbounded stream; only the last selected finish time is kept, so memory use is
+    constant.
+
+    Args:
+        sorted_activities (iterable of tuples): (start_time, finish_time) activities in
+                                                non-decreasing order of finish time.
+
+    Yields:
+        tuple: Each selected activity, as soon as it is known to be selected.
+
+    Raises:
+        ValueError: If an activity finishes earlier than the one before it.
+    """
+    last_finish_time = None
+    previous_finish_time = None
+    for start_time, finish_time in sorted_activities:
+        if previous_finish_time is not None and finish_time < previous_finish_time:
+            raise ValueError("activities are not sorted by finish time; use external_activity_selection")
+        previous_finish_time = finish_time
+        if last_finish_time is None or start_time >= last_finish_time:
+            last_finish_time = finish_time
+            yield start_time, finish_time
+
+
+def _spill_run(run, directory, number):
+    """Writes one sorted run to a file in blocks of pickled activities; returns its path."""
+    path = os.path.join(directory, f"run{number}.pickle")
+    with open(path, "wb") as handle:
+        for begin in range(0, len(run), 4096):
+            pickle.dump(run[begin:begin + 4096], handle, pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    """Yields the activities of one spilled run, a block at a time."""
+    with open(path, "rb") as handle:
+        while True:
+            try:
+                block = pickle.load(handle)
+            except EOFError:
+                return
+            yield from block
+
+
+def external_activity_selection(activities, run_size=1 << 20, directory=None):
+    """
+    Yields the activities greedy_activity_selection selects, for input of any size.
+
+    The activities are read run_size at a time; each run is sorted by finish time and
+    spilled to a temporary file, and the runs are then merged lazily and fed to
+    iter_activity_selection. Only one run is in memory while reading and one block per
+    run while merging. The sort within a run and the merge are both stable, so ties
+    are broken exactly as sorted() in greedy_activity_selection does.
+
+    Args:
+        activities (iterable of tuples): (start_time, finish_time) activities in any order.
+        run_size (int): How many activities to sort in memory at a time.
+        directory (str, optional): Where to create the temporary run files (default:
+                                   the system temporary directory).
+
+    Yields:
+        tuple: The selected non-overlapping activities in order of finish time.
+    """
+    activities = iter(activities)
+    run = list(islice(activities, run_size))
+    if len(run) < run_size:
+        # Everything fits in one run: no need to touch the disk
+        run.sort(key=lambda x: x[1])
+        yield from iter_activity_selection(run)
+        return
+
+    with tempfile.TemporaryDirectory(dir=directory) as spill_directory:
+        paths = []
+        while run:
+            run.sort(key=lambda x: x[1])
+            paths.append(_spill_run(run, spill_directory, len(paths)))
+            run = list(islice(activities, run_size))
+        merged = heapq.merge(*(_read_run(path) for path in paths), key=lambda x: x[1])
+        yield from iter_activity_selection(merged)
+
+
+def read_activities(path):
+    """
+    Yields (start_time, finish_time) activities from a text file, one per line.
+
+    Each line holds the two times separated by whitespace or a comma; blank lines and
+    lines starting with # are skipped. Times are read as integers when possible and as
+    floats otherwise.
+    """
+    with open(path) as handle:
+        for line in handle:
+            fields = line.replace(",", " ").split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            times = []
+            for field in fields[:2]:
+                try:
+                    times.append(int(field))
+                except ValueError:
+                    times.append(float(field))
+            yield times[0], times[1]
+
+
+def main():
+    """
+    Selects activities from a small example list.
+    """
+    # Example Activities (start_time, finish_time)
+    activities = [(1, 4), (3, 5), (0, 6), (5, 7), (3, 9), (5, 9), (6, 10), (8, 11), (8, 12), (2, 14), (12, 16)]
+
+    selected_activities = greedy_activity_selection(activities)
+
+    print("Given Activities:", activities)
+    print("Selected Non-overlapping Activities (Greedy Approach):", selected_activities)
+
 
-print("Given Activities:", activities)
-print("Selected Non-overlapping Activities (Greedy Approach):", selected_activities)
\ No newline at end of file
+if __name__ == "__main__":
+    main()